@@ -1,4 +1,4 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 
 from algorithms.ai.interfaces.algorithm_config import (
@@ -7,6 +7,7 @@ from algorithms.ai.interfaces.algorithm_config import (
     WeightAlgorithmConfig,
     SocialAlgorithmConfig,
     PriorityAlgorithmConfig,
+    IslandPriorityAlgorithmConfig,
 )
 from algorithms.ai.interfaces.algorithm_options import (
     RandomAlgorithmOptions,
@@ -15,7 +16,11 @@ from algorithms.ai.interfaces.algorithm_options import (
     PriorityAlgorithmOptions,
 )
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.island_priority_algorithm import (
+    IslandPriorityAlgorithm,
+)
 from algorithms.ai.priority_algorithm.priority_algorithm import PriorityAlgorithm
+from algorithms.ai.priority_algorithm.trace import PriorityAlgorithmTrace
 from algorithms.ai.random_algorithm.random_algorithm import RandomAlgorithm
 from algorithms.ai.social_algorithm.social_algorithm import SocialAlgorithm
 from algorithms.ai.weight_algorithm.weight_algorithm import WeightAlgorithm
@@ -37,11 +42,24 @@ class AlgorithmRunner:
         algorithm_config: AlgorithmConfig = None,
     ):
         self.algorithm_cls = AlgorithmRunner.get_algorithm_from_type(algorithm_type)
+        if isinstance(algorithm_config, IslandPriorityAlgorithmConfig):
+            # the island model is a mode of the priority algorithm, chosen through its config
+            self.algorithm_cls = IslandPriorityAlgorithm
         self.team_generation_options = team_generation_options
         self.algorithm_options = algorithm_options
         self.algorithm_config = algorithm_config
 
     def generate(self, students: List[Student]) -> TeamSet:
+        team_set, _ = self.generate_with_trace(students)
+        return team_set
+
+    def generate_with_trace(
+        self, students: List[Student]
+    ) -> Tuple[TeamSet, Optional[PriorityAlgorithmTrace]]:
+        """
+        Same as generate(), also returning the trace of the search when the algorithm keeps one (i.e. the priority
+            algorithm with TRACE set in its config)
+        """
         # the algorithm classes internally track generated teams, so a new instance of the
         #   algorithm class MUST be created to run a new generation without side effects
         algorithm = self.algorithm_cls(
@@ -52,7 +70,8 @@ class AlgorithmRunner:
 
         algorithm.prepare(students)
 
-        return algorithm.generate(students)
+        team_set = algorithm.generate(students)
+        return team_set, getattr(algorithm, "trace", None)
 
     @staticmethod
     def get_algorithm_from_type(algorithm_type: AlgorithmType):
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
 from algorithms.ai.priority_algorithm.mutations.random_swap import RandomSwapMutation
@@ -52,6 +52,7 @@ class SocialAlgorithmConfig(AlgorithmConfig):
 class PriorityAlgorithmStartType(Enum):
     RANDOM = "random"
     WEIGHT = "weight"
+    GREEDY = "greedy"
 
 
 @dataclass
@@ -61,6 +62,18 @@ class PriorityAlgorithmConfig(AlgorithmConfig):
     MAX_ITERATE: int = 1500  # iterations
     MAX_TIME: int = 30  # seconds
     START_TYPE: PriorityAlgorithmStartType = PriorityAlgorithmStartType.WEIGHT
+    # number of processes team sets are mutated and scored on, 1 means everything runs in the calling process
+    NUM_WORKERS: int = 1
+    # stop once the best score has not improved for this many iterations, None to never stop early
+    MAX_STAGNANT_ITERATIONS: Optional[int] = None
+    # stop once every priority is in its top bucket, as the score cannot improve any further
+    STOP_AT_MAX_SCORE: bool = False
+    # after the first iteration, reallocate the MAX_SPREAD team sets between the mutations each iteration based on how
+    #   much they improve the score per second of CPU time (see MutationScheduler). Not supported with NUM_WORKERS > 1
+    ADAPTIVE_MUTATIONS: bool = False
+    # record a PriorityAlgorithmTrace of the search (best score per iteration, and how each mutation performed) in the
+    #   algorithm's trace
+    TRACE: bool = False
 
     """
     Specifies the mutations as a list of [mutation_function, number_team_sets_generated_this_way]
@@ -88,3 +101,75 @@ class PriorityAlgorithmConfig(AlgorithmConfig):
             raise ValueError(
                 "The total number of outputted team sets from specified mutations =/= MAX_SPREAD!"
             )
+        if self.NUM_WORKERS < 1:
+            raise ValueError("NUM_WORKERS must be at least 1")
+        if (
+            self.MAX_STAGNANT_ITERATIONS is not None
+            and self.MAX_STAGNANT_ITERATIONS < 1
+        ):
+            raise ValueError("MAX_STAGNANT_ITERATIONS must be at least 1")
+        if self.ADAPTIVE_MUTATIONS and self.NUM_WORKERS > 1:
+            raise ValueError("ADAPTIVE_MUTATIONS cannot be used with NUM_WORKERS > 1")
+
+
+@dataclass
+class IslandPriorityAlgorithmConfig(PriorityAlgorithmConfig):
+    """
+    Runs NUM_ISLANDS independent priority algorithm beams, each in its own process. Every MIGRATION_INTERVAL
+        iterations, each island sends its NUM_MIGRANTS best team sets to the next island (in a ring), where they
+        replace that island's worst team sets.
+    MAX_ITERATE and MAX_TIME apply to the whole run, not to each island. Islands always run on a single process each,
+        so NUM_WORKERS is not used.
+    """
+
+    NUM_ISLANDS: int = 4
+    MIGRATION_INTERVAL: int = 25  # iterations
+    NUM_MIGRANTS: int = 1  # team sets
+
+    """
+    Optionally specifies a different mix of mutations for each island, in the same format as MUTATIONS.
+    Islands use MUTATIONS when this is not set.
+    """
+    ISLAND_MUTATIONS: List[List[Mutation]] = None
+
+    def validate(self):
+        super().validate()
+        if self.NUM_ISLANDS < 1:
+            raise ValueError("NUM_ISLANDS must be at least 1")
+        if self.MIGRATION_INTERVAL < 1:
+            raise ValueError("MIGRATION_INTERVAL must be at least 1")
+        if not 0 <= self.NUM_MIGRANTS <= self.MAX_KEEP:
+            raise ValueError("NUM_MIGRANTS must be between 0 and MAX_KEEP")
+        if self.ISLAND_MUTATIONS:
+            if len(self.ISLAND_MUTATIONS) != self.NUM_ISLANDS:
+                raise ValueError(
+                    "ISLAND_MUTATIONS must specify the mutations of every island!"
+                )
+            for mutations in self.ISLAND_MUTATIONS:
+                if (
+                    sum([mutation.num_mutations for mutation in mutations])
+                    != self.MAX_SPREAD
+                ):
+                    raise ValueError(
+                        "The total number of outputted team sets from specified mutations =/= MAX_SPREAD!"
+                    )
+
+    def get_island_config(self, island_index: int) -> PriorityAlgorithmConfig:
+        """
+        The config of the priority algorithm run on the given island
+        """
+        island_config = {
+            config_field.name: getattr(self, config_field.name)
+            for config_field in fields(PriorityAlgorithmConfig)
+        }
+        island_config.update(
+            # "default" is reserved and will be set again if the name is not given
+            name=self.name if self.name != "default" else None,
+            NUM_WORKERS=1,
+            MUTATIONS=(
+                self.ISLAND_MUTATIONS[island_index]
+                if self.ISLAND_MUTATIONS
+                else self.MUTATIONS
+            ),
+        )
+        return PriorityAlgorithmConfig(**island_config)
@@ -0,0 +1,177 @@
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.dataclasses.team import TeamShell
+
+if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.custom_dataclasses import (
+        PriorityTeamSet,
+        PriorityTeam,
+    )
+
+UNASSIGNED = -1
+
+
+class PriorityAssignment:
+    """
+    An array-backed alternative to PriorityTeamSet.
+
+    Rather than each team holding a list of student ids, a single vector maps every student (by their index in
+        student_ids) to the index of the team they are on. Moving students around is then a matter of writing to
+        that vector, cloning is a single buffer copy, and the whole assignment is cheap to store and to pickle.
+
+    The team shells and student ids are never modified, so they are shared between clones.
+    Note that the order of students within a team is not preserved, members are always listed in student_ids order.
+    """
+
+    def __init__(
+        self,
+        team_shells: List[TeamShell],
+        student_ids: np.ndarray,
+        team_indices: np.ndarray,
+    ):
+        if len(student_ids) != len(team_indices):
+            raise ValueError(
+                f"Every student must have a team index ({len(student_ids)} students, {len(team_indices)} team indices)"
+            )
+        self.team_shells = team_shells
+        self.student_ids = student_ids
+        self.team_indices = team_indices
+
+        # students of every team laid out contiguously, with the members of team t found at
+        #   _members[_offsets[t]:_offsets[t + 1]]. Calculated lazily and invalidated on every write.
+        self._members: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_priority_team_set(
+        cls,
+        priority_team_set: "PriorityTeamSet",
+        student_ids: Sequence[int] = None,
+    ) -> "PriorityAssignment":
+        """
+        student_ids specifies the order students are indexed in, by default students are indexed in the order they
+            appear in the team set. Students in student_ids that are not on any team are marked as UNASSIGNED.
+        """
+        if student_ids is None:
+            student_ids = [
+                student_id
+                for priority_team in priority_team_set.priority_teams
+                for student_id in priority_team.student_ids_view
+            ]
+        student_ids = np.asarray(student_ids, dtype=np.int64)
+        student_index = {
+            student_id: index for index, student_id in enumerate(student_ids.tolist())
+        }
+
+        team_indices = np.full(len(student_ids), UNASSIGNED, dtype=np.int32)
+        for team_index, priority_team in enumerate(priority_team_set.priority_teams):
+            for student_id in priority_team.student_ids_view:
+                team_indices[student_index[student_id]] = team_index
+
+        return cls(
+            team_shells=[
+                priority_team.team_shell
+                for priority_team in priority_team_set.priority_teams
+            ],
+            student_ids=student_ids,
+            team_indices=team_indices,
+        )
+
+    @classmethod
+    def from_roster(
+        cls, priority_teams: List["PriorityTeam"], roster: CompiledRoster
+    ) -> "PriorityAssignment":
+        """
+        Same as from_priority_team_set(), with students indexed in roster order. Only the given teams are
+            included, every other student in the roster is UNASSIGNED.
+        """
+        team_indices = np.full(len(roster.students), UNASSIGNED, dtype=np.int32)
+        for team_index, priority_team in enumerate(priority_teams):
+            team_indices[roster.indices_of(priority_team.student_ids_view)] = team_index
+
+        return cls(
+            team_shells=[priority_team.team_shell for priority_team in priority_teams],
+            student_ids=roster.student_ids,
+            team_indices=team_indices,
+        )
+
+    def to_priority_team_set(self) -> "PriorityTeamSet":
+        # imported here because custom_dataclasses scores teams using assignments
+        from algorithms.ai.priority_algorithm.custom_dataclasses import (
+            PriorityTeamSet,
+            PriorityTeam,
+        )
+
+        return PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(
+                    team_shell=team_shell,
+                    student_ids=self.team_student_ids(team_index),
+                )
+                for team_index, team_shell in enumerate(self.team_shells)
+            ]
+        )
+
+    @property
+    def num_teams(self) -> int:
+        return len(self.team_shells)
+
+    @property
+    def num_students(self) -> int:
+        return len(self.student_ids)
+
+    def clone(self) -> "PriorityAssignment":
+        return PriorityAssignment(
+            team_shells=self.team_shells,
+            student_ids=self.student_ids,
+            team_indices=self.team_indices.copy(),
+        )
+
+    def team_sizes(self) -> np.ndarray:
+        return np.bincount(
+            self.team_indices[self.team_indices != UNASSIGNED],
+            minlength=self.num_teams,
+        )
+
+    def team_members(self, team_index: int) -> np.ndarray:
+        """
+        Returns the indices (not ids) of the students on the given team
+        """
+        if self._members is None:
+            self._calculate_members()
+        return self._members[self._offsets[team_index] : self._offsets[team_index + 1]]
+
+    def team_student_ids(self, team_index: int) -> List[int]:
+        return self.student_ids[self.team_members(team_index)].tolist()
+
+    def move(self, student_index: int, team_index: int):
+        self.team_indices[student_index] = team_index
+        self._invalidate()
+
+    def swap(self, student_index_a: int, student_index_b: int):
+        self.team_indices[[student_index_a, student_index_b]] = self.team_indices[
+            [student_index_b, student_index_a]
+        ]
+        self._invalidate()
+
+    def _calculate_members(self):
+        assigned = np.flatnonzero(self.team_indices != UNASSIGNED)
+        # a stable sort keeps members of each team in student index order
+        order = np.argsort(self.team_indices[assigned], kind="stable")
+        self._members = assigned[order]
+        self._offsets = np.zeros(self.num_teams + 1, dtype=np.int64)
+        np.cumsum(self.team_sizes(), out=self._offsets[1:])
+
+    def _invalidate(self):
+        self._members = None
+        self._offsets = None
+
+    def __getstate__(self):
+        # the member layout can always be recalculated, so it is not worth sending between processes
+        state = self.__dict__.copy()
+        state["_members"] = None
+        state["_offsets"] = None
+        return state
@@ -1,11 +1,18 @@
-import copy
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
+from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+from algorithms.ai.priority_algorithm.fingerprint import (
+    team_fingerprint,
+    team_shell_key,
+    combine_team_fingerprint,
+)
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
 from algorithms.ai.priority_algorithm.scoring import (
-    get_priority_satisfaction_array,
-    get_multipliers,
+    get_score_from_team_satisfactions,
+    get_team_satisfactions,
+    get_team_satisfactions_by_assignment,
 )
 from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import TeamShell
@@ -17,13 +24,161 @@ Because the priority algorithm deals with mutating teams, deep-cloning team sets
     classes enable a more lightweight representation of the data actually needed by the priority algorithm
 """
 
+# Scoring stale teams together only pays off once enough of them need to be scored
+BULK_SCORING_MIN_TEAMS = 8
 
-@dataclass
+
+@dataclass(init=False, eq=False, repr=False)
 class PriorityTeam:
     # just a reference to the team so team requirements can be found easily without duplicating them
     team_shell: TeamShell
     student_ids: List[int]
 
+    def __init__(self, team_shell: TeamShell, student_ids: List[int]):
+        self.team_shell = team_shell
+        self._student_ids = student_ids
+        # Clones share their student id list with the team they were cloned from until one of them accesses
+        #   student_ids to modify it, at which point that team takes its own copy of the list (copy-on-write).
+        #   Reading student_ids_view never copies the list.
+        self._owns_student_ids = True
+        self._student_ids_view: Optional[Tuple[int, ...]] = None
+
+        # Cached satisfaction of this team for each priority. The cache is only valid while the team still has the
+        #   students (and is scored against the same priorities and students) that it was computed for.
+        self._satisfactions: Optional[List[float]] = None
+        self._scored_student_ids: Optional[Tuple[int, ...]] = None
+        self._scored_priorities: Optional[Tuple[Priority, ...]] = None
+        self._scored_student_dict: Optional[Dict[int, Student]] = None
+
+        # Cached fingerprint of the students on this team (see fingerprint.py). Because the list of student ids may be
+        #   modified in place by whoever it is handed out to, the fingerprint is forgotten whenever that happens.
+        self._fingerprint: Optional[int] = None
+        self._shell_key: Optional[int] = None
+
+    @property
+    def student_ids(self) -> List[int]:
+        """
+        The team's student ids, to be modified in place. Use student_ids_view to only read them.
+
+        The returned list must only be modified before anything else is read from or done with the team: the view,
+            fingerprint and satisfactions of the team are found from the list the next time they are read, and clones
+            share it, so modifying a list that was kept from earlier leaves them out of date without any error.
+            Access student_ids again each time the students are to be modified instead.
+        """
+        # the returned list may be modified in place, so a shared list must be copied before it is handed out
+        if not self._owns_student_ids:
+            self._student_ids = list(self._student_ids)
+            self._owns_student_ids = True
+        self._fingerprint = None
+        self._student_ids_view = None
+        return self._student_ids
+
+    @student_ids.setter
+    def student_ids(self, student_ids: List[int]):
+        self._student_ids = student_ids
+        self._owns_student_ids = True
+        self._fingerprint = None
+        self._student_ids_view = None
+
+    @property
+    def student_ids_view(self) -> Tuple[int, ...]:
+        """
+        The team's student ids, which can't be modified, without copying a list shared with clones of the team
+        """
+        if self._student_ids_view is None:
+            self._student_ids_view = tuple(self._student_ids)
+        return self._student_ids_view
+
+    def __repr__(self) -> str:
+        # student_ids isn't used, since accessing it would stop the list being shared with clones
+        return f"PriorityTeam(team_shell={self.team_shell!r}, student_ids={list(self.student_ids_view)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PriorityTeam):
+            return NotImplemented
+        return (
+            self.team_shell == other.team_shell
+            and self._student_ids == other._student_ids
+        )
+
+    @property
+    def fingerprint(self) -> int:
+        if self._fingerprint is None:
+            self._fingerprint = team_fingerprint(self.student_ids_view)
+        return self._fingerprint
+
+    @property
+    def shell_key(self) -> int:
+        if self._shell_key is None:
+            self._shell_key = team_shell_key(self.team_shell)
+        return self._shell_key
+
+    def clone(self) -> "PriorityTeam":
+        # team shells are never modified by the priority algorithm, so they are shared rather than copied
+        cloned_priority_team = PriorityTeam(
+            team_shell=self.team_shell,
+            student_ids=self._student_ids,
+        )
+        cloned_priority_team._owns_student_ids = False
+        self._owns_student_ids = False
+
+        # the cached satisfactions are never modified in place, so they can be shared with the clone
+        cloned_priority_team._satisfactions = self._satisfactions
+        cloned_priority_team._scored_student_ids = self._scored_student_ids
+        cloned_priority_team._scored_priorities = self._scored_priorities
+        cloned_priority_team._scored_student_dict = self._scored_student_dict
+        cloned_priority_team._fingerprint = self._fingerprint
+        cloned_priority_team._student_ids_view = self._student_ids_view
+        cloned_priority_team._shell_key = self._shell_key
+        return cloned_priority_team
+
+    def get_satisfactions(
+        self, priorities: List[Priority], student_dict: Dict[int, Student]
+    ) -> List[float]:
+        """
+        Returns this team's satisfaction of each priority, only rescoring the team if it has changed since it was
+        last scored.
+        """
+        if not self.has_current_satisfactions(priorities, student_dict):
+            self.set_satisfactions(
+                get_team_satisfactions(
+                    self.student_ids_view, self.team_shell, priorities, student_dict
+                ),
+                priorities,
+                student_dict,
+            )
+
+        return self._satisfactions
+
+    @property
+    def satisfactions(self) -> Optional[List[float]]:
+        """
+        The satisfactions of this team when it was last scored, which may be out of date.
+        Use get_satisfactions() to make sure they are up to date.
+        """
+        return self._satisfactions
+
+    def has_current_satisfactions(
+        self, priorities: List[Priority], student_dict: Dict[int, Student]
+    ) -> bool:
+        return (
+            self._satisfactions is not None
+            and self._scored_student_dict is student_dict
+            and self._scored_student_ids == self.student_ids_view
+            and self._scored_priorities == tuple(priorities)
+        )
+
+    def set_satisfactions(
+        self,
+        satisfactions: List[float],
+        priorities: List[Priority],
+        student_dict: Dict[int, Student],
+    ):
+        self._satisfactions = satisfactions
+        self._scored_student_ids = self.student_ids_view
+        self._scored_priorities = tuple(priorities)
+        self._scored_student_dict = student_dict
+
 
 @dataclass
 class PriorityTeamSet:
@@ -33,27 +188,88 @@ class PriorityTeamSet:
         self.score = None  # not calculated yet
 
     def clone(self):
-        # TODO: keep an eye on this copying properly
-        cloned_priority_teams = copy.deepcopy(self.priority_teams)
+        cloned_priority_teams = [
+            priority_team.clone() for priority_team in self.priority_teams
+        ]
         return PriorityTeamSet(priority_teams=cloned_priority_teams)
 
+    def fingerprint(self) -> int:
+        """
+        Team sets that assign students to teams the same way have the same fingerprint (see fingerprint.py)
+        """
+        fingerprint = 0
+        for priority_team in self.priority_teams:
+            fingerprint ^= combine_team_fingerprint(
+                priority_team.fingerprint, priority_team.shell_key
+            )
+        return fingerprint
+
     def calculate_score(
         self, priorities: List[Priority], student_dict: Dict[int, Student]
     ) -> float:
         if self.score:
             return self.score
 
-        priority_satisfaction_array = get_priority_satisfaction_array(
-            self.priority_teams, priorities, student_dict
-        )
-        multipliers = get_multipliers(priorities)
-        score = sum(
-            [
-                satisfaction * multiplier
-                for satisfaction, multiplier in zip(
-                    priority_satisfaction_array, multipliers
-                )
+        # only teams that changed since they were last scored are rescored here
+        if isinstance(student_dict, CompiledRoster):
+            team_satisfactions = self._get_team_satisfactions_from_roster(
+                priorities, student_dict
+            )
+        else:
+            team_satisfactions = [
+                priority_team.get_satisfactions(priorities, student_dict)
+                for priority_team in self.priority_teams
             ]
-        )
-        self.score = score
+        self.score = get_score_from_team_satisfactions(team_satisfactions, priorities)
         return self.score
+
+    def _get_team_satisfactions_from_roster(
+        self, priorities: List[Priority], roster: CompiledRoster
+    ) -> List[List[float]]:
+        """
+        Same as calling get_satisfactions() on every team, except that teams which have changed since they were last
+            scored are looked up in the roster's memo first. When many of them are not found (e.g. in a freshly
+            generated team set, or after a mutation that touches every team), they are all scored in one pass over
+            the roster rather than one team at a time.
+        """
+        memo = roster.satisfaction_memo(priorities)
+        unscored_teams = []
+        for priority_team in self.priority_teams:
+            if priority_team.has_current_satisfactions(priorities, roster):
+                continue
+            satisfactions = memo.get(
+                priority_team.team_shell,
+                priority_team.student_ids_view,
+                priority_team.fingerprint,
+            )
+            if satisfactions is not None:
+                priority_team.set_satisfactions(satisfactions, priorities, roster)
+            else:
+                unscored_teams.append(priority_team)
+
+        if len(unscored_teams) >= BULK_SCORING_MIN_TEAMS:
+            assignment = PriorityAssignment.from_roster(unscored_teams, roster)
+            satisfactions = get_team_satisfactions_by_assignment(
+                assignment, priorities, roster
+            ).tolist()
+            for priority_team, team_satisfactions in zip(unscored_teams, satisfactions):
+                memo.put(
+                    priority_team.team_shell,
+                    priority_team.student_ids_view,
+                    team_satisfactions,
+                    priority_team.fingerprint,
+                )
+        else:
+            satisfactions = [
+                get_team_satisfactions(
+                    priority_team.student_ids_view,
+                    priority_team.team_shell,
+                    priorities,
+                    roster,
+                )
+                for priority_team in unscored_teams
+            ]
+        for priority_team, team_satisfactions in zip(unscored_teams, satisfactions):
+            priority_team.set_satisfactions(team_satisfactions, priorities, roster)
+
+        return [priority_team.satisfactions for priority_team in self.priority_teams]
@@ -0,0 +1,17 @@
+import math
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """
+    The time (as given by time.time()) by which the priority algorithm has to return.
+    It is passed to mutations so that those which search through many possibilities (e.g. local max) can stop
+        partway and use the best possibility found so far, instead of finishing the search after the time is up.
+    """
+
+    end_time: float = math.inf
+
+    def has_passed(self) -> bool:
+        return time.time() >= self.end_time
@@ -0,0 +1,58 @@
+import hashlib
+from functools import lru_cache
+from typing import Iterable
+
+from algorithms.dataclasses.team import TeamShell
+
+"""
+Zobrist-style fingerprints of teams and team sets, used to recognise team sets that assign students the same way.
+
+Every student has a random 64-bit key, and a team's fingerprint is the XOR of its students' keys, so it does not depend
+    on the order of the students and a student can be added to or removed from it by XOR-ing their key.
+A team set's fingerprint combines the fingerprints of its teams with a key for each team's shell. Shells that only
+    differ by id or name share a key, so two team sets that swap the students of such teams have the same fingerprint.
+"""
+
+_MASK = (1 << 64) - 1
+
+
+def mix(value: int) -> int:
+    """
+    Scrambles a 64-bit value (the splitmix64 finalizer), so that similar inputs give unrelated outputs
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+@lru_cache(maxsize=None)
+def student_key(student_id: int) -> int:
+    # ids are taken as 64-bit two's complement (so -1 becomes 2**64 - 1), which gives every id between -2**63 and
+    #   2**63 its own value, and mix() never gives two values the same key. hash() can't be used, since it gives
+    #   some different ids the same hash (e.g. hash(-1) == hash(-2))
+    return mix(int(student_id) & _MASK)
+
+
+def team_fingerprint(student_ids: Iterable[int]) -> int:
+    fingerprint = 0
+    for student_id in student_ids:
+        fingerprint ^= student_key(student_id)
+    return fingerprint
+
+
+def team_shell_key(team_shell: TeamShell) -> int:
+    # the id and name of a shell don't affect how a team is scored
+    signature = repr(
+        (team_shell.project_id, team_shell.requirements, team_shell.is_locked)
+    )
+    return int.from_bytes(
+        hashlib.blake2b(signature.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def combine_team_fingerprint(fingerprint: int, shell_key: int) -> int:
+    """
+    A team's contribution to the fingerprint of its team set, which is the XOR of the contributions of its teams
+    """
+    return mix(fingerprint ^ shell_key)
@@ -0,0 +1,126 @@
+import random
+from typing import List
+
+import numpy as np
+
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeam,
+    PriorityTeamSet,
+)
+from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.ai.priority_algorithm.scoring import get_multipliers
+from algorithms.dataclasses.team import TeamShell
+
+# how many of the teams with room left are tried for each student, so that building the team set takes time linear in
+#   the number of students rather than in the number of students times the number of teams
+GREEDY_NUM_CANDIDATE_TEAMS = 16
+
+
+def generate_greedy_team_set(
+    team_shells: List[TeamShell],
+    priorities: List[Priority],
+    roster: CompiledRoster,
+    max_team_size: int,
+    num_candidate_teams: int = GREEDY_NUM_CANDIDATE_TEAMS,
+) -> PriorityTeamSet:
+    """
+    Builds a team set one student at a time (in a random order), putting each student on whichever of
+        num_candidate_teams randomly chosen teams with room left gains the most from them.
+
+    A team set's score is (up to bucketing) the average satisfaction of its teams, so a team's value is taken to be
+        its satisfaction of each priority times its size (how much of the average its students will make up), with the
+        priorities weighted by the same multipliers as the score. A student's gain on a team is how much they raise
+        the team's value.
+
+    Teams are filled as evenly as the random start type fills them (sizes differ by at most one, and are never above
+        max_team_size), and locked teams are left empty. Each team's satisfactions are kept in team states, so trying
+        a student on a team only costs updating the running totals of each priority.
+    """
+    team_indices = [
+        team_index
+        for team_index, team_shell in enumerate(team_shells)
+        if not team_shell.is_locked
+    ]
+    student_indices = list(range(len(roster.student_ids)))
+    random.shuffle(student_indices)
+
+    members: List[List[int]] = [[] for _ in team_shells]
+    team_states = [
+        [
+            priority.team_state(np.array([], dtype=np.int64), team_shell, roster)
+            for priority in priorities
+        ]
+        for team_shell in team_shells
+    ]
+    # empty teams have no value (not every priority's satisfaction is defined for them)
+    team_values = [0.0] * len(team_shells)
+    multipliers = get_multipliers(priorities)
+
+    if team_indices:
+        # every team gets min_size students, and num_larger_teams of them get one more
+        min_size = min(len(student_indices) // len(team_indices), max_team_size)
+        num_larger_teams = (
+            min(len(student_indices) - min_size * len(team_indices), len(team_indices))
+            if min_size < max_team_size
+            else 0
+        )
+    else:
+        min_size, num_larger_teams = 0, 0
+    open_teams = team_indices if min_size > 0 or num_larger_teams > 0 else []
+
+    for student_index in student_indices:
+        if not open_teams:
+            # the teams are full, so the rest of the students are left without a team
+            break
+
+        best_team_index, best_gain = None, None
+        for team_index in random.sample(
+            open_teams, min(num_candidate_teams, len(open_teams))
+        ):
+            satisfactions = []
+            for state in team_states[team_index]:
+                state.add(student_index)
+                satisfactions.append(state.satisfaction())
+                state.remove(student_index)
+            gain = (len(members[team_index]) + 1) * _weighted_satisfaction(
+                satisfactions, multipliers
+            ) - team_values[team_index]
+            if best_gain is None or gain > best_gain:
+                best_team_index, best_gain = team_index, gain
+
+        for state in team_states[best_team_index]:
+            state.add(student_index)
+        team_values[best_team_index] += best_gain
+        members[best_team_index].append(student_index)
+
+        team_size = len(members[best_team_index])
+        if team_size > min_size:
+            open_teams.remove(best_team_index)
+            num_larger_teams -= 1
+            if num_larger_teams == 0:
+                # the teams that have min_size students can't take any more
+                open_teams = [
+                    team_index
+                    for team_index in open_teams
+                    if len(members[team_index]) < min_size
+                ]
+        elif team_size == min_size and num_larger_teams == 0:
+            open_teams.remove(best_team_index)
+
+    return PriorityTeamSet(
+        priority_teams=[
+            PriorityTeam(
+                team_shell=team_shell,
+                student_ids=roster.student_ids[members[team_index]].tolist(),
+            )
+            for team_index, team_shell in enumerate(team_shells)
+        ]
+    )
+
+
+def _weighted_satisfaction(satisfactions: List[float], multipliers: List[int]) -> float:
+    return sum(
+        satisfaction * multiplier
+        for satisfaction, multiplier in zip(satisfactions, multipliers)
+    )
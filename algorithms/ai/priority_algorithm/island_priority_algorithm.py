@@ -0,0 +1,315 @@
+import random
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import cast, List, Tuple, Optional
+
+import numpy as np
+
+from algorithms.ai.interfaces.algorithm_config import IslandPriorityAlgorithmConfig
+from algorithms.ai.interfaces.algorithm_options import PriorityAlgorithmOptions
+from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
+from algorithms.ai.priority_algorithm.mutation_scheduler import MutationScheduler
+from algorithms.ai.priority_algorithm.parallel_mutator import (
+    can_start_worker_processes,
+)
+from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.priority_algorithm import PriorityAlgorithm
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.ai.priority_algorithm.trace import PriorityAlgorithmTrace
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+from algorithms.dataclasses.team_set import TeamSet
+
+# an island's team sets as the team_indices of their PriorityAssignment, along with their scores and fingerprints
+_IslandTeamSets = List[Tuple[np.ndarray, float, int]]
+
+_island_algorithms: List[PriorityAlgorithm] = []
+_team_shells: List[TeamShell] = []
+
+
+def _initialize_worker(
+    roster: CompiledRoster,
+    team_shells: List[TeamShell],
+    algorithm_options: PriorityAlgorithmOptions,
+    team_generation_options: TeamGenerationOptions,
+    algorithm_config: IslandPriorityAlgorithmConfig,
+):
+    global _island_algorithms, _team_shells
+    _team_shells = team_shells
+    _island_algorithms = []
+    for island_index in range(algorithm_config.NUM_ISLANDS):
+        island_algorithm = PriorityAlgorithm(
+            algorithm_options=algorithm_options,
+            team_generation_options=team_generation_options,
+            algorithm_config=algorithm_config.get_island_config(island_index),
+        )
+        island_algorithm.student_dict = roster
+        _island_algorithms.append(island_algorithm)
+
+
+def _run_island(
+    island_index: int,
+    island_team_sets: _IslandTeamSets,
+    max_iterations: int,
+    end_time: float,
+    seed: int,
+    mutation_scheduler: Optional[MutationScheduler],
+) -> Tuple[
+    _IslandTeamSets, int, Optional[MutationScheduler], Optional[PriorityAlgorithmTrace]
+]:
+    """
+    Returns the island's team sets after searching from island_team_sets, how many iterations the search ran, the
+        island's mutation scheduler (when it has one), and the trace of this search (when TRACE is set). Any worker
+        may run any island, so the mutation scheduler is passed back and forth rather than kept in the worker, and
+        each search is traced on its own.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    island_algorithm = _island_algorithms[island_index]
+    if mutation_scheduler is not None:
+        island_algorithm.mutation_scheduler = mutation_scheduler
+    if island_algorithm.trace is not None:
+        island_algorithm.trace = PriorityAlgorithmTrace()
+    team_sets = island_algorithm.search(
+        _unpack_team_sets(island_team_sets, island_algorithm.student_dict),
+        max_iterations=max_iterations,
+        end_time=end_time,
+    )
+    return (
+        _pack_team_sets(
+            team_sets,
+            island_algorithm.student_dict,
+            island_algorithm.algorithm_options.priorities,
+        ),
+        island_algorithm.num_search_iterations,
+        island_algorithm.mutation_scheduler,
+        island_algorithm.trace,
+    )
+
+
+def _pack_team_sets(
+    team_sets: List[PriorityTeamSet],
+    roster: CompiledRoster,
+    priorities: List[Priority],
+) -> _IslandTeamSets:
+    return [
+        (
+            PriorityAssignment.from_roster(
+                team_set.priority_teams, roster
+            ).team_indices,
+            team_set.calculate_score(priorities, roster),
+            team_set.fingerprint(),
+        )
+        for team_set in team_sets
+    ]
+
+
+def _unpack_team_sets(
+    island_team_sets: _IslandTeamSets, roster: CompiledRoster
+) -> List[PriorityTeamSet]:
+    team_sets = []
+    for team_indices, score, _ in island_team_sets:
+        team_set = PriorityAssignment(
+            team_shells=_team_shells,
+            student_ids=roster.student_ids,
+            team_indices=team_indices,
+        ).to_priority_team_set()
+        team_set.score = score
+        team_sets.append(team_set)
+    return team_sets
+
+
+class _SerialExecutor(Executor):
+    """
+    Runs each task as soon as it is submitted, in the calling process
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class IslandPriorityAlgorithm(PriorityAlgorithm):
+    """
+    Runs several independent priority algorithm beams ("islands") in parallel processes, each with its own random
+        seed and optionally its own mix of mutations. The islands only synchronise every MIGRATION_INTERVAL iterations,
+        when the best team sets of each island migrate to the next one.
+
+    Where worker processes can't be started (e.g. when running a simulation's trials), the islands take turns in the
+        calling process instead, each searching for an equal share of the time left in the migration interval.
+    """
+
+    def __init__(
+        self,
+        algorithm_options: PriorityAlgorithmOptions,
+        team_generation_options: TeamGenerationOptions,
+        algorithm_config: IslandPriorityAlgorithmConfig = None,
+    ):
+        super().__init__(
+            algorithm_options=algorithm_options,
+            team_generation_options=team_generation_options,
+            algorithm_config=algorithm_config or IslandPriorityAlgorithmConfig(),
+        )
+        self.algorithm_config: IslandPriorityAlgorithmConfig = cast(
+            IslandPriorityAlgorithmConfig, self.algorithm_config
+        )
+
+    def generate(self, students: List[Student]) -> TeamSet:
+        self.student_dict = CompiledRoster(students)
+        config = self.algorithm_config
+
+        start_time = time.time()
+        end_time = start_time + config.MAX_TIME
+        initial_team_set = self.generate_initial_team_set(students)
+        team_shells = [
+            priority_team.team_shell
+            for priority_team in initial_team_set.priority_teams
+        ]
+        # every island starts from the same team set, and diverges through its own mutations
+        islands = [
+            _pack_team_sets(
+                [initial_team_set],
+                self.student_dict,
+                self.algorithm_options.priorities,
+            )
+            for _ in range(config.NUM_ISLANDS)
+        ]
+
+        initargs = (
+            self.student_dict,
+            team_shells,
+            self.algorithm_options,
+            self.team_generation_options,
+            config,
+        )
+        is_parallel = can_start_worker_processes()
+        if is_parallel:
+            executor = ProcessPoolExecutor(
+                max_workers=config.NUM_ISLANDS,
+                initializer=_initialize_worker,
+                initargs=initargs,
+            )
+        else:
+            _initialize_worker(*initargs)
+            executor = _SerialExecutor()
+        mutation_schedulers: List[Optional[MutationScheduler]] = [
+            None
+        ] * config.NUM_ISLANDS
+
+        with executor:
+            iteration = 0
+            best_score = self._best_team_set(islands)[1]
+            num_stagnant_iterations = 0
+            if self.trace is not None and not self.trace.best_scores:
+                self.trace.best_scores.append(best_score)
+            # islands stop early within a migration interval when they stagnate, and the whole run stops once the best
+            #   score of every island has stopped improving or any island reaches the max score
+            while (
+                time.time() < end_time
+                and iteration < config.MAX_ITERATE
+                and not self.has_converged(best_score, num_stagnant_iterations)
+            ):
+                num_iterations = min(
+                    config.MIGRATION_INTERVAL, config.MAX_ITERATE - iteration
+                )
+                futures = []
+                for island_index, island in enumerate(islands):
+                    # taking turns, each island is given an equal share of the time that is left
+                    island_end_time = (
+                        end_time
+                        if is_parallel
+                        else time.time()
+                        + (end_time - time.time()) / (len(islands) - island_index)
+                    )
+                    futures.append(
+                        executor.submit(
+                            _run_island,
+                            island_index,
+                            island,
+                            num_iterations,
+                            island_end_time,
+                            random.getrandbits(32),
+                            mutation_schedulers[island_index],
+                        )
+                    )
+                results = [future.result() for future in futures]
+                islands = self.migrate([island for island, _, _, _ in results])
+                mutation_schedulers = [
+                    mutation_scheduler for _, _, mutation_scheduler, _ in results
+                ]
+                if self.trace is not None:
+                    self.trace.add_island_iterations(
+                        [island_trace for _, _, _, island_trace in results],
+                        is_parallel,
+                    )
+
+                # the islands run side by side, so the run has gone as many iterations as the longest island search
+                num_iterations_run = max(
+                    island_num_iterations for _, island_num_iterations, _, _ in results
+                )
+                if num_iterations_run == 0:
+                    break
+                iteration += num_iterations_run
+
+                island_best_score = self._best_team_set(islands)[1]
+                if island_best_score > best_score:
+                    best_score = island_best_score
+                    num_stagnant_iterations = 0
+                else:
+                    num_stagnant_iterations += num_iterations_run
+
+        best_team_indices, _, _ = self._best_team_set(islands)
+        return self._unpack_priority_team_set(
+            PriorityAssignment(
+                team_shells=team_shells,
+                student_ids=self.student_dict.student_ids,
+                team_indices=best_team_indices,
+            ).to_priority_team_set()
+        )
+
+    @staticmethod
+    def _best_team_set(
+        islands: List[_IslandTeamSets],
+    ) -> Tuple[np.ndarray, float, int]:
+        return max(
+            [team_set for island in islands for team_set in island],
+            key=lambda team_set: team_set[1],
+        )
+
+    def migrate(self, islands: List[_IslandTeamSets]) -> List[_IslandTeamSets]:
+        """
+        Each island's NUM_MIGRANTS best team sets are copied to the next island in the ring, replacing its worst ones.
+        Migrants that are already on the island (by fingerprint) are left out, so that the island doesn't hold two
+            copies of one team set, and the island keeps that many more of its own team sets instead.
+        """
+        islands = [
+            sorted(island, key=lambda team_set: team_set[1], reverse=True)
+            for island in islands
+        ]
+        num_migrants = self.algorithm_config.NUM_MIGRANTS
+        if len(islands) < 2 or num_migrants == 0:
+            return islands
+
+        migrated_islands = []
+        for island_index, island in enumerate(islands):
+            fingerprints = {fingerprint for _, _, fingerprint in island}
+            migrants = []
+            for team_set in islands[island_index - 1][:num_migrants]:
+                if team_set[2] not in fingerprints:
+                    fingerprints.add(team_set[2])
+                    migrants.append(team_set)
+            residents = island[: self.algorithm_config.MAX_KEEP - len(migrants)]
+            migrated_islands.append(
+                sorted(
+                    residents + migrants,
+                    key=lambda team_set: team_set[1],
+                    reverse=True,
+                )
+            )
+        return migrated_islands
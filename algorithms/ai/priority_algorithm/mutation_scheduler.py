@@ -0,0 +1,105 @@
+import math
+from typing import List
+
+from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
+
+# how much of what was measured about a mutation is kept from one iteration to the next, so that the schedule follows
+#   how useful each mutation is at the current stage of the search rather than over the whole run
+MUTATION_SCHEDULER_DISCOUNT = 0.9
+# how strongly mutations that have made fewer team sets are favoured, so that every mutation keeps being measured
+MUTATION_SCHEDULER_EXPLORATION = 0.5
+
+
+class MutationScheduler:
+    """
+    Decides how many of the MAX_SPREAD team sets made from each kept team set come from each mutation, as a
+        multi-armed bandit (UCB1) where a mutation's reward is the score it gains per second of CPU time.
+
+    Every mutation makes at least one team set each iteration (as long as MAX_SPREAD allows it), and the rest go to the
+        mutations with the highest upper confidence bound: the mutation's rate of score gain per CPU second (relative
+        to the best mutation's), plus a bonus that is larger for mutations that have made fewer team sets.
+    """
+
+    def __init__(
+        self,
+        mutations: List[Mutation],
+        max_spread: int,
+        discount: float = MUTATION_SCHEDULER_DISCOUNT,
+        exploration: float = MUTATION_SCHEDULER_EXPLORATION,
+    ):
+        self.mutations = mutations
+        self.max_spread = max_spread
+        self.discount = discount
+        self.exploration = exploration
+
+        # discounted totals for each mutation
+        self.num_team_sets = [0.0] * len(mutations)
+        self.score_gains = [0.0] * len(mutations)
+        self.cpu_times = [0.0] * len(mutations)
+
+    def allocate(self) -> List[int]:
+        """
+        Returns how many team sets each mutation should make from each kept team set in the next iteration
+        """
+        if not any(self.num_team_sets):
+            # nothing has been measured yet, so the mutations' own num_mutations are used
+            return [mutation.num_mutations for mutation in self.mutations]
+
+        min_num_team_sets = 1 if self.max_spread >= len(self.mutations) else 0
+        allocation = [min_num_team_sets] * len(self.mutations)
+        num_team_sets = [
+            num_team_sets + min_num_team_sets for num_team_sets in self.num_team_sets
+        ]
+        rewards = self.get_rewards()
+        for _ in range(self.max_spread - sum(allocation)):
+            mutation_index = max(
+                range(len(self.mutations)),
+                key=lambda i: self.upper_confidence_bound(
+                    rewards[i], num_team_sets[i], sum(num_team_sets)
+                ),
+            )
+            allocation[mutation_index] += 1
+            num_team_sets[mutation_index] += 1
+        return allocation
+
+    def upper_confidence_bound(
+        self, reward: float, num_team_sets: float, total_num_team_sets: float
+    ) -> float:
+        if num_team_sets <= 0:
+            return math.inf
+        return reward + self.exploration * math.sqrt(
+            2 * math.log(max(total_num_team_sets, 1)) / num_team_sets
+        )
+
+    def get_rewards(self) -> List[float]:
+        """
+        Each mutation's score gain per CPU second, relative to the mutation with the highest one (so in [0, 1]).
+        Mutations that have not made any team sets yet have a reward of 1, so that they are tried.
+        """
+        rates = [
+            score_gain / max(cpu_time, 1e-9) if num_team_sets else math.inf
+            for num_team_sets, score_gain, cpu_time in zip(
+                self.num_team_sets, self.score_gains, self.cpu_times
+            )
+        ]
+        max_measured_rate = max([rate for rate in rates if rate != math.inf], default=0)
+        return [
+            1.0
+            if rate == math.inf
+            else (rate / max_measured_rate if max_measured_rate > 0 else 0.0)
+            for rate in rates
+        ]
+
+    def record(self, mutation_index: int, score_gain: float, cpu_time: float):
+        """
+        Records that the mutation made a team set scoring score_gain higher than the team set it was made from
+            (0 if it scores lower), taking cpu_time seconds
+        """
+        self.num_team_sets[mutation_index] += 1
+        self.score_gains[mutation_index] += score_gain
+        self.cpu_times[mutation_index] += cpu_time
+
+    def end_iteration(self):
+        self.num_team_sets = [_ * self.discount for _ in self.num_team_sets]
+        self.score_gains = [_ * self.discount for _ in self.score_gains]
+        self.cpu_times = [_ * self.discount for _ in self.cpu_times]
@@ -1,6 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
@@ -32,6 +33,7 @@ class GreedyLocalMaxMutation(Mutation):
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ):
         """
         1. Pick N random teams
@@ -47,8 +49,10 @@ class GreedyLocalMaxMutation(Mutation):
             if len(available_priority_teams) < self.number_of_teams:
                 return priority_team_set
             teams = random.sample(available_priority_teams, self.number_of_teams)
-            team_sizes = [len(team.student_ids) for team in teams]
-            students = [student_id for team in teams for student_id in team.student_ids]
+            team_sizes = [len(team.student_ids_view) for team in teams]
+            students = [
+                student_id for team in teams for student_id in team.student_ids_view
+            ]
             random.shuffle(students)
             mutated_teams = [[] for _ in range(self.number_of_teams)]
             scores = [0 for _ in range(self.number_of_teams)]
@@ -1,7 +1,8 @@
 from abc import ABC
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
 from algorithms.dataclasses.student import Student
@@ -17,16 +18,25 @@ class Mutation(ABC):
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> List[PriorityTeamSet]:
-        return [
-            self.mutate_one(
-                priority_team_set.clone(),
-                priorities,
-                student_dict,
-                team_generation_options,
+        """
+        Returns num_mutations mutated clones of the team set, or fewer if the deadline passes before they are all made
+        """
+        mutated_team_sets = []
+        for _ in range(self.num_mutations):
+            if deadline and deadline.has_passed():
+                break
+            mutated_team_sets.append(
+                self.mutate_one(
+                    priority_team_set.clone(),
+                    priorities,
+                    student_dict,
+                    team_generation_options,
+                    deadline,
+                )
             )
-            for _ in range(self.num_mutations)
-        ]
+        return mutated_team_sets
 
     def mutate_one(
         self,
@@ -34,5 +44,11 @@ class Mutation(ABC):
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> PriorityTeamSet:
+        """
+        Mutates the team set (in place or not) and returns the mutated team set.
+        Mutations that search through many possibilities should stop once the deadline has passed, and use the best
+            possibility found so far.
+        """
         raise NotImplementedError
@@ -1,7 +1,8 @@
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
 from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
 from algorithms.ai.priority_algorithm.mutations.utils import (
@@ -14,12 +15,19 @@ from algorithms.dataclasses.student import Student
 
 
 class LocalMaxRandomMutation(Mutation):
+    def __init__(self, num_mutations: int = 1, max_nodes: Optional[int] = None):
+        super().__init__(num_mutations)
+        # limits how much of the search for the best way to split two teams' students is done (see
+        #   find_best_split()), for when teams are too large to search exhaustively
+        self.max_nodes = max_nodes
+
     def mutate_one(
         self,
         priority_team_set: PriorityTeamSet,
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> PriorityTeamSet:
         """
         This mutation finds the lowest scoring team and one random team, and then computes the scores of all possible
@@ -39,7 +47,9 @@ class LocalMaxRandomMutation(Mutation):
             team_2 = team_1
             while team_2 == team_1:
                 team_2 = random.sample(available_priority_teams, 1)[0]
-            local_max(team_1, team_2, priorities, student_dict)
+            local_max(
+                team_1, team_2, priorities, student_dict, self.max_nodes, deadline
+            )
 
         except ValueError:
             return priority_team_set
@@ -1,8 +1,9 @@
 import random
 from random import shuffle
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
 from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
 from algorithms.ai.priority_algorithm.mutations.utils import (
@@ -19,6 +20,7 @@ class RandomSliceMutation(Mutation):
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ):
         """
         This mutation takes one student from each team and swaps them
@@ -1,7 +1,8 @@
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
@@ -21,6 +22,7 @@ class RandomSwapMutation(Mutation):
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> PriorityTeamSet:
         available_priority_teams = get_available_priority_teams(priority_team_set)
         try:
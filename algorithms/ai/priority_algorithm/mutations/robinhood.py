@@ -1,8 +1,8 @@
-import itertools
 import random
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
@@ -10,20 +10,33 @@ from algorithms.ai.priority_algorithm.custom_dataclasses import (
 from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
 from algorithms.ai.priority_algorithm.mutations.utils import (
     get_available_priority_teams,
+    find_best_split,
+    get_split_student_ids,
 )
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.scoring import (
+    get_multipliers,
+    get_bucketed_satisfaction,
+)
 from algorithms.dataclasses.student import Student
 
 ROBINHOOD_SATISFACTION_THRESHOLD = 0.8
 
 
 class RobinhoodMutation(Mutation):
+    def __init__(self, num_mutations: int = 1, max_nodes: Optional[int] = None):
+        super().__init__(num_mutations)
+        # limits how much of the search for the best way to split two teams' students is done (see
+        #   find_best_split()), for when teams are too large to search exhaustively
+        self.max_nodes = max_nodes
+
     def mutate_one(
         self,
         priority_team_set: PriorityTeamSet,
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> PriorityTeamSet:
         """
         Robinhood is a mutation that finds a team t1 that does not satisfy a priority c, and a team t2 that does satisfy c. It then creates all possible team sets by mutating the students of t1 and t2, and chooses the best team. This is done across all constraints.
@@ -39,12 +52,13 @@ class RobinhoodMutation(Mutation):
             priorities, student_dict
         )
         try:
-            for priority in priorities:
-                # We need to clone the priority_team_set because we will be modifying it in order to get the score of the whole TeamSet
-                cloned_priority_team_set: PriorityTeamSet = priority_team_set.clone()
+            for priority_index, priority in enumerate(priorities):
+                if deadline and deadline.has_passed():
+                    break
 
+                # The team set is only cloned once a better team set is found, so it is not modified here
                 available_priority_teams = get_available_priority_teams(
-                    cloned_priority_team_set
+                    priority_team_set
                 )
 
                 # Sort the teams into two lists: those that satisfy the priority and those that don't
@@ -52,13 +66,7 @@ class RobinhoodMutation(Mutation):
                 unsatisfied_teams: List[PriorityTeam] = []
                 for team in available_priority_teams:
                     if (
-                        priority.satisfaction(
-                            [
-                                student_dict[student_id]
-                                for student_id in team.student_ids
-                            ],
-                            team.team_shell,
-                        )
+                        team.get_satisfactions(priorities, student_dict)[priority_index]
                         >= ROBINHOOD_SATISFACTION_THRESHOLD
                     ):
                         satisfied_teams.append(team)
@@ -84,11 +92,13 @@ class RobinhoodMutation(Mutation):
                     local_best_team_set,
                     local_best_team_set_score,
                 ) = perform_local_max_portion_of_robinhood(
-                    cloned_priority_team_set,
+                    priority_team_set,
                     priorities,
                     student_dict,
                     satisfied_team,
                     unsatisfied_team,
+                    self.max_nodes,
+                    deadline,
                 )
 
                 # Update the best team set if the local best team set is better
@@ -101,54 +111,118 @@ class RobinhoodMutation(Mutation):
 
 
 def perform_local_max_portion_of_robinhood(
-    cloned_priority_team_set: PriorityTeamSet,
+    priority_team_set: PriorityTeamSet,
     priorities: List[Priority],
     student_dict: Dict[int, Student],
     selected_team_a: PriorityTeam,
     selected_team_b: PriorityTeam,
+    max_nodes: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
 ) -> Tuple[PriorityTeamSet, float]:
     """
     Performs the local max portion of the robinhood mutation. This is the part where we generate all possible teams using the students from the two teams, and choose the best team.
+    max_nodes and deadline limit how much of the search for the best team is done (see find_best_split()).
+
+    The given team set is not modified. If a better team set is found, it is returned as a clone of the given team set with the two teams changed. Otherwise, the given team set is returned.
 
     returns (best_team_set, best_team_set_score)
     """
-
-    # Init best team set
-    best_team_set: PriorityTeamSet = cloned_priority_team_set
-    best_team_set_score: float = cloned_priority_team_set.calculate_score(
+    best_team_set_score: float = priority_team_set.calculate_score(
         priorities, student_dict
     )
 
     # List of all students in the two teams
-    students: List[int] = list(selected_team_a.student_ids) + list(
-        selected_team_b.student_ids
-    )
-
-    # Generate all possible teams using the students from the two teams
-    # Elements of this list are lists of student ids
-    possible_teams: List[Tuple[int]] = list(
-        itertools.combinations(students, len(selected_team_b.student_ids))
+    students: List[int] = list(selected_team_a.student_ids_view) + list(
+        selected_team_b.student_ids_view
     )
 
-    # Calculate the score of each team
-    for team in possible_teams:
-        # Modify the cloned PriorityTeamSet to reflect the new team
-        selected_team_b.student_ids = list(team)
-        selected_team_a.student_ids = [
-            student_id for student_id in students if student_id not in team
-        ]
-
-        # Calculate the score of the resulting PriorityTeamSet
-        cloned_priority_team_set.score = (
-            None  # Reset the score to force recalculation after modification
+    # Only the two selected teams change, so every other team's satisfactions are found once. The teams are still
+    #   summed in their positions in the team set, as calculate_score() sums them, so that the score of each split
+    #   is exactly the score the team set would get; the sum of the teams before both selected teams is the same
+    #   for every split, so it is only found once.
+    team_a_index, team_b_index = [
+        next(
+            index
+            for index, priority_team in enumerate(priority_team_set.priority_teams)
+            if priority_team is selected_team
+        )
+        for selected_team in [selected_team_a, selected_team_b]
+    ]
+    team_satisfactions = [
+        priority_team.get_satisfactions(priorities, student_dict)
+        for priority_team in priority_team_set.priority_teams
+    ]
+    first_changed_index = min(team_a_index, team_b_index)
+    unchanged_totals = [
+        sum(
+            satisfactions[priority_index]
+            for satisfactions in team_satisfactions[:first_changed_index]
+        )
+        for priority_index in range(len(priorities))
+    ]
+    changed_team_satisfactions = team_satisfactions[first_changed_index:]
+    num_teams = len(priority_team_set.priority_teams)
+    multipliers = get_multipliers(priorities)
+
+    def team_set_score(
+        team_b_satisfactions: List[float], team_a_satisfactions: List[float]
+    ) -> int:
+        split_team_satisfactions = list(changed_team_satisfactions)
+        split_team_satisfactions[
+            team_a_index - first_changed_index
+        ] = team_a_satisfactions
+        split_team_satisfactions[
+            team_b_index - first_changed_index
+        ] = team_b_satisfactions
+        return sum(
+            [
+                get_bucketed_satisfaction(
+                    sum(
+                        (
+                            satisfactions[priority_index]
+                            for satisfactions in split_team_satisfactions
+                        ),
+                        unchanged_total,
+                    )
+                    / num_teams
+                )
+                * multiplier
+                for priority_index, (unchanged_total, multiplier) in enumerate(
+                    zip(unchanged_totals, multipliers)
+                )
+            ]
         )
-        score = cloned_priority_team_set.calculate_score(priorities, student_dict)
-        if score > best_team_set_score:
-            # Clone the PriorityTeamSet because we will be modifying on the next iteration
-            best_team_set = cloned_priority_team_set.clone()
-            best_team_set_score = score
 
-    return best_team_set, best_team_set_score
+    # Find the best of all possible teams using the students from the two teams
+    best_split = find_best_split(
+        students,
+        len(selected_team_b.student_ids_view),
+        selected_team_b.team_shell,
+        selected_team_a.team_shell,
+        priorities,
+        student_dict,
+        split_score=team_set_score,
+        min_score=best_team_set_score,
+        max_nodes=max_nodes,
+        deadline=deadline,
+    )
+    if best_split is None:
+        return priority_team_set, best_team_set_score
+
+    # Clone the PriorityTeamSet and modify it to reflect the new team
+    best_team_set = priority_team_set.clone()
+    best_team_a = best_team_set.priority_teams[team_a_index]
+    best_team_b = best_team_set.priority_teams[team_b_index]
+    best_team_b.student_ids, best_team_a.student_ids = get_split_student_ids(
+        students, best_split.positions
+    )
+    best_team_b.set_satisfactions(
+        best_split.team_1_satisfactions, priorities, student_dict
+    )
+    best_team_a.set_satisfactions(
+        best_split.team_2_satisfactions, priorities, student_dict
+    )
+    return best_team_set, best_team_set.calculate_score(priorities, student_dict)
 
 
 def valid_robinhood_arguments(
@@ -1,6 +1,7 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
@@ -19,12 +20,19 @@ from algorithms.dataclasses.student import Student
 
 
 class RobinhoodHolisticMutation(Mutation):
+    def __init__(self, num_mutations: int = 1, max_nodes: Optional[int] = None):
+        super().__init__(num_mutations)
+        # limits how much of the search for the best way to split two teams' students is done (see
+        #   find_best_split()), for when teams are too large to search exhaustively
+        self.max_nodes = max_nodes
+
     def mutate_one(
         self,
         priority_team_set: PriorityTeamSet,
         priorities: List[Priority],
         student_dict: Dict[int, Student],
         team_generation_options: TeamGenerationOptions,
+        deadline: Optional[Deadline] = None,
     ) -> PriorityTeamSet:
         """
         This is a variation of mutate_robinhood that does not consider individual priorities. Instead, it considers the entire set of priorities as a whole. This is done by calculating the score of each team in the team set, and then performing the local max portion of the robinhood mutation on the team with the lowest score and the team with the highest score.
@@ -33,11 +41,9 @@ class RobinhoodHolisticMutation(Mutation):
         if not valid_robinhood_arguments(priority_team_set, priorities, student_dict):
             return priority_team_set
 
-        cloned_priority_team_set: PriorityTeamSet = priority_team_set.clone()
-
-        available_priority_teams = get_available_priority_teams(
-            cloned_priority_team_set
-        )
+        # perform_local_max_portion_of_robinhood() clones the team set if it finds a better one, so it is not
+        #   cloned here
+        available_priority_teams = get_available_priority_teams(priority_team_set)
 
         # Calculate the score of each team in the team set
         team_scores: List[Tuple[PriorityTeam, int]] = []
@@ -55,11 +61,13 @@ class RobinhoodHolisticMutation(Mutation):
 
         # Perform local max portion of robinhood
         team_set, score = perform_local_max_portion_of_robinhood(
-            cloned_priority_team_set,
+            priority_team_set,
             priorities,
             student_dict,
             min_scoring_team[0],
             max_scoring_team[0],
+            self.max_nodes,
+            deadline,
         )
 
         return team_set
@@ -1,16 +1,27 @@
 import itertools
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import List, Dict, Iterator, Tuple, Callable, Optional
 
+import numpy as np
+
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeam,
     PriorityTeamSet,
 )
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
 from algorithms.ai.priority_algorithm.scoring import (
     get_multipliers,
-    get_priority_satisfaction_array,
+    get_bucketed_satisfaction,
+    get_team_satisfactions,
 )
 from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+
+# how many splits are tried between checks of whether the deadline has passed, so that time.time() isn't called for
+#   every split
+DEADLINE_CHECK_INTERVAL = 64
 
 
 def score(
@@ -18,16 +29,28 @@ def score(
     priorities: List[Priority],
     student_dict: Dict[int, Student],
 ) -> int:
-    priority_satisfaction_array = get_priority_satisfaction_array(
-        [priority_team], priorities, student_dict
+    # scored as a team set of just this team, with all priorities scored at once so that memoized
+    #   satisfactions of the team can be used
+    return score_satisfactions(
+        get_team_satisfactions(
+            priority_team.student_ids_view,
+            priority_team.team_shell,
+            priorities,
+            student_dict,
+        ),
+        priorities,
     )
+
+
+def score_satisfactions(satisfactions: List[float], priorities: List[Priority]) -> int:
+    """
+    Scores a team with the given satisfaction of each priority, as score() does
+    """
     multipliers = get_multipliers(priorities)
     return sum(
         [
-            satisfaction * multiplier
-            for satisfaction, multiplier in zip(
-                priority_satisfaction_array, multipliers
-            )
+            get_bucketed_satisfaction(satisfaction) * multiplier
+            for satisfaction, multiplier in zip(satisfactions, multipliers)
         ]
     )
 
@@ -42,36 +65,223 @@ def get_available_priority_teams(
     ]
 
 
+def iterate_splits(
+    student_ids: List[int],
+    team_1_size: int,
+    team_1_shell: TeamShell,
+    team_2_shell: TeamShell,
+    priorities: List[Priority],
+    student_dict: Dict[int, Student],
+) -> Iterator[Tuple[Tuple[int, ...], List[float], List[float]]]:
+    """
+    Yields every way of splitting the students into a team of team_1_size and a team of the remaining students, as
+        (positions of the students on team 1, team 1 satisfactions, team 2 satisfactions), in lexicographic order of
+        positions.
+    Both teams are scored for every split, so find_best_split() searches the splits with branch and bound instead
+        when the student dict is a CompiledRoster.
+    """
+    for positions in itertools.combinations(range(len(student_ids)), team_1_size):
+        team_1_ids, team_2_ids = get_split_student_ids(student_ids, positions)
+        yield (
+            positions,
+            get_team_satisfactions(team_1_ids, team_1_shell, priorities, student_dict),
+            get_team_satisfactions(team_2_ids, team_2_shell, priorities, student_dict),
+        )
+
+
+def get_split_student_ids(
+    student_ids: List[int], positions: Tuple[int, ...]
+) -> Tuple[List[int], List[int]]:
+    """
+    Returns the ids of the students at the given positions, and the ids of the rest of the students
+    """
+    position_set = set(positions)
+    return (
+        [student_ids[position] for position in positions],
+        [
+            student_id
+            for position, student_id in enumerate(student_ids)
+            if position not in position_set
+        ],
+    )
+
+
+@dataclass
+class Split:
+    # positions of the students on team 1, in the list of students being split
+    positions: Tuple[int, ...]
+    team_1_satisfactions: List[float]
+    team_2_satisfactions: List[float]
+    score: float
+
+
+def find_best_split(
+    student_ids: List[int],
+    team_1_size: int,
+    team_1_shell: TeamShell,
+    team_2_shell: TeamShell,
+    priorities: List[Priority],
+    student_dict: Dict[int, Student],
+    split_score: Callable[[List[float], List[float]], float],
+    min_score: float,
+    max_nodes: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[Split]:
+    """
+    Finds the way of splitting the students into a team of team_1_size and a team of the remaining students that
+        has the highest split_score(team 1 satisfactions, team 2 satisfactions), if it is higher than min_score.
+    When several splits have the highest score, the one that comes first in lexicographic order of positions is
+        returned.
+
+    When the student dict is a CompiledRoster, the splits are searched with branch and bound: students are put on
+        one team or the other one at a time, and a partial split is abandoned when even the upper bounds of its
+        teams' satisfactions (see PriorityTeamState.satisfaction_upper_bound) cannot score higher than the best split
+        found so far. This relies on split_score never decreasing when a satisfaction increases.
+    max_nodes limits how many partial splits (or splits, without a roster) are tried, after which the best split
+        found so far is returned. The same happens once the deadline passes.
+    """
+    best_split: Optional[Split] = None
+    if not isinstance(student_dict, CompiledRoster):
+        for num_splits, (
+            positions,
+            team_1_satisfactions,
+            team_2_satisfactions,
+        ) in enumerate(
+            iterate_splits(
+                student_ids,
+                team_1_size,
+                team_1_shell,
+                team_2_shell,
+                priorities,
+                student_dict,
+            )
+        ):
+            if max_nodes is not None and num_splits >= max_nodes:
+                break
+            if deadline and num_splits % DEADLINE_CHECK_INTERVAL == 0:
+                if deadline.has_passed():
+                    break
+            score = split_score(team_1_satisfactions, team_2_satisfactions)
+            # splits are reached in lexicographic order, so the first split found with the highest score is the one
+            #   to return
+            if score > min_score:
+                best_split = Split(
+                    positions, team_1_satisfactions, team_2_satisfactions, score
+                )
+                min_score = score
+        return best_split
+
+    indices = student_dict.indices_of(student_ids)
+    num_students = len(student_ids)
+    team_2_size = num_students - team_1_size
+    if team_2_size < 0:
+        return None
+    no_students = np.array([], dtype=np.int64)
+    team_1_states = [
+        priority.team_state(no_students, team_1_shell, student_dict)
+        for priority in priorities
+    ]
+    team_2_states = [
+        priority.team_state(no_students, team_2_shell, student_dict)
+        for priority in priorities
+    ]
+    team_1_positions: List[int] = []
+    num_nodes = 0
+    is_stopped = False
+
+    # students are tried on team 1 before team 2, so splits are reached in lexicographic order and the first split
+    #   found with the highest score is the one to return
+    def search(position: int):
+        nonlocal best_split, min_score, num_nodes, is_stopped
+        if is_stopped or (max_nodes is not None and num_nodes >= max_nodes):
+            return
+        if deadline and num_nodes % DEADLINE_CHECK_INTERVAL == 0:
+            is_stopped = deadline.has_passed()
+            if is_stopped:
+                return
+        num_nodes += 1
+
+        if position == num_students:
+            team_1_satisfactions = [state.satisfaction() for state in team_1_states]
+            team_2_satisfactions = [state.satisfaction() for state in team_2_states]
+            score = split_score(team_1_satisfactions, team_2_satisfactions)
+            if score > min_score:
+                best_split = Split(
+                    tuple(team_1_positions),
+                    team_1_satisfactions,
+                    team_2_satisfactions,
+                    score,
+                )
+                min_score = score
+            return
+
+        num_team_1_open = team_1_size - len(team_1_positions)
+        num_team_2_open = team_2_size - (position - len(team_1_positions))
+        candidates = indices[position:]
+        upper_bound = split_score(
+            [
+                state.satisfaction_upper_bound(candidates, num_team_1_open)
+                for state in team_1_states
+            ],
+            [
+                state.satisfaction_upper_bound(candidates, num_team_2_open)
+                for state in team_2_states
+            ],
+        )
+        if upper_bound <= min_score:
+            return
+
+        index = indices[position]
+        if num_team_1_open > 0:
+            team_1_positions.append(position)
+            for state in team_1_states:
+                state.add(index)
+            search(position + 1)
+            for state in team_1_states:
+                state.remove(index)
+            team_1_positions.pop()
+        if num_team_2_open > 0:
+            for state in team_2_states:
+                state.add(index)
+            search(position + 1)
+            for state in team_2_states:
+                state.remove(index)
+
+    search(0)
+    return best_split
+
+
 def local_max(
     team_1: PriorityTeam,
     team_2: PriorityTeam,
     priorities: List[Priority],
     student_dict: Dict[int, Student],
+    max_nodes: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
 ):
     # Finds all combinations of students for the two teams
-    students = team_1.student_ids + team_2.student_ids
+    students = list(team_1.student_ids_view + team_2.student_ids_view)
     # TODO: Determine how we want to find team size
-    team_size = len(team_1.student_ids)
-    student_combinations = list(itertools.combinations(students, team_size))
-
-    max_score = 0
-    max_index = 0
-    for i, combo in enumerate(student_combinations):
-        combo_1 = [
-            *combo,
-        ]
-        combo_2 = [_ for _ in students if _ not in combo_1]
-        team_1.student_ids = combo_1
-        team_2.student_ids = combo_2
-        team_1_score = score(team_1, priorities, student_dict)
-        team_2_score = score(team_2, priorities, student_dict)
-        if team_1_score > max_score or team_2_score > max_score:
-            max_index = i
-            max_score = max(team_1_score, team_2_score)
-
-    best_team_1_students = [
-        *student_combinations[max_index],
-    ]
-    best_team_2_students = [_ for _ in students if _ not in best_team_1_students]
-    team_1.student_ids = best_team_1_students
-    team_2.student_ids = best_team_2_students
+    team_size = len(team_1.student_ids_view)
+
+    # keeps the split where either team scores highest, or leaves the teams as they are if neither team can score
+    #   above 0
+    best_split = find_best_split(
+        students,
+        team_size,
+        team_1.team_shell,
+        team_2.team_shell,
+        priorities,
+        student_dict,
+        split_score=lambda team_1_satisfactions, team_2_satisfactions: max(
+            score_satisfactions(team_1_satisfactions, priorities),
+            score_satisfactions(team_2_satisfactions, priorities),
+        ),
+        min_score=0,
+        max_nodes=max_nodes,
+        deadline=deadline,
+    )
+    best_positions = best_split.positions if best_split else tuple(range(team_size))
+    team_1.student_ids, team_2.student_ids = get_split_student_ids(
+        students, best_positions
+    )
@@ -0,0 +1,182 @@
+import math
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Optional
+
+import numpy as np
+
+from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
+from algorithms.ai.priority_algorithm.deadline import Deadline
+from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
+from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.dataclasses.team import TeamShell
+
+# how many of the team sets sent to a worker it keeps (along with their scored teams) to mutate again
+_MAX_CACHED_TEAM_SETS = 16
+
+
+@dataclass
+class _WorkerState:
+    roster: CompiledRoster
+    team_shells: List[TeamShell]
+    priorities: List[Priority]
+    mutations: List[Mutation]
+    team_generation_options: TeamGenerationOptions
+    team_sets: Dict[bytes, PriorityTeamSet] = field(default_factory=dict)
+
+    def get_team_set(self, team_indices: np.ndarray) -> PriorityTeamSet:
+        """
+        Several mutations are usually applied to the same team set, so the team set (and the satisfactions of its
+            teams) is kept around and only the teams that a mutation changes are rescored
+        """
+        key = team_indices.tobytes()
+        if key not in self.team_sets:
+            if len(self.team_sets) >= _MAX_CACHED_TEAM_SETS:
+                del self.team_sets[next(iter(self.team_sets))]
+            team_set = PriorityAssignment(
+                team_shells=self.team_shells,
+                student_ids=self.roster.student_ids,
+                team_indices=team_indices,
+            ).to_priority_team_set()
+            team_set.calculate_score(self.priorities, self.roster)
+            self.team_sets[key] = team_set
+        return self.team_sets[key]
+
+
+_worker_state: Optional[_WorkerState] = None
+
+
+def can_start_worker_processes() -> bool:
+    """
+    Daemonic processes (e.g. the workers of a multiprocessing.Pool, which simulations run trials on) are not allowed
+        to have children, so a pool of worker processes can't be started from them
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def _initialize_worker(
+    roster: CompiledRoster,
+    team_shells: List[TeamShell],
+    priorities: List[Priority],
+    mutations: List[Mutation],
+    team_generation_options: TeamGenerationOptions,
+):
+    global _worker_state
+    # forked workers inherit the random state of the parent, and would otherwise all make the same mutations
+    random.seed()
+    np.random.seed()
+    _worker_state = _WorkerState(
+        roster=roster,
+        team_shells=team_shells,
+        priorities=priorities,
+        mutations=mutations,
+        team_generation_options=team_generation_options,
+    )
+
+
+def _mutate_and_score(
+    team_indices: np.ndarray, mutation_index: int, deadline: Optional[Deadline]
+) -> Tuple[np.ndarray, float]:
+    state = _worker_state
+    mutated_team_set = state.mutations[mutation_index].mutate_one(
+        state.get_team_set(team_indices).clone(),
+        state.priorities,
+        state.roster,
+        state.team_generation_options,
+        deadline,
+    )
+    score = mutated_team_set.calculate_score(state.priorities, state.roster)
+    assignment = PriorityAssignment.from_roster(
+        mutated_team_set.priority_teams, state.roster
+    )
+    return assignment.team_indices, score
+
+
+class ParallelMutator:
+    """
+    Mutates and scores team sets on a pool of worker processes.
+
+    The roster, priorities and mutations are sent to each worker once, when the pool starts. After that, team sets
+        are sent back and forth as the team_indices vector of a PriorityAssignment, along with their score.
+    Each mutated team set is its own task, so an iteration is split into MAX_KEEP * MAX_SPREAD tasks. Because of this,
+        mutate_one() is called directly and any override of Mutation.mutate() is not used.
+    It can only be used where can_start_worker_processes() is true.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        roster: CompiledRoster,
+        team_shells: List[TeamShell],
+        priorities: List[Priority],
+        mutations: List[Mutation],
+        team_generation_options: TeamGenerationOptions,
+    ):
+        self.num_workers = num_workers
+        self.roster = roster
+        self.team_shells = team_shells
+        self.mutations = mutations
+        self.executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_initialize_worker,
+            initargs=(
+                roster,
+                team_shells,
+                priorities,
+                mutations,
+                team_generation_options,
+            ),
+        )
+
+    def mutate(
+        self, team_sets: List[PriorityTeamSet], deadline: Optional[Deadline] = None
+    ) -> List[PriorityTeamSet]:
+        """
+        Returns the same mutated team sets (in the same order) as calling PriorityAlgorithm.mutate() on each of the
+            team sets, with their scores already calculated.
+        Every task is still run once the deadline has passed, but mutations that search through many possibilities
+            stop partway.
+        """
+        tasks = []
+        for team_set in team_sets:
+            team_indices = PriorityAssignment.from_roster(
+                team_set.priority_teams, self.roster
+            ).team_indices
+            for mutation_index, mutation in enumerate(self.mutations):
+                tasks += [
+                    (team_indices, mutation_index, deadline)
+                ] * mutation.num_mutations
+        if not tasks:
+            return []
+
+        # consecutive tasks mutate the same team set, so sending them to the same worker lets it reuse that team set
+        results = self.executor.map(
+            _mutate_and_score,
+            *zip(*tasks),
+            chunksize=math.ceil(len(tasks) / self.num_workers),
+        )
+
+        mutated_team_sets = []
+        for team_indices, score in results:
+            mutated_team_set = PriorityAssignment(
+                team_shells=self.team_shells,
+                student_ids=self.roster.student_ids,
+                team_indices=team_indices,
+            ).to_priority_team_set()
+            mutated_team_set.score = score
+            mutated_team_sets.append(mutated_team_set)
+        return mutated_team_sets
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self) -> "ParallelMutator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import List, TYPE_CHECKING
 
+import numpy as np
 from schema import Schema
 
+from algorithms.ai.priority_algorithm.priority.team_state import (
+    PriorityTeamState,
+    RescoringTeamState,
+)
 from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import TeamShell
 
+if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+    from algorithms.ai.priority_algorithm.roster import CompiledRoster
+
 
 @dataclass
 class Priority(ABC):
@@ -22,6 +31,42 @@ class Priority(ABC):
         # should always return a value in the range [0, 1]
         raise NotImplementedError
 
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        """
+        Same as satisfaction(), for the students at the given indices of a compiled roster.
+        Override this to calculate satisfaction from the roster's precomputed matrices instead of the students.
+        """
+        return self.satisfaction([roster.students[i] for i in indices], team_shell)
+
+    def satisfaction_by_team(
+        self, assignment: "PriorityAssignment", roster: "CompiledRoster"
+    ) -> np.ndarray:
+        """
+        The satisfaction of every team in the assignment, as a vector indexed by team.
+        Override this to score all teams at once with array operations over the assignment's team_indices.
+        """
+        return np.array(
+            [
+                self.satisfaction_from_indices(
+                    assignment.team_members(team_index), team_shell, roster
+                )
+                for team_index, team_shell in enumerate(assignment.team_shells)
+            ],
+            dtype=float,
+        )
+
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
+        """
+        Tracks the satisfaction of this priority by a team starting with the students at the given indices, as
+            students are added to and removed from it.
+        Override this to return a state that keeps running totals instead of rescoring the team.
+        """
+        return RescoringTeamState(self, indices, team_shell, roster)
+
     @staticmethod
     @abstractmethod
     def get_schema() -> Schema:
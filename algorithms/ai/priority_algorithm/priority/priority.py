@@ -1,15 +1,27 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
+import numpy as np
 from schema import And, Or, Schema
 
+from algorithms.ai.priority_algorithm.assignment import UNASSIGNED
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.priority.team_state import (
+    PriorityTeamState,
+    TokenizationTeamState,
+    DiversifyTeamState,
+    ConcentrateTeamState,
+    RequirementTeamState,
+    ProjectPreferenceTeamState,
+    SocialPreferenceTeamState,
+)
 from algorithms.ai.priority_algorithm.priority.utils import (
     infer_possible_values,
-    int_dot_product,
     student_attribute_binary_vector,
+    get_answer_counts,
+    get_relationship_total,
+    RELATIONSHIPS,
 )
-from algorithms.ai.weight_algorithm.utility.diversity_utility import _blau_index
 from algorithms.dataclasses.enums import (
     DiversifyType,
     TokenizationConstraintDirection,
@@ -22,6 +34,12 @@ from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import TeamShell
 from algorithms.utils.math import change_range
 
+if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+    from algorithms.ai.priority_algorithm.roster import CompiledRoster
+
+_TOKENIZATION_THETA = 0.2
+
 
 @dataclass
 class TokenizationPriority(Priority):
@@ -70,12 +88,46 @@ class TokenizationPriority(Priority):
                     i.e. score(num_tokenized_students == k - 1) >> score(num_tokenized_students == 1)
         """
         tokenized_student_count = 0
-        _THETA = 0.2
-
         for student in students:
             tokenized_student_count += self.value in student.attributes.get(
                 self.attribute_id, []
             )
+        return self.satisfaction_from_count(tokenized_student_count, len(students))
+
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        tokenized_student_count = int(
+            np.count_nonzero(
+                roster.attribute_value_mask(self.attribute_id, self.value)[indices]
+            )
+        )
+        return self.satisfaction_from_count(tokenized_student_count, len(indices))
+
+    def satisfaction_by_team(
+        self, assignment: "PriorityAssignment", roster: "CompiledRoster"
+    ) -> np.ndarray:
+        assigned = assignment.team_indices != UNASSIGNED
+        team_indices = assignment.team_indices[assigned]
+        is_tokenized = roster.attribute_value_mask(self.attribute_id, self.value)[
+            assigned
+        ]
+        tokenized_student_counts = np.bincount(
+            team_indices[is_tokenized], minlength=assignment.num_teams
+        )
+        team_sizes = np.bincount(team_indices, minlength=assignment.num_teams)
+        return self.satisfaction_from_counts(tokenized_student_counts, team_sizes)
+
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
+        return TokenizationTeamState(self, indices, team_shell, roster)
+
+    def satisfaction_from_count(
+        self, tokenized_student_count: int, team_size: int
+    ) -> float:
+        _THETA = _TOKENIZATION_THETA
+
         meets_threshold = self.student_count_meets_threshold(tokenized_student_count)
 
         if not meets_threshold:
@@ -84,7 +136,6 @@ class TokenizationPriority(Priority):
         if tokenized_student_count == self.threshold:
             return 1
 
-        team_size = len(students)
         if self.strategy == DiversifyType.DIVERSIFY:
             if tokenized_student_count == 0 or tokenized_student_count == team_size:
                 return _THETA
@@ -99,6 +150,34 @@ class TokenizationPriority(Priority):
                 tokenized_student_count - 1
             ) + _THETA
 
+    def satisfaction_from_counts(
+        self, tokenized_student_counts: np.ndarray, team_sizes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Same as satisfaction_from_count(), for many teams at once
+        """
+        _THETA = _TOKENIZATION_THETA
+        counts = tokenized_student_counts
+
+        if self.strategy == DiversifyType.DIVERSIFY:
+            meets_threshold = (counts == 0) | (counts >= self.threshold)
+            at_extremes = (counts == 0) | (counts == team_sizes)
+            # the slope is only used where threshold < count < team_size, so its denominator is never 0 there
+            slope_denominators = team_sizes - self.threshold - 1
+            slope_denominators[slope_denominators == 0] = 1
+            in_between = ((2 * _THETA - 1) / slope_denominators) * (
+                counts - team_sizes
+            ) + _THETA
+        else:
+            meets_threshold = counts <= self.threshold
+            at_extremes = (counts == 0) | (counts == 1)
+            slope_denominator = (self.threshold - 2) or 1
+            in_between = ((1 - 2 * _THETA) / slope_denominator) * (counts - 1) + _THETA
+
+        satisfactions = np.where(at_extremes, _THETA, in_between)
+        satisfactions = np.where(counts == self.threshold, 1.0, satisfactions)
+        return np.where(meets_threshold, satisfactions, 0.0)
+
     def student_count_meets_threshold(self, count: int) -> bool:
         if count == 0:
             return True
@@ -159,28 +238,98 @@ class DiversityPriority(Priority):
             possible_attribute_values = infer_possible_values(
                 students, self.attribute_id
             )
-            dot_products = []  # will have length of (num students)choose(2)
-            for student_i in students:
-                for student_j in students:
-                    if student_i.id == student_j.id:
-                        break
-                    dot_product = int_dot_product(
-                        student_attribute_binary_vector(
-                            student_i, self.attribute_id, possible_attribute_values
-                        ),
-                        student_attribute_binary_vector(
-                            student_j, self.attribute_id, possible_attribute_values
-                        ),
+            attribute_matrix = np.array(
+                [
+                    student_attribute_binary_vector(
+                        student, self.attribute_id, possible_attribute_values
                     )
-                    dot_products.append(dot_product)
+                    for student in students
+                ],
+                dtype=np.int64,
+            ).reshape(len(students), len(possible_attribute_values))
+            return self.concentration_satisfaction(attribute_matrix)
+
+        if self.strategy == DiversifyType.DIVERSIFY:
+            answer_counts, scale = get_answer_counts(students, self.attribute_id)
+            return self.diversity_satisfaction(answer_counts, len(students), scale)
+
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        if self.strategy == DiversifyType.DIVERSIFY:
+            answer_counts = roster.answer_weights(self.attribute_id)[indices].sum(
+                axis=0
+            )
+            return self.diversity_satisfaction(
+                answer_counts.tolist(),
+                len(indices),
+                roster.answer_weight_scale(self.attribute_id),
+            )
 
-            if len(dot_products) == 0:
+        if self.strategy == DiversifyType.CONCENTRATE:
+            if len(indices) == 0:
                 return 0
+            if not roster.students_with_attribute(self.attribute_id)[indices].all():
+                raise ValueError(
+                    f"Student does not have attribute with id {self.attribute_id}"
+                )
+            return self.concentration_satisfaction(
+                roster.attribute_submatrix(self.attribute_id)[indices]
+            )
 
-            return sum(dot_products) / (len(dot_products) * self.max_num_choices)
+        return super().satisfaction_from_indices(indices, team_shell, roster)
 
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
         if self.strategy == DiversifyType.DIVERSIFY:
-            return _blau_index(students, self.attribute_id)
+            return DiversifyTeamState(self, indices, team_shell, roster)
+        if self.strategy == DiversifyType.CONCENTRATE:
+            return ConcentrateTeamState(self, indices, team_shell, roster)
+        return super().team_state(indices, team_shell, roster)
+
+    def concentration_satisfaction(self, attribute_matrix: np.ndarray) -> float:
+        """
+        attribute_matrix is the (students x values) one-hot matrix of a team's answers to the attribute.
+
+        Entry [i][j] of its Gram matrix (attribute_matrix @ attribute_matrix.T) is the dot product of the answers of
+            students i and j, so the sum of its upper triangle is the total over every pair of students. That sum is
+            calculated here without building the Gram matrix, as half of (the sum of the whole matrix - its trace).
+        """
+        # the sum of a Gram matrix is the squared norm of the column sums, and its trace is the sum of squared entries
+        return self.concentration_satisfaction_from_counts(
+            attribute_matrix.sum(axis=0),
+            int(np.sum(attribute_matrix**2)),
+            attribute_matrix.shape[0],
+        )
+
+    def concentration_satisfaction_from_counts(
+        self, value_counts: np.ndarray, num_answers: int, num_students: int
+    ) -> float:
+        """
+        Same as concentration_satisfaction(), from the number of students with each value (the column sums of the
+            one-hot matrix) and the total number of answers (its number of ones)
+        """
+        num_pairs = num_students * (num_students - 1) // 2
+        if num_pairs == 0:
+            return 0
+
+        pairwise_dot_product_sum = (int(value_counts @ value_counts) - num_answers) // 2
+        return pairwise_dot_product_sum / (num_pairs * self.max_num_choices)
+
+    def diversity_satisfaction(
+        self, answer_counts: List[int], num_students: int, scale: int
+    ) -> float:
+        """
+        The blau index of a team, from how often each answer is given by its students in units of 1 / scale (see
+            get_answer_counts()).
+        It is calculated with integers and rounded once at the end, so it is the same however the counts were
+            found, whatever order the students are in.
+        """
+        if num_students == 0:
+            return 1
+        total = (num_students * scale) ** 2
+        return (total - sum(count * count for count in answer_counts)) / total
 
     @staticmethod
     def get_schema() -> Schema:
@@ -211,6 +360,48 @@ class RequirementPriority(Priority):
 
         return total_requirement_satisfaction / num_team_requirements
 
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        num_team_requirements = len(team_shell.requirements)
+        if num_team_requirements <= 0:
+            return 1
+
+        nums_meeting_requirement = np.count_nonzero(
+            roster.requirement_matrix(team_shell.requirements)[:, indices], axis=1
+        ).tolist()
+        return self.satisfaction_from_nums_meeting_requirement(
+            nums_meeting_requirement, len(indices), team_shell
+        )
+
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
+        return RequirementTeamState(self, indices, team_shell, roster)
+
+    def satisfaction_from_nums_meeting_requirement(
+        self,
+        nums_meeting_requirement: List[int],
+        num_students: int,
+        team_shell: TeamShell,
+    ) -> float:
+        """
+        nums_meeting_requirement[i] is how many students on the team meet the i-th requirement of the team shell
+        """
+        num_team_requirements = len(team_shell.requirements)
+        if num_team_requirements <= 0:
+            return 1
+
+        total_requirement_satisfaction = 0
+        for req, num_meeting_requirement in zip(
+            team_shell.requirements, nums_meeting_requirement
+        ):
+            total_requirement_satisfaction += req.satisfaction_by_num_members(
+                num_meeting_requirement, num_students
+            )
+
+        return total_requirement_satisfaction / num_team_requirements
+
     @staticmethod
     def get_schema() -> Schema:
         return Schema(
@@ -231,13 +422,31 @@ class ProjectPreferencePriority(Priority):
         super().validate()
 
     def satisfaction(self, students: List[Student], team_shell: TeamShell) -> float:
-        max_satisfaction_score = len(students) * self.max_project_preferences
         satisfaction_score = 0
         for student in students:
             for index, preference in enumerate(student.project_preferences):
                 if preference == team_shell.project_id:
                     satisfaction_score += self.max_project_preferences - index
 
+        return self.satisfaction_from_score(satisfaction_score, len(students))
+
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        satisfaction_score = int(
+            roster.project_preference_scores(
+                team_shell.project_id, self.max_project_preferences
+            )[indices].sum()
+        )
+        return self.satisfaction_from_score(satisfaction_score, len(indices))
+
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
+        return ProjectPreferenceTeamState(self, indices, team_shell, roster)
+
+    def satisfaction_from_score(self, satisfaction_score: int, team_size: int) -> float:
+        max_satisfaction_score = team_size * self.max_project_preferences
         if self.direction == PreferenceDirection.EXCLUDE:
             return (
                 max_satisfaction_score - satisfaction_score
@@ -266,22 +475,68 @@ class SocialPreferencePriority(Priority):
 
     def satisfaction(self, students: List[Student], team_shell: TeamShell) -> float:
         num_students = len(students)
-        student_ids = [s.id for s in students]
-        # bidirectional friendship for all team members
-        theoretical_min = (
-            num_students * self.max_num_friends * Relationship.FRIEND.value
-        )
-        # bidirectional enemies for all team members
-        theoretical_max = num_students * self.max_num_enemies * Relationship.ENEMY.value
+        student_ids = {s.id for s in students}
 
-        total = 0
+        relationship_counts = [0] * len(RELATIONSHIPS)
         for student in students:
             for relation_student_id, relationship in student.relationships.items():
                 if (
                     relation_student_id in student_ids
                     and relation_student_id != student.id
                 ):
-                    total += relationship.value
+                    relationship_counts[RELATIONSHIPS.index(relationship)] += 1
+
+        return self.satisfaction_from_total(
+            get_relationship_total(relationship_counts), num_students
+        )
+
+    def satisfaction_from_indices(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> float:
+        return self.satisfaction_from_total(
+            get_relationship_total(roster.relationship_counts(indices)), len(indices)
+        )
+
+    def satisfaction_by_team(
+        self, assignment: "PriorityAssignment", roster: "CompiledRoster"
+    ) -> np.ndarray:
+        source_teams = assignment.team_indices[roster.relationship_sources]
+        neighbor_teams = assignment.team_indices[roster.relationship_neighbors]
+        within_team = (source_teams == neighbor_teams) & (source_teams != UNASSIGNED)
+        # relationship_counts[team][kind] is how many relationships of the kind there are within the team
+        relationship_counts = np.bincount(
+            source_teams[within_team] * len(RELATIONSHIPS)
+            + roster.relationship_kinds[within_team],
+            minlength=assignment.num_teams * len(RELATIONSHIPS),
+        ).reshape(assignment.num_teams, len(RELATIONSHIPS))
+        team_sizes = assignment.team_sizes()
+        return np.array(
+            [
+                self.satisfaction_from_total(
+                    get_relationship_total(team_relationship_counts), team_size
+                )
+                for team_relationship_counts, team_size in zip(
+                    relationship_counts.tolist(), team_sizes.tolist()
+                )
+            ],
+            dtype=float,
+        )
+
+    def team_state(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ) -> PriorityTeamState:
+        return SocialPreferenceTeamState(self, indices, team_shell, roster)
+
+    def satisfaction_from_total(self, total: float, num_students: int) -> float:
+        """
+        total is the sum of the values of every relationship team members have with each other
+        """
+        # bidirectional friendship for all team members
+        theoretical_min = (
+            num_students * self.max_num_friends * Relationship.FRIEND.value
+        )
+        # bidirectional enemies for all team members
+        theoretical_max = num_students * self.max_num_enemies * Relationship.ENEMY.value
 
         # subtract the total from 1 because FRIEND is a negative number, meaning the closer we are to the theoretical
         # min, the better for social satisfaction
@@ -0,0 +1,319 @@
+from abc import ABC, abstractmethod
+from typing import List, TYPE_CHECKING
+
+import numpy as np
+
+from algorithms.ai.priority_algorithm.priority.utils import (
+    get_relationship_total,
+    RELATIONSHIPS,
+)
+from algorithms.dataclasses.enums import PreferenceDirection
+from algorithms.dataclasses.team import TeamShell
+
+if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+    from algorithms.ai.priority_algorithm.priority.priority import (
+        TokenizationPriority,
+        DiversityPriority,
+        RequirementPriority,
+        ProjectPreferencePriority,
+        SocialPreferencePriority,
+    )
+    from algorithms.ai.priority_algorithm.roster import CompiledRoster
+
+
+class PriorityTeamState(ABC):
+    """
+    How satisfied a priority is by a team whose students change one at a time.
+
+    Rather than rescoring the whole team every time a student is added or removed, states keep running totals of
+        whatever their priority's satisfaction is calculated from (e.g. the number of tokenized students), so that
+        moving a student only costs updating those totals.
+    Students are referred to by their index in the compiled roster.
+    """
+
+    def __init__(
+        self, indices: np.ndarray, team_shell: TeamShell, roster: "CompiledRoster"
+    ):
+        self.team_shell = team_shell
+        self.roster = roster
+        self.size = 0
+        for index in indices:
+            self.add(index)
+
+    def add(self, index: int):
+        self.size += 1
+        self._update(index, 1)
+
+    def remove(self, index: int):
+        self.size -= 1
+        self._update(index, -1)
+
+    @abstractmethod
+    def _update(self, index: int, sign: int):
+        """
+        Updates the running totals when the student at index is added (sign == 1) or removed (sign == -1)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def satisfaction(self) -> float:
+        raise NotImplementedError
+
+    def satisfaction_upper_bound(
+        self, candidates: np.ndarray, num_to_add: int
+    ) -> float:
+        """
+        An upper bound on the satisfaction the team can reach once num_to_add of the candidate students are added to
+            it, used to rule out ways of filling the team without trying them.
+        Override this where a tighter bound is cheap to find. Satisfactions are never above 1.
+        """
+        return 1
+
+
+class RescoringTeamState(PriorityTeamState):
+    """
+    For priorities without running totals, rescores the whole team whenever its satisfaction is needed
+    """
+
+    def __init__(
+        self,
+        priority: "Priority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.members: List[int] = []
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        if sign > 0:
+            self.members.append(index)
+        else:
+            self.members.remove(index)
+
+    def satisfaction(self) -> float:
+        return self.priority.satisfaction_from_indices(
+            np.array(self.members, dtype=np.int64), self.team_shell, self.roster
+        )
+
+
+class TokenizationTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "TokenizationPriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.is_tokenized = roster.attribute_value_mask(
+            priority.attribute_id, priority.value
+        )
+        self.tokenized_student_count = 0
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        if self.is_tokenized[index]:
+            self.tokenized_student_count += sign
+
+    def satisfaction(self) -> float:
+        return self.priority.satisfaction_from_count(
+            self.tokenized_student_count, self.size
+        )
+
+    def satisfaction_upper_bound(
+        self, candidates: np.ndarray, num_to_add: int
+    ) -> float:
+        num_tokenized_candidates = int(np.count_nonzero(self.is_tokenized[candidates]))
+        num_other_candidates = len(candidates) - num_tokenized_candidates
+        team_size = self.size + num_to_add
+        return max(
+            self.priority.satisfaction_from_count(tokenized_student_count, team_size)
+            for tokenized_student_count in range(
+                self.tokenized_student_count
+                + max(num_to_add - num_other_candidates, 0),
+                self.tokenized_student_count
+                + min(num_to_add, num_tokenized_candidates)
+                + 1,
+            )
+        )
+
+
+class DiversifyTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "DiversityPriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        # integer multiples of 1 / scale, so that adding and removing students never drifts from the counts the team
+        #   would be scored from (see DiversityPriority.diversity_satisfaction())
+        self.answer_weights = roster.answer_weights(priority.attribute_id)
+        self.scale = roster.answer_weight_scale(priority.attribute_id)
+        self.answer_counts = np.zeros(self.answer_weights.shape[1], dtype=np.int64)
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        if sign > 0:
+            self.answer_counts += self.answer_weights[index]
+        else:
+            self.answer_counts -= self.answer_weights[index]
+
+    def satisfaction(self) -> float:
+        return self.priority.diversity_satisfaction(
+            self.answer_counts.tolist(), self.size, self.scale
+        )
+
+
+class ConcentrateTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "DiversityPriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.attribute_matrix = roster.attribute_submatrix(priority.attribute_id)
+        self.has_attribute = roster.students_with_attribute(priority.attribute_id)
+        self.value_counts = np.zeros(self.attribute_matrix.shape[1], dtype=np.int64)
+        self.num_answers = 0
+        self.num_students_without_attribute = 0
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        answers = self.attribute_matrix[index]
+        if sign > 0:
+            self.value_counts += answers
+        else:
+            self.value_counts -= answers
+        self.num_answers += sign * int(answers.sum())
+        if not self.has_attribute[index]:
+            self.num_students_without_attribute += sign
+
+    def satisfaction(self) -> float:
+        if self.size == 0:
+            return 0
+        if self.num_students_without_attribute > 0:
+            raise ValueError(
+                f"Student does not have attribute with id {self.priority.attribute_id}"
+            )
+        return self.priority.concentration_satisfaction_from_counts(
+            self.value_counts, self.num_answers, self.size
+        )
+
+
+class RequirementTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "RequirementPriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.requirements_met = roster.requirement_matrix(team_shell.requirements)
+        self.nums_meeting_requirement = np.zeros(
+            len(team_shell.requirements), dtype=np.int64
+        )
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        if sign > 0:
+            self.nums_meeting_requirement += self.requirements_met[:, index]
+        else:
+            self.nums_meeting_requirement -= self.requirements_met[:, index]
+
+    def satisfaction(self) -> float:
+        return self.priority.satisfaction_from_nums_meeting_requirement(
+            self.nums_meeting_requirement.tolist(), self.size, self.team_shell
+        )
+
+    def satisfaction_upper_bound(
+        self, candidates: np.ndarray, num_to_add: int
+    ) -> float:
+        # a requirement is never less satisfied by more of the team meeting it, so the bound is reached when as many
+        #   candidates who meet each requirement as possible are added
+        max_nums_meeting_requirement = self.nums_meeting_requirement + np.minimum(
+            np.count_nonzero(self.requirements_met[:, candidates], axis=1), num_to_add
+        )
+        return self.priority.satisfaction_from_nums_meeting_requirement(
+            max_nums_meeting_requirement.tolist(),
+            self.size + num_to_add,
+            self.team_shell,
+        )
+
+
+class ProjectPreferenceTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "ProjectPreferencePriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.preference_scores = roster.project_preference_scores(
+            team_shell.project_id, priority.max_project_preferences
+        )
+        self.satisfaction_score = 0
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        self.satisfaction_score += sign * int(self.preference_scores[index])
+
+    def satisfaction(self) -> float:
+        return self.priority.satisfaction_from_score(self.satisfaction_score, self.size)
+
+    def satisfaction_upper_bound(
+        self, candidates: np.ndarray, num_to_add: int
+    ) -> float:
+        team_size = self.size + num_to_add
+        if team_size * self.priority.max_project_preferences == 0:
+            return 1
+        # the satisfaction only depends on the total score, so the bound is reached by the candidates with the
+        #   highest (or lowest, when excluding) scores
+        candidate_scores = np.sort(self.preference_scores[candidates])
+        if self.priority.direction == PreferenceDirection.EXCLUDE:
+            added_score = candidate_scores[:num_to_add].sum()
+        else:
+            added_score = candidate_scores[len(candidate_scores) - num_to_add :].sum()
+        return self.priority.satisfaction_from_score(
+            self.satisfaction_score + int(added_score), team_size
+        )
+
+
+class SocialPreferenceTeamState(PriorityTeamState):
+    def __init__(
+        self,
+        priority: "SocialPreferencePriority",
+        indices: np.ndarray,
+        team_shell: TeamShell,
+        roster: "CompiledRoster",
+    ):
+        self.priority = priority
+        self.members: List[int] = []
+        # counted rather than summed, so that adding and removing students never drifts from the total the team would
+        #   be scored from (see get_relationship_total())
+        self.relationship_counts = np.zeros(len(RELATIONSHIPS), dtype=np.int64)
+        super().__init__(indices, team_shell, roster)
+
+    def _update(self, index: int, sign: int):
+        if sign < 0:
+            self.members.remove(index)
+        # relationships in both directions between the student and the rest of the team
+        self.relationship_counts += sign * (
+            self.roster.relationship_counts_between([index], self.members)
+            + self.roster.relationship_counts_between(self.members, [index])
+        )
+        if sign > 0:
+            self.members.append(index)
+
+    def satisfaction(self) -> float:
+        return self.priority.satisfaction_from_total(
+            get_relationship_total(self.relationship_counts), self.size
+        )
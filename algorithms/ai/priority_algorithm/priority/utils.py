@@ -1,7 +1,12 @@
-from typing import List
+import math
+from typing import List, Dict, Tuple
 
+from algorithms.dataclasses.enums import Relationship
 from algorithms.dataclasses.student import Student
 
+# the kinds of relationship, in the order relationships are counted in by get_relationship_total()
+RELATIONSHIPS = list(Relationship)
+
 
 def student_attribute_binary_vector(
     student: Student, attribute_id: int, possible_values: List[int]
@@ -40,3 +45,48 @@ def infer_possible_values(students: List[Student], attribute_id: int) -> List[in
             possible_values.add(value)
 
     return list(possible_values)
+
+
+def get_answer_weight_scale(answer_sets: List[List[int]]) -> int:
+    """
+    The least common multiple of how many answers each student gave, so that the fraction of a student's answers
+        that each answer makes up (as counted by the blau index) is a whole multiple of 1 / scale
+    """
+    return math.lcm(*[len(answer_set) for answer_set in answer_sets if answer_set])
+
+
+def get_answer_weight(answer_set: List[int], scale: int) -> int:
+    """
+    How much a student with the given answers contributes to the frequency of each of their answers, in units of
+        1 / scale (see get_answer_weight_scale())
+    """
+    return scale // len(answer_set) if len(answer_set) > 1 else scale
+
+
+def get_answer_counts(
+    students: List[Student], attribute_id: int
+) -> Tuple[List[int], int]:
+    """
+    How often each answer to the attribute is given by the students, in units of 1 / scale, and the scale.
+    Students with multiple answers contribute a fraction to each of their answers.
+    """
+    answer_sets = [student.attributes.get(attribute_id, []) for student in students]
+    scale = get_answer_weight_scale(answer_sets)
+    answer_counts: Dict[int, int] = {}
+    for answer_set in answer_sets:
+        weight = get_answer_weight(answer_set, scale)
+        for answer in answer_set:
+            answer_counts[answer] = answer_counts.get(answer, 0) + weight
+    return list(answer_counts.values()), scale
+
+
+def get_relationship_total(relationship_counts: List[int]) -> float:
+    """
+    The sum of the values of some relationships, from how many of them are of each kind in RELATIONSHIPS.
+    Relationship values aren't all whole numbers, so adding them up one at a time gives a total that depends on the
+        order they were added in. Totals calculated from counts are the same however the relationships were found.
+    """
+    total = 0
+    for relationship, count in zip(RELATIONSHIPS, relationship_counts):
+        total += int(count) * relationship.value
+    return total
@@ -1,5 +1,5 @@
 import time
-from typing import cast, Dict, List
+from typing import cast, Dict, List, Optional
 
 from algorithms.ai.interfaces.algorithm import Algorithm
 from algorithms.ai.interfaces.algorithm_config import (
@@ -15,6 +15,16 @@ from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
 )
+from algorithms.ai.priority_algorithm.deadline import Deadline
+from algorithms.ai.priority_algorithm.greedy_start import generate_greedy_team_set
+from algorithms.ai.priority_algorithm.mutation_scheduler import MutationScheduler
+from algorithms.ai.priority_algorithm.parallel_mutator import (
+    ParallelMutator,
+    can_start_worker_processes,
+)
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.ai.priority_algorithm.scoring import get_max_score
+from algorithms.ai.priority_algorithm.trace import PriorityAlgorithmTrace
 from algorithms.ai.random_algorithm.random_algorithm import RandomAlgorithm
 from algorithms.ai.utils import save_students_to_team
 from algorithms.ai.weight_algorithm.weight_algorithm import WeightAlgorithm
@@ -37,6 +47,17 @@ class PriorityAlgorithm(Algorithm):
             self.algorithm_config = PriorityAlgorithmConfig()
 
         self.student_dict: Dict[int, Student] = {}
+        # kept between calls to search() so that what it has measured about the mutations isn't lost
+        self.mutation_scheduler: Optional[MutationScheduler] = None
+        if self.algorithm_config.ADAPTIVE_MUTATIONS:
+            self.mutation_scheduler = MutationScheduler(
+                self.algorithm_config.MUTATIONS, self.algorithm_config.MAX_SPREAD
+            )
+        self.trace: Optional[PriorityAlgorithmTrace] = None
+        if self.algorithm_config.TRACE:
+            self.trace = PriorityAlgorithmTrace()
+        # how many iterations the last call to search() ran, which is fewer than max_iterations when it stopped early
+        self.num_search_iterations = 0
 
     def generate_initial_team_set(
         self,
@@ -48,12 +69,31 @@ class PriorityAlgorithm(Algorithm):
                 team_generation_options=self.team_generation_options,
             ).generate(students)
         elif self.algorithm_config.START_TYPE == PriorityAlgorithmStartType.WEIGHT:
-            team_set = WeightAlgorithm(
+            weight_algorithm = WeightAlgorithm(
                 algorithm_options=weight_options_from_priority_options(
                     self.algorithm_options
                 ),
                 team_generation_options=self.team_generation_options,
-            ).generate(students)
+            )
+            weight_algorithm.prepare(students)
+            team_set = weight_algorithm.generate(students)
+        elif self.algorithm_config.START_TYPE == PriorityAlgorithmStartType.GREEDY:
+            roster = (
+                self.student_dict
+                if isinstance(self.student_dict, CompiledRoster)
+                else CompiledRoster(students)
+            )
+            return generate_greedy_team_set(
+                team_shells=[
+                    team.to_shell()
+                    for team in Algorithm.create_initial_teams(
+                        self.team_generation_options
+                    )
+                ],
+                priorities=self.algorithm_options.priorities,
+                roster=roster,
+                max_team_size=self.team_generation_options.max_team_size,
+            )
         else:
             # This shouldn't trigger unless user intentionally sets it to None because the config has a default value set
             raise ValueError("Priority algorithm start type must be set")
@@ -69,33 +109,146 @@ class PriorityAlgorithm(Algorithm):
         )
 
     def generate(self, students: List[Student]) -> TeamSet:
-        self.student_dict = create_student_dict(students)
+        # compiled once so that scoring doesn't have to walk each student's attributes every time a team is scored
+        self.student_dict = CompiledRoster(students)
 
         start_time = time.time()
-        iteration = 0
         team_sets = [self.generate_initial_team_set(students)]
-
-        while (
-            time.time() - start_time < self.algorithm_config.MAX_TIME
-            and iteration < self.algorithm_config.MAX_ITERATE
-        ):
-            new_team_sets: List[PriorityTeamSet] = []
-            for team_set in team_sets:
-                new_team_sets += self.mutate(team_set)
-            team_sets = new_team_sets + team_sets
-            team_sets = sorted(
-                team_sets,
-                key=lambda ts: ts.calculate_score(
-                    self.algorithm_options.priorities, self.student_dict
-                ),
-                reverse=True,
-            )
-            team_sets = team_sets[: self.algorithm_config.MAX_KEEP]
-            iteration += 1
+        team_sets = self.search(
+            team_sets,
+            max_iterations=self.algorithm_config.MAX_ITERATE,
+            end_time=start_time + self.algorithm_config.MAX_TIME,
+        )
 
         # the first team set is the "best" one
         return self._unpack_priority_team_set(team_sets[0])
 
+    def search(
+        self,
+        team_sets: List[PriorityTeamSet],
+        max_iterations: int,
+        end_time: float,
+    ) -> List[PriorityTeamSet]:
+        """
+        Runs the beam search from the given team sets for at most max_iterations, or until end_time (as given by
+            time.time()) passes, or until the search has converged. Returns the kept team sets, best first.
+        """
+        # mutations stop partway through once end_time passes, so that the search returns on time
+        deadline = Deadline(end_time)
+        iteration = 0
+        best_score = max(
+            team_set.calculate_score(
+                self.algorithm_options.priorities, self.student_dict
+            )
+            for team_set in team_sets
+        )
+        num_stagnant_iterations = 0
+        memo = None
+        if self.trace is not None:
+            if not self.trace.best_scores:
+                self.trace.best_scores.append(best_score)
+            if isinstance(self.student_dict, CompiledRoster):
+                memo = self.student_dict.satisfaction_memo(
+                    self.algorithm_options.priorities
+                )
+                num_memo_hits, num_memo_puts = memo.num_hits, memo.num_puts
+        parallel_mutator = None
+        # when this process can't have worker processes of its own (e.g. when running a simulation's trials), team
+        #   sets are mutated here as though NUM_WORKERS was 1
+        if self.algorithm_config.NUM_WORKERS > 1 and can_start_worker_processes():
+            parallel_mutator = ParallelMutator(
+                num_workers=self.algorithm_config.NUM_WORKERS,
+                roster=self.student_dict,
+                team_shells=[
+                    priority_team.team_shell
+                    for priority_team in team_sets[0].priority_teams
+                ],
+                priorities=self.algorithm_options.priorities,
+                mutations=self.algorithm_config.MUTATIONS,
+                team_generation_options=self.team_generation_options,
+            )
+
+        try:
+            while (
+                not deadline.has_passed()
+                and iteration < max_iterations
+                and not self.has_converged(best_score, num_stagnant_iterations)
+            ):
+                iteration_start_time = time.time()
+                new_team_sets: List[PriorityTeamSet] = []
+                if parallel_mutator:
+                    new_team_sets = parallel_mutator.mutate(team_sets, deadline)
+                elif self.mutation_scheduler:
+                    allocation = self.mutation_scheduler.allocate()
+                    for team_set in team_sets:
+                        if deadline.has_passed():
+                            break
+                        new_team_sets += self.mutate_adaptively(
+                            team_set, allocation, deadline
+                        )
+                    self.mutation_scheduler.end_iteration()
+                else:
+                    for team_set in team_sets:
+                        if deadline.has_passed():
+                            break
+                        new_team_sets += self.mutate(team_set, deadline)
+                team_sets = self.remove_duplicates(new_team_sets + team_sets)
+                team_sets = sorted(
+                    team_sets,
+                    key=lambda ts: ts.calculate_score(
+                        self.algorithm_options.priorities, self.student_dict
+                    ),
+                    reverse=True,
+                )
+                team_sets = team_sets[: self.algorithm_config.MAX_KEEP]
+                iteration += 1
+
+                if team_sets[0].score > best_score:
+                    best_score = team_sets[0].score
+                    num_stagnant_iterations = 0
+                else:
+                    num_stagnant_iterations += 1
+
+                if self.trace is not None:
+                    self.trace.end_iteration(
+                        team_sets, best_score, time.time() - iteration_start_time
+                    )
+        finally:
+            if parallel_mutator:
+                parallel_mutator.shutdown()
+            if memo is not None:
+                self.trace.num_memo_hits += memo.num_hits - num_memo_hits
+                self.trace.num_team_scorings += memo.num_puts - num_memo_puts
+
+        self.num_search_iterations = iteration
+        return team_sets
+
+    @staticmethod
+    def remove_duplicates(team_sets: List[PriorityTeamSet]) -> List[PriorityTeamSet]:
+        """
+        Keeps the first of the team sets that assign students to teams the same way, so that the kept team sets are
+            not filled up by copies of one team set (e.g. when a mutation couldn't change it)
+        """
+        fingerprints = set()
+        unique_team_sets = []
+        for team_set in team_sets:
+            fingerprint = team_set.fingerprint()
+            if fingerprint not in fingerprints:
+                fingerprints.add(fingerprint)
+                unique_team_sets.append(team_set)
+        return unique_team_sets
+
+    def has_converged(self, best_score: float, num_stagnant_iterations: int) -> bool:
+        if self.algorithm_config.STOP_AT_MAX_SCORE and best_score >= get_max_score(
+            self.algorithm_options.priorities
+        ):
+            return True
+        max_stagnant_iterations = self.algorithm_config.MAX_STAGNANT_ITERATIONS
+        return (
+            max_stagnant_iterations is not None
+            and num_stagnant_iterations >= max_stagnant_iterations
+        )
+
     def _unpack_priority_team_set(self, priority_team_set: PriorityTeamSet) -> TeamSet:
         teams: List[Team] = []
 
@@ -106,7 +259,7 @@ class PriorityAlgorithm(Algorithm):
         for priority_team in priority_team_set.priority_teams:
             students = [
                 self.student_dict[student_id]
-                for student_id in priority_team.student_ids
+                for student_id in priority_team.student_ids_view
             ]
             team = Team.from_shell(priority_team.team_shell)
             save_students_to_team(team, students)
@@ -117,17 +270,80 @@ class PriorityAlgorithm(Algorithm):
     def mutate(
         self,
         team_set: PriorityTeamSet,
+        deadline: Optional[Deadline] = None,
     ) -> List[PriorityTeamSet]:
-        return [
-            mutated_set
-            for mutation in self.algorithm_config.MUTATIONS
-            for mutated_set in mutation.mutate(
+        if self.trace is None:
+            return [
+                mutated_set
+                for mutation in self.algorithm_config.MUTATIONS
+                for mutated_set in mutation.mutate(
+                    team_set,
+                    self.algorithm_options.priorities,
+                    self.student_dict,
+                    self.team_generation_options,
+                    deadline,
+                )
+            ]
+
+        priorities = self.algorithm_options.priorities
+        score = team_set.calculate_score(priorities, self.student_dict)
+        mutated_team_sets = []
+        for mutation in self.algorithm_config.MUTATIONS:
+            start_time = time.process_time()
+            mutated_sets = mutation.mutate(
                 team_set,
-                self.algorithm_options.priorities,
+                priorities,
                 self.student_dict,
                 self.team_generation_options,
+                deadline,
+            )
+            for mutated_set in mutated_sets:
+                mutated_set.calculate_score(priorities, self.student_dict)
+            self.trace.record_mutation(
+                mutation, score, mutated_sets, time.process_time() - start_time
             )
-        ]
+            mutated_team_sets += mutated_sets
+        return mutated_team_sets
+
+    def mutate_adaptively(
+        self,
+        team_set: PriorityTeamSet,
+        allocation: List[int],
+        deadline: Deadline,
+    ) -> List[PriorityTeamSet]:
+        """
+        Makes allocation[i] team sets with the i-th mutation, and records how much each one improved the score and
+            how much CPU time it took (including scoring the mutated team set) in the mutation scheduler.
+        Like ParallelMutator, this calls mutate_one() directly, so any override of Mutation.mutate() is not used.
+        """
+        priorities = self.algorithm_options.priorities
+        score = team_set.calculate_score(priorities, self.student_dict)
+        mutated_team_sets = []
+        for mutation_index, mutation in enumerate(self.algorithm_config.MUTATIONS):
+            for _ in range(allocation[mutation_index]):
+                if deadline.has_passed():
+                    return mutated_team_sets
+                start_time = time.process_time()
+                mutated_team_set = mutation.mutate_one(
+                    team_set.clone(),
+                    priorities,
+                    self.student_dict,
+                    self.team_generation_options,
+                    deadline,
+                )
+                mutated_score = mutated_team_set.calculate_score(
+                    priorities, self.student_dict
+                )
+                cpu_time = time.process_time() - start_time
+                self.mutation_scheduler.record(
+                    mutation_index, max(mutated_score - score, 0), cpu_time
+                )
+                if self.trace is not None:
+                    self.trace.record_mutation(
+                        mutation, score, [mutated_team_set], cpu_time
+                    )
+                mutated_team_sets.append(mutated_team_set)
+        return mutated_team_sets
 
 
 def create_student_dict(students: List[Student]) -> Dict[int, Student]:
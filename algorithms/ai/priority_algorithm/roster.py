@@ -0,0 +1,390 @@
+from collections import OrderedDict
+from typing import (
+    List,
+    Dict,
+    Tuple,
+    Iterable,
+    Optional,
+    Sequence,
+    FrozenSet,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from algorithms.ai.priority_algorithm.fingerprint import team_fingerprint
+from algorithms.ai.priority_algorithm.priority.utils import (
+    get_answer_weight,
+    get_answer_weight_scale,
+    RELATIONSHIPS,
+)
+from algorithms.dataclasses.project import ProjectRequirement
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+
+if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+
+# the most team compositions whose satisfactions are remembered for a set of priorities during a run
+SATISFACTION_MEMO_SIZE = 20000
+
+
+class SatisfactionMemo:
+    """
+    A bounded LRU cache of the satisfaction of each priority by a team, keyed by the team's shell and the fingerprint
+        of the set of students on it. Team sets in the beam share most of their teams, so the same team compositions are scored
+        over and over by different team sets.
+    The set of students is kept with each team's satisfactions, so that a different team whose students happen to
+        have the same fingerprint is never given them.
+    """
+
+    def __init__(
+        self, priorities: Tuple["Priority", ...], max_size: int = SATISFACTION_MEMO_SIZE
+    ):
+        # the priorities are kept to make sure their ids (used to find this memo) are not reused while it exists
+        self.priorities = priorities
+        self.max_size = max_size
+        self._satisfactions: "OrderedDict[Tuple[int, int], Tuple[TeamShell, FrozenSet[int], List[float]]]" = (
+            OrderedDict()
+        )
+        # how many lookups found the team's satisfactions, and how many teams' satisfactions were calculated and put here
+        self.num_hits = 0
+        self.num_puts = 0
+
+    def get(
+        self,
+        team_shell: TeamShell,
+        student_ids: Sequence[int],
+        fingerprint: Optional[int] = None,
+    ) -> Optional[List[float]]:
+        """
+        The fingerprint of the team's students (see fingerprint.team_fingerprint()) can be given if it is already
+            known, and is otherwise found from the student ids
+        """
+        key = self._key(team_shell, student_ids, fingerprint)
+        entry = self._satisfactions.get(key)
+        if entry is None or not _same_students(entry[1], student_ids):
+            return None
+        self.num_hits += 1
+        self._satisfactions.move_to_end(key)
+        return entry[2]
+
+    def put(
+        self,
+        team_shell: TeamShell,
+        student_ids: Sequence[int],
+        satisfactions: List[float],
+        fingerprint: Optional[int] = None,
+    ):
+        self.num_puts += 1
+        # the team shell is kept for the same reason as the priorities are
+        self._satisfactions[self._key(team_shell, student_ids, fingerprint)] = (
+            team_shell,
+            frozenset(student_ids),
+            satisfactions,
+        )
+        if len(self._satisfactions) > self.max_size:
+            self._satisfactions.popitem(last=False)
+
+    @staticmethod
+    def _key(
+        team_shell: TeamShell, student_ids: Sequence[int], fingerprint: Optional[int]
+    ) -> Tuple[int, int]:
+        if fingerprint is None:
+            fingerprint = team_fingerprint(student_ids)
+        return id(team_shell), fingerprint
+
+    def __len__(self) -> int:
+        return len(self._satisfactions)
+
+
+def _same_students(members: FrozenSet[int], student_ids: Sequence[int]) -> bool:
+    # a team never has a student twice, so this is the same as comparing the sets without building one
+    return len(student_ids) == len(members) and all(
+        student_id in members for student_id in student_ids
+    )
+
+
+class CompiledRoster(dict):
+    """
+    A student dict (student id -> Student) that is compiled once at the start of a priority algorithm run.
+
+    On top of behaving exactly like the student dicts used throughout the priority algorithm, it holds array
+        representations of the students that priorities use to calculate their satisfaction without walking the
+        attributes of every student every time a team is scored. Students are referred to by their index in
+        self.students, which is also the order of the rows of every matrix held here.
+    """
+
+    def __init__(self, students: List[Student]):
+        super().__init__((student.id, student) for student in students)
+        self.students: List[Student] = list(students)
+        self.student_ids = np.array(
+            [student.id for student in students], dtype=np.int64
+        )
+        self.student_index: Dict[int, int] = {
+            student.id: index for index, student in enumerate(students)
+        }
+
+        # One-hot attribute matrix. Each column represents one (attribute id, value) pair, and the columns of each
+        #   attribute are contiguous so that attribute_slices[attribute_id] selects all of its values.
+        self.attribute_columns: Dict[Tuple[int, int], int] = {}
+        self.attribute_slices: Dict[int, slice] = {}
+        self.attribute_values: Dict[int, List[int]] = {}
+        self.attribute_matrix = np.zeros((0, 0), dtype=np.int64)
+        # has_attribute[attribute_id][i] is whether student i has any answer at all for that attribute
+        self.has_attribute: Dict[int, np.ndarray] = {}
+        self._compile_attributes()
+
+        # Project preferences, padded with -1 to the length of the longest preference list.
+        #   project_preferences[i][j] is the j-th project preference of student i
+        self.project_preferences = np.full(
+            (
+                len(students),
+                max([len(s.project_preferences) for s in students], default=0),
+            ),
+            -1,
+            dtype=np.int64,
+        )
+        self.has_project_preference = np.zeros_like(
+            self.project_preferences, dtype=bool
+        )
+        for index, student in enumerate(students):
+            num_preferences = len(student.project_preferences)
+            self.project_preferences[
+                index, :num_preferences
+            ] = student.project_preferences
+            self.has_project_preference[index, :num_preferences] = True
+
+        # Relationships between students in CSR form. The relationships of student i are found at
+        #   relationship_neighbors[relationship_offsets[i]:relationship_offsets[i + 1]] (the indices of the students
+        #   they have a relationship with) and the same slice of relationship_kinds (the position of each relationship's
+        #   kind in RELATIONSHIPS). relationship_sources holds the index of the student each relationship belongs to,
+        #   i.e. i for every entry in that slice.
+        #   Relationships with students outside the roster and with oneself are dropped, as they never count.
+        self.relationship_offsets = np.zeros(len(students) + 1, dtype=np.int64)
+        self.relationship_sources = np.zeros(0, dtype=np.int64)
+        self.relationship_neighbors = np.zeros(0, dtype=np.int64)
+        self.relationship_kinds = np.zeros(0, dtype=np.int64)
+        self._compile_relationships()
+
+        self._attribute_value_masks: Dict[Tuple[int, int], np.ndarray] = {}
+        self._answer_weights: Dict[int, np.ndarray] = {}
+        self._answer_weight_scales: Dict[int, int] = {}
+        self._project_preference_scores: Dict[Tuple[int, int], np.ndarray] = {}
+        self._requirements_met: Dict[Tuple, np.ndarray] = {}
+        self._requirement_matrices: Dict[Tuple, np.ndarray] = {}
+        self._satisfaction_memos: Dict[Tuple[int, ...], SatisfactionMemo] = {}
+
+    def satisfaction_memo(self, priorities: List["Priority"]) -> SatisfactionMemo:
+        """
+        The memo of team satisfactions for the given priorities, shared by every team set scored with this roster
+        """
+        key = tuple(id(priority) for priority in priorities)
+        if key not in self._satisfaction_memos:
+            self._satisfaction_memos[key] = SatisfactionMemo(tuple(priorities))
+        return self._satisfaction_memos[key]
+
+    def indices_of(self, student_ids: Iterable[int]) -> np.ndarray:
+        return np.fromiter(
+            (self.student_index[student_id] for student_id in student_ids),
+            dtype=np.int64,
+        )
+
+    def relationship_counts(self, indices: np.ndarray) -> np.ndarray:
+        """
+        How many of the relationships students at the given indices have with each other are of each kind in
+            RELATIONSHIPS
+        """
+        return self.relationship_counts_between(indices, indices)
+
+    def relationship_counts_between(
+        self, from_indices: np.ndarray, to_indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        How many of the relationships that students at from_indices have with students at to_indices are of each kind
+            in RELATIONSHIPS.
+        The change in a team's relationship counts when student i joins it is
+            relationship_counts_between([i], team) + relationship_counts_between(team, [i])
+        """
+        from_indices = np.asarray(from_indices, dtype=np.int64)
+        starts = self.relationship_offsets[from_indices]
+        lengths = self.relationship_offsets[from_indices + 1] - starts
+        # positions of every relationship of the from_indices students, in order
+        relationships = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        relationships += np.arange(len(relationships))
+
+        # only the relationships of the from_indices students are looked at, so this takes time in proportion to how
+        #   many relationships they have rather than to the size of the roster
+        targets = set(np.asarray(to_indices, dtype=np.int64).tolist())
+        is_target = [
+            neighbor in targets
+            for neighbor in self.relationship_neighbors[relationships].tolist()
+        ]
+        return np.bincount(
+            self.relationship_kinds[relationships][is_target],
+            minlength=len(RELATIONSHIPS),
+        )
+
+    def attribute_submatrix(self, attribute_id: int) -> np.ndarray:
+        """
+        The one-hot (students x values) matrix of a single attribute, with columns ordered as in attribute_values
+        """
+        return self.attribute_matrix[
+            :, self.attribute_slices.get(attribute_id, slice(0, 0))
+        ]
+
+    def students_with_attribute(self, attribute_id: int) -> np.ndarray:
+        """
+        Whether each student has any answer at all for the given attribute
+        """
+        if attribute_id not in self.has_attribute:
+            return np.zeros(len(self.students), dtype=bool)
+        return self.has_attribute[attribute_id]
+
+    def attribute_value_mask(self, attribute_id: int, value: int) -> np.ndarray:
+        """
+        Whether each student has the given value for the given attribute
+        """
+        key = (attribute_id, value)
+        if key not in self._attribute_value_masks:
+            column = self.attribute_columns.get(key)
+            if column is None:
+                mask = np.zeros(len(self.students), dtype=bool)
+            else:
+                mask = self.attribute_matrix[:, column].astype(bool)
+            self._attribute_value_masks[key] = mask
+        return self._attribute_value_masks[key]
+
+    def answer_weights(self, attribute_id: int) -> np.ndarray:
+        """
+        (students x values) integer matrix of how much each student contributes to the frequency of each answer, as
+            counted by the blau index, in units of 1 / answer_weight_scale(). Students with multiple answers
+            contribute a fraction to each of their answers.
+        """
+        if attribute_id not in self._answer_weights:
+            values = self.attribute_values.get(attribute_id, [])
+            column_of = {value: column for column, value in enumerate(values)}
+            answer_sets = [
+                student.attributes.get(attribute_id, []) for student in self.students
+            ]
+            scale = get_answer_weight_scale(answer_sets)
+            weights = np.zeros((len(self.students), len(values)), dtype=np.int64)
+            for index, answer_set in enumerate(answer_sets):
+                weight = get_answer_weight(answer_set, scale)
+                for answer in answer_set:
+                    weights[index, column_of[answer]] += weight
+            self._answer_weights[attribute_id] = weights
+            self._answer_weight_scales[attribute_id] = scale
+        return self._answer_weights[attribute_id]
+
+    def answer_weight_scale(self, attribute_id: int) -> int:
+        """
+        What the weights in answer_weights() are multiples of, so that a student's weight for each answer is
+            answer_weights()[student][answer] / answer_weight_scale()
+        """
+        self.answer_weights(attribute_id)
+        return self._answer_weight_scales[attribute_id]
+
+    def project_preference_scores(
+        self, project_id: int, max_project_preferences: int
+    ) -> np.ndarray:
+        """
+        How much each student wants to work on the given project. A student's first choice scores
+            max_project_preferences, their second choice one less, and so on.
+        """
+        key = (project_id, max_project_preferences)
+        if key not in self._project_preference_scores:
+            matches = (self.project_preferences == project_id) & (
+                self.has_project_preference
+            )
+            rank_scores = max_project_preferences - np.arange(
+                self.project_preferences.shape[1]
+            )
+            self._project_preference_scores[key] = matches @ rank_scores
+        return self._project_preference_scores[key]
+
+    def requirement_met(self, requirement: ProjectRequirement) -> np.ndarray:
+        """
+        Whether each student meets the given requirement (ignoring its criteria)
+        """
+        # whether a requirement is met by a student does not depend on its criteria, so requirements that only
+        #   differ in their criteria can share a mask
+        key = (requirement.attribute, requirement.operator, requirement.value)
+        if key not in self._requirements_met:
+            self._requirements_met[key] = np.array(
+                [requirement.met_by_student(student) for student in self.students],
+                dtype=bool,
+            )
+        return self._requirements_met[key]
+
+    def requirement_matrix(self, requirements: List[ProjectRequirement]) -> np.ndarray:
+        """
+        (requirements x students) boolean matrix of whether each student meets each of the given requirements
+            (ignoring their criteria). Summing its columns for the members of a team gives how many of them meet each
+            requirement.
+        """
+        key = tuple(
+            (requirement.attribute, requirement.operator, requirement.value)
+            for requirement in requirements
+        )
+        if key not in self._requirement_matrices:
+            self._requirement_matrices[key] = np.array(
+                [self.requirement_met(requirement) for requirement in requirements],
+                dtype=bool,
+            ).reshape(len(requirements), len(self.students))
+        return self._requirement_matrices[key]
+
+    def _compile_attributes(self):
+        values_by_attribute: Dict[int, set] = {}
+        for student in self.students:
+            for attribute_id, values in student.attributes.items():
+                values_by_attribute.setdefault(attribute_id, set()).update(values)
+
+        num_columns = 0
+        for attribute_id in sorted(values_by_attribute):
+            values = sorted(values_by_attribute[attribute_id])
+            self.attribute_values[attribute_id] = values
+            self.attribute_slices[attribute_id] = slice(
+                num_columns, num_columns + len(values)
+            )
+            for value in values:
+                self.attribute_columns[(attribute_id, value)] = num_columns
+                num_columns += 1
+
+        self.attribute_matrix = np.zeros(
+            (len(self.students), num_columns), dtype=np.int64
+        )
+        for attribute_id in values_by_attribute:
+            self.has_attribute[attribute_id] = np.zeros(len(self.students), dtype=bool)
+        for index, student in enumerate(self.students):
+            for attribute_id, values in student.attributes.items():
+                self.has_attribute[attribute_id][index] = True
+                for value in values:
+                    self.attribute_matrix[
+                        index, self.attribute_columns[(attribute_id, value)]
+                    ] = 1
+
+    def _compile_relationships(self):
+        sources, neighbors, kinds = [], [], []
+        for index, student in enumerate(self.students):
+            for relation_student_id, relationship in student.relationships.items():
+                neighbor = self.student_index.get(relation_student_id)
+                if neighbor is None or relation_student_id == student.id:
+                    continue
+                sources.append(index)
+                neighbors.append(neighbor)
+                kinds.append(RELATIONSHIPS.index(relationship))
+
+        self.relationship_sources = np.array(sources, dtype=np.int64)
+        self.relationship_neighbors = np.array(neighbors, dtype=np.int64)
+        self.relationship_kinds = np.array(kinds, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.relationship_sources, minlength=len(self.students)),
+            out=self.relationship_offsets[1:],
+        )
+
+    def __getstate__(self):
+        # memos are tied to the ids of objects in this process, so they are not sent to other processes
+        state = self.__dict__.copy()
+        state["_satisfaction_memos"] = {}
+        return state
@@ -1,10 +1,15 @@
 from math import floor
 from typing import List, Dict, TYPE_CHECKING
 
+import numpy as np
+
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
 from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
 
 if TYPE_CHECKING:
+    from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
     from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeam
 
 NUM_BUCKETS = 25
@@ -27,6 +32,48 @@ def get_priority_satisfaction(
     student_dict: Dict[int, Student],
 ) -> int:
     satisfaction_ratio = get_satisfaction_ratio(priority_teams, priority, student_dict)
+    return get_bucketed_satisfaction(satisfaction_ratio)
+
+
+def get_priority_satisfaction_array_from_team_satisfactions(
+    team_satisfactions: List[List[float]], num_priorities: int
+) -> List[int]:
+    """
+    Same as get_priority_satisfaction_array(), but uses satisfactions that have already been calculated.
+    team_satisfactions[i][j] is the satisfaction of the i-th team for the j-th priority.
+    """
+    return [
+        get_bucketed_satisfaction(
+            sum(satisfactions[priority_index] for satisfactions in team_satisfactions)
+            / len(team_satisfactions)
+        )
+        for priority_index in range(num_priorities)
+    ]
+
+
+def get_score_from_team_satisfactions(
+    team_satisfactions: List[List[float]], priorities: List[Priority]
+) -> int:
+    """
+    The score of a team set whose i-th team has the satisfactions team_satisfactions[i]
+    """
+    priority_satisfaction_array = (
+        get_priority_satisfaction_array_from_team_satisfactions(
+            team_satisfactions, len(priorities)
+        )
+    )
+    multipliers = get_multipliers(priorities)
+    return sum(
+        [
+            satisfaction * multiplier
+            for satisfaction, multiplier in zip(
+                priority_satisfaction_array, multipliers
+            )
+        ]
+    )
+
+
+def get_bucketed_satisfaction(satisfaction_ratio: float) -> int:
     if satisfaction_ratio == 0:
         return 0
     if satisfaction_ratio == 1:
@@ -43,14 +90,73 @@ def get_satisfaction_ratio(
     # returns value in [0, 1] IMPORTANT that it does this, satisfaction value relies on it
     count = 0
     for priority_team in priority_teams:
-        count += priority.satisfaction(
-            [student_dict[student_id] for student_id in priority_team.student_ids],
+        count += get_team_satisfactions(
+            priority_team.student_ids_view,
             priority_team.team_shell,
-        )
+            [priority],
+            student_dict,
+        )[0]
     return count / len(priority_teams)
 
 
+def get_team_satisfactions(
+    student_ids: List[int],
+    team_shell: TeamShell,
+    priorities: List[Priority],
+    student_dict: Dict[int, Student],
+) -> List[float]:
+    """
+    Returns how satisfied each priority is by a team with the given students.
+    When the student dict is a CompiledRoster, priorities calculate their satisfaction from its precomputed matrices,
+        and the satisfactions are remembered in its memo for the next time the same team is scored.
+    The returned list may be shared, so it must not be modified.
+    """
+    if not priorities:
+        return []
+
+    if isinstance(student_dict, CompiledRoster):
+        memo = student_dict.satisfaction_memo(priorities)
+        satisfactions = memo.get(team_shell, student_ids)
+        if satisfactions is None:
+            indices = student_dict.indices_of(student_ids)
+            satisfactions = [
+                priority.satisfaction_from_indices(indices, team_shell, student_dict)
+                for priority in priorities
+            ]
+            memo.put(team_shell, student_ids, satisfactions)
+        return satisfactions
+
+    students = [student_dict[student_id] for student_id in student_ids]
+    return [priority.satisfaction(students, team_shell) for priority in priorities]
+
+
 def get_multipliers(priorities: List[Priority]) -> List[int]:
     # with 2 buckets and [C1, C2, C3], returns [4, 2, 1]
     multipliers = [NUM_BUCKETS ** (n - 1) for n in range(1, len(priorities) + 1)]
     return multipliers[::-1]
+
+
+def get_max_score(priorities: List[Priority]) -> int:
+    """
+    The score of a team set that satisfies every priority well enough to put it in the top bucket
+    """
+    return sum(
+        (NUM_BUCKETS - 1) * multiplier for multiplier in get_multipliers(priorities)
+    )
+
+
+def get_team_satisfactions_by_assignment(
+    assignment: "PriorityAssignment",
+    priorities: List[Priority],
+    roster: CompiledRoster,
+) -> np.ndarray:
+    """
+    Scores every team of the assignment at once.
+    Returns a (teams x priorities) matrix where [i][j] is the satisfaction of the i-th team for the j-th priority.
+    """
+    satisfactions = np.zeros((assignment.num_teams, len(priorities)), dtype=float)
+    for priority_index, priority in enumerate(priorities):
+        satisfactions[:, priority_index] = priority.satisfaction_by_team(
+            assignment, roster
+        )
+    return satisfactions
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from algorithms.ai.priority_algorithm.custom_dataclasses import PriorityTeamSet
+from algorithms.ai.priority_algorithm.mutations.interfaces import Mutation
+
+
+@dataclass
+class MutationTrace:
+    # how many team sets the mutation made
+    num_team_sets: int = 0
+    # how many of them scored higher than the team set they were made from
+    num_improved: int = 0
+    # how many of them were among the team sets kept at the end of their iteration
+    num_kept: int = 0
+    # CPU seconds spent making and scoring them
+    time: float = 0.0
+
+
+@dataclass
+class PriorityAlgorithmTrace:
+    """
+    A record of how a priority algorithm search went, kept when the config's TRACE is set, to tune MAX_KEEP,
+        MAX_SPREAD and MUTATIONS by.
+
+    Mutations are grouped by class name. With NUM_WORKERS > 1 the team sets are made in other processes, so only the
+        best scores and iteration times are recorded. An IslandPriorityAlgorithm records what all of its islands did
+        (see add_island_iterations()).
+    Team scorings and memo hits count how many teams of scored team sets had their satisfactions calculated, and how
+        many had them found in the roster's memo instead. Both are 0 when the students are not in a CompiledRoster.
+    """
+
+    # the best score after each iteration, starting with the best score of the team sets the search started from
+    best_scores: List[float] = field(default_factory=list)
+    # how many seconds each iteration took
+    iteration_times: List[float] = field(default_factory=list)
+    mutations: Dict[str, MutationTrace] = field(default_factory=dict)
+    num_team_scorings: int = 0
+    num_memo_hits: int = 0
+    # the mutation that made each team set of the current iteration, by the id of the team set
+    _origins: Dict[int, str] = field(default_factory=dict, repr=False)
+
+    @property
+    def num_iterations(self) -> int:
+        return len(self.iteration_times)
+
+    def record_mutation(
+        self,
+        mutation: Mutation,
+        score: float,
+        mutated_team_sets: List[PriorityTeamSet],
+        time: float,
+    ):
+        """
+        Records that mutation made mutated_team_sets (which have been scored) from a team set scoring score, taking
+            time CPU seconds
+        """
+        name = type(mutation).__name__
+        mutation_trace = self.mutations.setdefault(name, MutationTrace())
+        mutation_trace.num_team_sets += len(mutated_team_sets)
+        mutation_trace.time += time
+        for mutated_team_set in mutated_team_sets:
+            if mutated_team_set.score > score:
+                mutation_trace.num_improved += 1
+            self._origins[id(mutated_team_set)] = name
+
+    def end_iteration(
+        self, kept_team_sets: List[PriorityTeamSet], best_score: float, time: float
+    ):
+        for team_set in kept_team_sets:
+            name = self._origins.get(id(team_set))
+            if name is not None:
+                self.mutations[name].num_kept += 1
+        self._origins = {}
+        self.best_scores.append(best_score)
+        self.iteration_times.append(time)
+
+    def add_island_iterations(
+        self, island_traces: List["PriorityAlgorithmTrace"], is_parallel: bool
+    ):
+        """
+        Records the iterations that the islands of an IslandPriorityAlgorithm ran side by side, from the trace each
+            island kept of them.
+        The best score after each iteration is the best of any island. Each iteration took as long as the slowest
+            island's when the islands ran in parallel, or as long as all of theirs together when they took turns.
+        """
+        for iteration in range(
+            max(island_trace.num_iterations for island_trace in island_traces)
+        ):
+            # islands that stopped early keep the best score they stopped at
+            best_score = max(
+                island_trace.best_scores[
+                    min(iteration + 1, len(island_trace.best_scores) - 1)
+                ]
+                for island_trace in island_traces
+            )
+            iteration_times = [
+                island_trace.iteration_times[iteration]
+                for island_trace in island_traces
+                if iteration < island_trace.num_iterations
+            ]
+            self.best_scores.append(max([best_score] + self.best_scores[-1:]))
+            self.iteration_times.append(
+                max(iteration_times) if is_parallel else sum(iteration_times)
+            )
+
+        for island_trace in island_traces:
+            for name, island_mutation_trace in island_trace.mutations.items():
+                mutation_trace = self.mutations.setdefault(name, MutationTrace())
+                mutation_trace.num_team_sets += island_mutation_trace.num_team_sets
+                mutation_trace.num_improved += island_mutation_trace.num_improved
+                mutation_trace.num_kept += island_mutation_trace.num_kept
+                mutation_trace.time += island_mutation_trace.time
+            self.num_team_scorings += island_trace.num_team_scorings
+            self.num_memo_hits += island_trace.num_memo_hits
@@ -22,6 +22,7 @@ from algorithms.ai.weight_algorithm.utility import (
     get_social_utility,
     get_preference_utility,
 )
+from algorithms.ai.weight_algorithm.utility.social_network import SocialWeights
 from algorithms.ai.weight_algorithm.weight_algorithm import WeightAlgorithm
 from algorithms.dataclasses.enums import Relationship
 from algorithms.dataclasses.student import Student
@@ -45,6 +46,10 @@ class SocialAlgorithm(ChooseAlgorithm):
         self.teams: List[TeamWithCliques] = [
             TeamWithCliques.from_team(team) for team in self.teams
         ]
+        self.social_weights: Optional[SocialWeights] = None
+
+    def prepare(self, students: List[Student]) -> None:
+        self.social_weights = SocialWeights(students)
 
     def generate(self, students: List[Student]) -> TeamSet:
         # todo: accounting for locked/pre-set teams is a whole fiesta
@@ -172,7 +177,9 @@ class SocialAlgorithm(ChooseAlgorithm):
                     team, student, self.algorithm_options.max_project_preferences
                 )
 
-        overall_utility += get_social_utility(team, student_list)
+        overall_utility += get_social_utility(
+            team, student_list, social_weights=self.social_weights
+        )
         # todo: replace with scoring function
         return overall_utility / len(student_list)
 
@@ -251,7 +258,7 @@ class SocialAlgorithm(ChooseAlgorithm):
         greatest_utility_student = None
         for student in students:
             utility = WeightAlgorithm.get_utility(
-                self.algorithm_options, smallest_team, student
+                self.algorithm_options, smallest_team, student, self.social_weights
             )
             if greatest_utility_student is None or utility > greatest_utility:
                 greatest_utility = utility
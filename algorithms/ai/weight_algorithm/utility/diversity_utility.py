@@ -16,18 +16,46 @@ def get_diversity_utility(
     temp_team_students = [s for s in team.students]
     temp_team_students.append(student)
 
+    attribute_ids = attributes_to_diversify + attributes_to_concentrate
+    return get_diversity_utility_from_blau_indices(
+        {
+            attribute_id: _blau_index(team.students, attribute_id)
+            for attribute_id in attribute_ids
+        },
+        {
+            attribute_id: _blau_index(temp_team_students, attribute_id)
+            for attribute_id in attribute_ids
+        },
+        attributes_to_diversify,
+        attributes_to_concentrate,
+    )
+
+
+def get_diversity_utility_from_blau_indices(
+    blau_indices_old: Dict[int, float],
+    blau_indices_new: Dict[int, float],
+    attributes_to_diversify: List[int],
+    attributes_to_concentrate: List[int],
+) -> float:
+    """
+    Same as get_diversity_utility(), from the blau indices of the team for each attribute before and after the
+        student is added to it
+    """
+    if not attributes_to_diversify and not attributes_to_concentrate:
+        return 0
+
     max_value_possible = len(attributes_to_diversify) + len(attributes_to_concentrate)
     min_value_possible = -max_value_possible
 
     value = 0
     for diversify_attribute_id in attributes_to_diversify:
-        bi_old = _blau_index(team.students, diversify_attribute_id)
-        bi_new = _blau_index(temp_team_students, diversify_attribute_id)
+        bi_old = blau_indices_old[diversify_attribute_id]
+        bi_new = blau_indices_new[diversify_attribute_id]
         value += bi_new - bi_old
 
     for concentrate_attribute_id in attributes_to_concentrate:
-        bi_old = 1 - _blau_index(team.students, concentrate_attribute_id)
-        bi_new = 1 - _blau_index(temp_team_students, concentrate_attribute_id)
+        bi_old = 1 - blau_indices_old[concentrate_attribute_id]
+        bi_new = 1 - blau_indices_new[concentrate_attribute_id]
         value += bi_new - bi_old
 
     # Normalize value to the range of [0, 1], then scale it
@@ -37,6 +65,38 @@ def get_diversity_utility(
     return scaled_value
 
 
+class AnswerFrequencies:
+    """
+    How often each answer to an attribute is given by a team's students (see _get_answer_frequencies()), kept up to
+        date as students are added to the team.
+    The team's blau index, with or without another student added, is found from these in O(number of answers)
+        instead of by tallying the answers of every student on the team again.
+    """
+
+    def __init__(self, attribute_id: int, students: List[Student] = None):
+        self.attribute_id = attribute_id
+        self.answer_frequencies: Dict[int, float] = {}
+        self.num_students = 0
+        for student in students or []:
+            self.add(student)
+
+    def add(self, student: Student):
+        _add_answer_frequencies(self.answer_frequencies, student, self.attribute_id)
+        self.num_students += 1
+
+    def get_blau_index(self) -> float:
+        return _blau_index_from_answer_frequencies(
+            self.answer_frequencies, self.num_students
+        )
+
+    def get_blau_index_if_added(self, student: Student) -> float:
+        answer_frequencies = dict(self.answer_frequencies)
+        _add_answer_frequencies(answer_frequencies, student, self.attribute_id)
+        return _blau_index_from_answer_frequencies(
+            answer_frequencies, self.num_students + 1
+        )
+
+
 def _scale_diversity_utility(value: float) -> float:
     return value ** (1 / 3)
 
@@ -45,9 +105,13 @@ def _blau_index(students: List[Student], attribute_id: int) -> float:
     # NOTE: A non-answer (i.e. answer=[-1]) counts as an answer option here
     #   a tally of each answer encountered, and it's frequency
     answer_frequencies = _get_answer_frequencies(students, attribute_id)
+    return _blau_index_from_answer_frequencies(answer_frequencies, len(students))
 
+
+def _blau_index_from_answer_frequencies(
+    answer_frequencies: Dict[int, float], total: int
+) -> float:
     cumulative_sum = 0
-    total = len(students)
     for frequency in answer_frequencies.values():
         cumulative_sum += (frequency / total) ** 2
     return 1 - cumulative_sum
@@ -58,17 +122,19 @@ def _get_answer_frequencies(
 ) -> Dict[int, int]:
     answer_frequencies = {}
     for student in students:
-        if attribute_id in student.attributes:
-            answer_set = student.attributes[attribute_id]
-            is_multi_answer = len(answer_set) > 1
-            num_answers = len(answer_set) if answer_set else 1
-            for answer in answer_set:
-                try:
-                    answer_frequencies[answer] += (
-                        1 / num_answers if is_multi_answer else 1
-                    )
-                except KeyError:
-                    answer_frequencies[answer] = (
-                        1 / num_answers if is_multi_answer else 1
-                    )
+        _add_answer_frequencies(answer_frequencies, student, attribute_id)
     return answer_frequencies
+
+
+def _add_answer_frequencies(
+    answer_frequencies: Dict[int, float], student: Student, attribute_id: int
+):
+    if attribute_id in student.attributes:
+        answer_set = student.attributes[attribute_id]
+        is_multi_answer = len(answer_set) > 1
+        num_answers = len(answer_set) if answer_set else 1
+        for answer in answer_set:
+            try:
+                answer_frequencies[answer] += 1 / num_answers if is_multi_answer else 1
+            except KeyError:
+                answer_frequencies[answer] = 1 / num_answers if is_multi_answer else 1
@@ -1,3 +1,6 @@
+from typing import List
+
+from algorithms.dataclasses.project import ProjectRequirement
 from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import Team
 
@@ -24,5 +27,30 @@ def get_requirement_utility(team: Team, student: Student) -> float:
     return _scale_requirement_utility(normal)
 
 
+def get_requirement_utility_from_nums_meeting_requirement(
+    requirements: List[ProjectRequirement],
+    nums_meeting_requirement: List[int],
+    num_members: int,
+) -> float:
+    """
+    Same as get_requirement_utility(), where nums_meeting_requirement[i] is how many members of the team (including
+        the student) meet its i-th requirement and num_members is the size of the team (including the student)
+    """
+    num_requirements = len(requirements)
+    if num_requirements <= 0:
+        return 1
+
+    total_requirement_satisfaction = sum(
+        [
+            req.satisfaction_by_num_members(num_meeting_requirement, num_members)
+            for req, num_meeting_requirement in zip(
+                requirements, nums_meeting_requirement
+            )
+        ]
+    )
+    normal = total_requirement_satisfaction / num_requirements
+    return _scale_requirement_utility(normal)
+
+
 def _scale_requirement_utility(value):
     return value ** (1 / 3)
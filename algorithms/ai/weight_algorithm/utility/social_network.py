@@ -1,38 +1,98 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import numpy as np
 
 from algorithms.dataclasses.enums import Relationship, Weight
 from algorithms.dataclasses.student import Student
 
 
+class SocialWeights:
+    """
+    The weights of the edges between every pair of students in the balanced social network (see SocialNetwork) of a
+        whole class, calculated once (in Algorithm.prepare()) so that the network of any team of those students is a
+        view of this matrix instead of being rebuilt from the students' relationships.
+    """
+
+    def __init__(self, students: List[Student]):
+        self.student_indices: Dict[int, int] = {
+            student.id: index for index, student in enumerate(students)
+        }
+        relationships = np.full(
+            (len(students), len(students)), Relationship.DEFAULT.value, dtype=float
+        )
+        for index, student in enumerate(students):
+            for other_id, relationship in student.relationships.items():
+                other_index = self.student_indices.get(other_id)
+                if other_index is not None:
+                    relationships[index, other_index] = relationship.value
+        self.matrix = _normalize_weight(relationships + relationships.T)
+        np.fill_diagonal(self.matrix, 0)
+
+    def indices_of(self, students: List[Student]) -> List[int]:
+        return [self.student_indices[student.id] for student in students]
+
+    def get_weights(self, students: List[Student]) -> np.ndarray:
+        """
+        The (students x students) matrix of the weights of the students' balanced social network
+        """
+        indices = self.indices_of(students)
+        return self.matrix[np.ix_(indices, indices)]
+
+
 class SocialNetwork:
     _network = {}
 
-    def __init__(self, students: List[Student], balanced=True):
+    def __init__(
+        self,
+        students: List[Student],
+        balanced=True,
+        social_weights: Optional[SocialWeights] = None,
+    ):
         """
         WARNING: Passing an unbalanced social network to SubSocialNetwork causes inconsistencies in its methods.
         The ability to do this is currently only used for testing purposes.
+
+        When the students' social weights have already been calculated, the balanced network is a view of them, and
+            is only turned into a dict if get_network() or get_weight() is used.
         """
+        self._student_ids = [student.id for student in students]
+        self._weights: Optional[np.ndarray] = None
+        if balanced and social_weights is not None:
+            self._network = None
+            self._weights = social_weights.get_weights(students)
+            return
+
         self._network = self._create_social_network(students)
         if balanced:
             self._network = self._balance_network(self._network)
 
     def get_network(self):
+        if self._network is None:
+            self._network = {
+                student_id: dict(zip(self._student_ids, weights))
+                for student_id, weights in zip(
+                    self._student_ids, self._weights.tolist()
+                )
+            }
         return self._network
 
     def get_weight(self, src: int, dest: int) -> int:
-        if src not in self._network or dest not in self._network[src]:
+        network = self.get_network()
+        if src not in network or dest not in network[src]:
             raise Exception(
                 f"An edge from Student ({src}) to Student ({dest}) could not be found in the social network"
             )
         if src == dest:
             return Relationship.DEFAULT.value
-        return self._network[src][dest]
+        return network[src][dest]
 
     def get_diameter(self):
         """
         Return the diameter of this network.
         Diameter defined in nested method.
         """
+        if self._weights is not None:
+            return _calculate_diameter(self._weights)
         return _calculate_network_diameter(self._network)
 
     def _create_social_network(self, students: List[Student]):
@@ -68,6 +128,100 @@ class SocialNetwork:
         return new_network
 
 
+class TeamShortestPaths:
+    """
+    The costs of the shortest paths between every pair of students in a team's (balanced) social network, kept up to
+        date as students are added to the team.
+
+    A shortest path from a student who is added to the team leaves them once, to some student already on the team,
+        and continues between students already on the team. So the paths to and through a new student, and with them
+        the network's diameter once the student is added, are found from the existing paths in O(k^2) instead of by
+        finding every shortest path again.
+    """
+
+    def __init__(
+        self,
+        students: List[Student] = None,
+        social_weights: Optional[SocialWeights] = None,
+    ):
+        self.social_weights = social_weights
+        self.students: List[Student] = []
+        self.distances = np.zeros((0, 0))
+        for student in students or []:
+            self.add(student)
+
+    def get_diameter(self) -> float:
+        """
+        Same as SocialNetwork(self.students).get_diameter()
+        """
+        if len(self.students) < 2:
+            return Weight.LOW_WEIGHT.value
+        return max(Weight.LOW_WEIGHT.value, float(self.distances.max()))
+
+    def get_diameter_if_added(self, student: Student) -> float:
+        """
+        The diameter of the team's social network if the student were added to the team
+        """
+        if not self.students:
+            return Weight.LOW_WEIGHT.value
+        distances_to_student = self._get_distances_to(student)
+        # paths between students already on the team may be shorter through the new student
+        distances = np.minimum(
+            self.distances,
+            distances_to_student[:, None] + distances_to_student[None, :],
+        )
+        return max(
+            Weight.LOW_WEIGHT.value,
+            float(distances.max()),
+            float(distances_to_student.max()),
+        )
+
+    def add(self, student: Student):
+        num_students = len(self.students)
+        distances = np.zeros((num_students + 1, num_students + 1))
+        if num_students:
+            distances_to_student = self._get_distances_to(student)
+            distances[:num_students, :num_students] = np.minimum(
+                self.distances,
+                distances_to_student[:, None] + distances_to_student[None, :],
+            )
+            distances[num_students, :num_students] = distances_to_student
+            distances[:num_students, num_students] = distances_to_student
+        self.students.append(student)
+        self.distances = distances
+
+    def _get_distances_to(self, student: Student) -> np.ndarray:
+        """
+        The cost of the shortest path from each student on the team to the given student, once they are added
+        """
+        if self.social_weights is not None:
+            weights = self.social_weights.matrix[
+                self.social_weights.student_indices[student.id],
+                self.social_weights.indices_of(self.students),
+            ]
+        else:
+            weights = np.array(
+                [get_balanced_weight(student, other) for other in self.students]
+            )
+        return (weights[:, None] + self.distances).min(axis=0)
+
+
+def get_balanced_weight(student: Student, other: Student) -> float:
+    """
+    The weight of the edge between two different students in a balanced social network (see SocialNetwork)
+    """
+    return _normalize_weight(
+        _get_relationship_value(student, other)
+        + _get_relationship_value(other, student)
+    )
+
+
+def _get_relationship_value(student: Student, other: Student) -> float:
+    if other.id in student.relationships:
+        return student.relationships[other.id].value
+    return Relationship.DEFAULT.value
+
+
 def _normalize_weight(combined_weight: int) -> float:
     # this is the theoretical max/min that any combined weight could be
     theo_max = 2 * Relationship.ENEMY.value
@@ -89,78 +243,35 @@ def _calculate_network_diameter(network: Dict[int, Dict[int, int]]) -> float:
         { shortest path's cost for each unique pair of student in the social network }
     """
     student_ids = list(network)
-    diameter = Weight.LOW_WEIGHT.value
-    if len(student_ids) < 2:
-        return diameter
-
-    distances = _setup_distances(student_ids)
-    visited = []  # this is used to ensure we only retrieve unique pairs of students
-    for s in student_ids:
-        visited.append(s)
-        for other in student_ids:
-            if other in visited:
-                continue
-            else:
-                path_cost = _shortest_path_cost(s, other, network, distances)
-                diameter = path_cost if path_cost > diameter else diameter
-
-    return diameter
-
-
-def _shortest_path_cost(
-    src: int,
-    dest: int,
-    network: Dict[int, Dict[int, int]],
-    distances: Dict[int, Dict[int, float]],
-) -> float:
-    """
-    Calculates and/or returns the minimum path cost to traverse from src to dest in the network graph.
-    Also populates the shortest path cost from src to every other node in the network and stores those values.
-    Implementation is specific to this case and only used in _calculate_network_diameter().
-    """
-    if distances[src][dest] < float("inf"):
-        return distances[src][dest]  # min cost has already been calculated
-
-    student_ids = list(network)
-    queue = [s for s in student_ids]
-
-    while len(queue) > 0:
-        student = _pop(queue, distances[src])
-
-        for other in student_ids:
-            if student == other:
-                continue
-
-            temp = distances[src][student] + network[student][other]
-            distances[src][other] = (
-                temp if temp < distances[src][other] else distances[src][other]
-            )
-            distances[other][src] = distances[src][other]
-
-    return distances[src][dest]
+    return _calculate_diameter(
+        np.array(
+            [[network[s][other] for other in student_ids] for s in student_ids],
+            dtype=float,
+        )
+    )
 
 
-def _setup_distances(student_ids: List[int]):
-    """
-    Set up the distances dictionary storing distances between nodes in the graph
+def _calculate_diameter(weights: np.ndarray) -> float:
     """
-    distances = {s: {other: float("inf") for other in student_ids} for s in student_ids}
-    for s in student_ids:
-        distances[s][s] = 0  # distances to themselves are initialized to 0
+    Same as _calculate_network_diameter(), for the network with the given (students x students) matrix of weights.
 
-    return distances
+    The shortest paths are found with Floyd-Warshall: each student in turn is allowed as a stop on every path, which
+        is a single array operation per student, so the k^3 work is done by NumPy rather than in Python.
+    """
+    num_students = len(weights)
+    diameter = Weight.LOW_WEIGHT.value
+    if num_students < 2:
+        return diameter
 
+    distances = np.array(weights, dtype=float)
+    np.fill_diagonal(distances, 0)
+    for student in range(num_students):
+        np.minimum(
+            distances,
+            distances[:, student, None] + distances[None, student, :],
+            out=distances,
+        )
 
-def _pop(q, dist):
-    """
-    Returns and removes from list the student id with the minimum dist as defined in the dist list.
-    """
-    min_dist_student = None
-    min_dist = float("inf")
-    for s_id in q:
-        changed = dist[s_id] < min_dist
-        min_dist = dist[s_id] if changed else min_dist
-        min_dist_student = s_id if changed else min_dist_student
-
-    q.remove(min_dist_student)
-    return min_dist_student
+    # each unique pair of students, with the path from the student that comes first
+    path_costs = distances[np.triu_indices(num_students, 1)]
+    return max(diameter, float(path_costs.max()))
@@ -1,15 +1,42 @@
-from typing import List
+from typing import List, Optional
 
-from algorithms.ai.weight_algorithm.utility.social_network import SocialNetwork
+from algorithms.ai.weight_algorithm.utility.social_network import (
+    SocialNetwork,
+    SocialWeights,
+)
 from algorithms.dataclasses.enums import Weight
 from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import Team
 
 
-def get_social_utility(team: Team, students: List[Student]) -> float:
-    diameter_old = SocialNetwork(team.students).get_diameter()
-    diameter_new = SocialNetwork(team.students + students).get_diameter()
-
+def get_social_utility(
+    team: Team,
+    students: List[Student],
+    team_diameter: Optional[float] = None,
+    social_weights: Optional[SocialWeights] = None,
+) -> float:
+    """
+    team_diameter is the diameter of the team's social network, if it is already known.
+    social_weights are the weights of the social network of every student, if they have already been calculated.
+    """
+    diameter_old = (
+        team_diameter
+        if team_diameter is not None
+        else SocialNetwork(team.students, social_weights=social_weights).get_diameter()
+    )
+    diameter_new = SocialNetwork(
+        team.students + students, social_weights=social_weights
+    ).get_diameter()
+    return get_social_utility_from_diameters(diameter_old, diameter_new)
+
+
+def get_social_utility_from_diameters(
+    diameter_old: float, diameter_new: float
+) -> float:
+    """
+    Same as get_social_utility(), from the diameters of the team's social network before and after the students are
+        added to it
+    """
     norm_value = _normalize_social_utility(diameter_old - diameter_new)
     scaled_value = _scale_social_utility(norm_value)
     return scaled_value
@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from algorithms.ai.interfaces.algorithm_options import WeightAlgorithmOptions
+from algorithms.ai.weight_algorithm.utility import get_preference_utility
+from algorithms.ai.weight_algorithm.utility.diversity_utility import (
+    AnswerFrequencies,
+    get_diversity_utility_from_blau_indices,
+)
+from algorithms.ai.weight_algorithm.utility.requirement_utility import (
+    get_requirement_utility_from_nums_meeting_requirement,
+)
+from algorithms.ai.weight_algorithm.utility.social_network import (
+    SocialWeights,
+    TeamShortestPaths,
+)
+from algorithms.ai.weight_algorithm.utility.social_utility import (
+    get_social_utility_from_diameters,
+)
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import Team
+
+
+@dataclass
+class _TeamUtilityState:
+    # the number of students on the team when this was calculated
+    size: int
+    # how many students on the team meet each of its requirements
+    nums_meeting_requirement: List[int]
+    shortest_paths: TeamShortestPaths
+    diameter: float
+    # the team's answer frequencies and blau index for each attribute to diversify or concentrate
+    answer_frequencies: Dict[int, AnswerFrequencies]
+    blau_indices: Dict[int, float]
+
+
+class UtilityCache:
+    """
+    Calculates the same utilities as WeightAlgorithm.get_utility(), without recalculating the parts that don't
+        depend on the student for every student.
+
+    What a team's utilities are calculated from before a student is added to it (e.g. its social network's diameter)
+        is kept until the team receives a student, and which of a team's requirements each student meets is kept for
+        as long as the cache is used. Teams must only change by having students added to them.
+    The shortest paths of each team's social network are extended as the team receives students, so that the
+        diameter with a student added takes O(k^2) to find (see TeamShortestPaths). In the same way, each team's
+        answer frequencies are extended, so that its blau indices with a student added take O(number of answers) to
+        find (see AnswerFrequencies).
+    """
+
+    def __init__(
+        self,
+        algorithm_options: WeightAlgorithmOptions,
+        social_weights: Optional[SocialWeights] = None,
+    ):
+        self.algorithm_options = algorithm_options
+        self.social_weights = social_weights
+        self._team_states: Dict[int, _TeamUtilityState] = {}
+        # _requirements_met[team id][student id][i] is if the student meets the i-th requirement of the team
+        self._requirements_met: Dict[int, Dict[int, List[bool]]] = {}
+
+    def get_utility(self, team: Team, student: Student) -> float:
+        if student in team.students:
+            return 0
+
+        options = self.algorithm_options
+        team_state = self._get_team_state(team)
+        requirements_met = self._get_requirements_met(team, student)
+
+        requirement_utility = (
+            get_requirement_utility_from_nums_meeting_requirement(
+                team.requirements,
+                [
+                    num_meeting_requirement + is_met
+                    for num_meeting_requirement, is_met in zip(
+                        team_state.nums_meeting_requirement, requirements_met
+                    )
+                ],
+                team.size + 1,
+            )
+            * options.requirement_weight
+        )
+        social_utility = (
+            get_social_utility_from_diameters(
+                team_state.diameter,
+                team_state.shortest_paths.get_diameter_if_added(student),
+            )
+            * options.social_weight
+        )
+        diversity_utility = (
+            get_diversity_utility_from_blau_indices(
+                team_state.blau_indices,
+                {
+                    attribute_id: frequencies.get_blau_index_if_added(student)
+                    for attribute_id, frequencies in team_state.answer_frequencies.items()
+                },
+                options.attributes_to_diversify,
+                options.attributes_to_concentrate,
+            )
+            * options.diversity_weight
+        )
+        preference_utility = (
+            get_preference_utility(team, student, options.max_project_preferences)
+            * options.preference_weight
+        )
+
+        return (
+            requirement_utility
+            + social_utility
+            + diversity_utility
+            + preference_utility
+        )
+
+    def _get_team_state(self, team: Team) -> _TeamUtilityState:
+        team_state = self._team_states.get(team.id)
+        if team_state is not None and team_state.size == team.size:
+            return team_state
+
+        # the team's shortest paths, answer frequencies and numbers meeting each requirement are extended with the
+        #   students it has received since they were found
+        if team_state is not None and _starts_with(
+            team.students, team_state.shortest_paths.students
+        ):
+            shortest_paths = team_state.shortest_paths
+            answer_frequencies = team_state.answer_frequencies
+            nums_meeting_requirement = team_state.nums_meeting_requirement
+        else:
+            shortest_paths = TeamShortestPaths(social_weights=self.social_weights)
+            answer_frequencies = {
+                attribute_id: AnswerFrequencies(attribute_id)
+                for attribute_id in self.algorithm_options.attributes_to_diversify
+                + self.algorithm_options.attributes_to_concentrate
+            }
+            nums_meeting_requirement = [0] * len(team.requirements)
+        for student in team.students[len(shortest_paths.students) :]:
+            shortest_paths.add(student)
+            for frequencies in answer_frequencies.values():
+                frequencies.add(student)
+            for i, is_met in enumerate(self._get_requirements_met(team, student)):
+                nums_meeting_requirement[i] += is_met
+
+        team_state = _TeamUtilityState(
+            size=team.size,
+            nums_meeting_requirement=nums_meeting_requirement,
+            shortest_paths=shortest_paths,
+            diameter=shortest_paths.get_diameter(),
+            answer_frequencies=answer_frequencies,
+            blau_indices={
+                attribute_id: frequencies.get_blau_index()
+                for attribute_id, frequencies in answer_frequencies.items()
+            },
+        )
+        self._team_states[team.id] = team_state
+        return team_state
+
+    def _get_requirements_met(self, team: Team, student: Student) -> List[bool]:
+        team_requirements_met = self._requirements_met.setdefault(team.id, {})
+        requirements_met = team_requirements_met.get(student.id)
+        if requirements_met is None:
+            requirements_met = [
+                requirement.met_by_student(student) for requirement in team.requirements
+            ]
+            team_requirements_met[student.id] = requirements_met
+        return requirements_met
+
+
+def _starts_with(students: List[Student], prefix: List[Student]) -> bool:
+    return len(prefix) <= len(students) and all(
+        student is other for student, other in zip(students, prefix)
+    )
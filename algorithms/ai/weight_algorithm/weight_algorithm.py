@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Tuple, Optional, cast
 
 from algorithms.ai.interfaces.algorithm import ChooseAlgorithm
@@ -5,13 +6,15 @@ from algorithms.ai.interfaces.algorithm_config import WeightAlgorithmConfig
 from algorithms.ai.interfaces.algorithm_options import (
     WeightAlgorithmOptions,
 )
-from algorithms.ai.utils import generate_with_choose
+from algorithms.ai.utils import save_students_to_team
 from algorithms.ai.weight_algorithm.utility import (
     get_requirement_utility,
     get_social_utility,
     get_diversity_utility,
     get_preference_utility,
 )
+from algorithms.ai.weight_algorithm.utility.social_network import SocialWeights
+from algorithms.ai.weight_algorithm.utility_cache import UtilityCache
 from algorithms.dataclasses.student import Student
 from algorithms.dataclasses.team import Team
 from algorithms.dataclasses.team_set import TeamSet
@@ -29,9 +32,37 @@ class WeightAlgorithm(ChooseAlgorithm):
             )
         else:
             self.algorithm_config = WeightAlgorithmConfig()
+        self.social_weights: Optional[SocialWeights] = None
+        self.utility_cache = UtilityCache(self.algorithm_options)
+
+    def prepare(self, students: List[Student]) -> None:
+        self.social_weights = SocialWeights(students)
+        self.utility_cache = UtilityCache(self.algorithm_options, self.social_weights)
 
     def generate(self, students: List[Student]) -> TeamSet:
-        return generate_with_choose(self, students, self.teams)
+        """
+        Same as generate_with_choose(), except that the available teams are kept in a heap by size (ties going to the
+            team that comes first) instead of being searched for the smallest team every time a student is added
+        """
+        team_heap = [
+            (team.size, team_index, team)
+            for team_index, team in enumerate(self.teams)
+            if self.get_available_teams([team])
+        ]
+        heapq.heapify(team_heap)
+        remaining_students = self.get_remaining_students(students)
+
+        while team_heap and remaining_students:
+            _, team_index, smallest_team = heapq.heappop(team_heap)
+            student = self.choose_student(smallest_team, remaining_students)
+            save_students_to_team(smallest_team, [student])
+            remaining_students.remove(student)
+            if self.get_available_teams([smallest_team]):
+                heapq.heappush(
+                    team_heap, (smallest_team.size, team_index, smallest_team)
+                )
+
+        return TeamSet(teams=self.teams)
 
     def choose(
         self, teams: List[Team], students: List[Student]
@@ -42,28 +73,34 @@ class WeightAlgorithm(ChooseAlgorithm):
             if smallest_team is None or team.size < smallest_team.size:
                 smallest_team = team
 
-        if not smallest_team:
+        if not smallest_team or not students:
             return None, None
 
+        return smallest_team, self.choose_student(smallest_team, students)
+
+    def choose_student(self, team: Team, students: List[Student]) -> Student:
+        """Choose the (first) student that has the highest utility for the team"""
         greatest_utility = 0
         greatest_utility_student = None
         for student in students:
-            utility = WeightAlgorithm.get_utility(
-                self.algorithm_options, smallest_team, student
-            )
+            utility = self.utility_cache.get_utility(team, student)
             if greatest_utility_student is None or utility > greatest_utility:
                 greatest_utility = utility
                 greatest_utility_student = student
 
-        return smallest_team, greatest_utility_student
+        return greatest_utility_student
 
     @staticmethod
     def get_utility(
-        algorithm_options: WeightAlgorithmOptions, team: Team, student: Student
+        algorithm_options: WeightAlgorithmOptions,
+        team: Team,
+        student: Student,
+        social_weights: Optional[SocialWeights] = None,
     ) -> float:
         """
         Get the utility for each of the four weights, requirement/social/diversity/preference.
         Then combine each of the normalized weights. Each utility is modified based on the options.
+        The social network is taken from social_weights when they are given (see Algorithm.prepare()).
         """
         if student in team.students:
             return 0
@@ -73,7 +110,8 @@ class WeightAlgorithm(ChooseAlgorithm):
             * algorithm_options.requirement_weight
         )
         social_utility = (
-            get_social_utility(team, [student]) * algorithm_options.social_weight
+            get_social_utility(team, [student], social_weights=social_weights)
+            * algorithm_options.social_weight
         )
         diversity_utility = (
             get_diversity_utility(
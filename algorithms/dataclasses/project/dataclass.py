@@ -61,7 +61,16 @@ class ProjectRequirement:
         num_members_meeting_requirement = len(
             [s for s in students if self.met_by_student(s)]
         )
+        return self.satisfaction_by_num_members(
+            num_members_meeting_requirement, len(students)
+        )
 
+    def satisfaction_by_num_members(
+        self, num_members_meeting_requirement: int, num_members: int
+    ) -> float:
+        """
+        Same as satisfaction_by_students(), when it is already known how many of the students meet the requirement
+        """
         if self.criteria == RequirementsCriteria.SOMEONE:
             return 1 if num_members_meeting_requirement > 0 else 0
 
@@ -71,7 +80,7 @@ class ProjectRequirement:
         if self.criteria == RequirementsCriteria.EVERYONE:
             if num_members_meeting_requirement == 0:
                 return 0
-            ratio = num_members_meeting_requirement / len(students)
+            ratio = num_members_meeting_requirement / num_members
             return change_range(ratio, (0, 1), (MIN_NON_ZERO_SATISFACTION, 1))
         if self.criteria == RequirementsCriteria.N_MEMBERS:
             if num_members_meeting_requirement == 0:
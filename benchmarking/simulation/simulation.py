@@ -3,10 +3,11 @@ import time
 import uuid
 from multiprocessing import Pool
 from multiprocessing.pool import ApplyResult
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from algorithms.ai.algorithm_runner import AlgorithmRunner
 from algorithms.ai.interfaces.algorithm_config import AlgorithmConfig
+from algorithms.ai.priority_algorithm.trace import PriorityAlgorithmTrace
 from algorithms.dataclasses.enums import AlgorithmType
 from algorithms.dataclasses.team_set import TeamSet
 from benchmarking.caching.simulation_cache import SimulationCache
@@ -36,6 +37,9 @@ class Simulation:
         self.config = config
         self.team_sets = []
         self.run_times = []
+        # the trace of each run in team_sets, when the algorithm keeps one. Traces aren't cached, so runs loaded from
+        #   the cache have none
+        self.traces: List[Optional[PriorityAlgorithmTrace]] = []
 
     def run(self, num_runs: int, seeds: List[int] = None) -> SimulationArtifact:
         if seeds and len(seeds) != num_runs:
@@ -49,6 +53,7 @@ class Simulation:
                 cached_team_sets, cached_run_times = cache.get_simulation_artifact()
                 self.team_sets = cached_team_sets
                 self.run_times = cached_run_times
+                self.traces = [None] * len(cached_team_sets)
                 num_completed_runs = len(cached_team_sets)
                 if len(self.team_sets) >= num_runs:
                     return self.team_sets[:num_runs], self.run_times[:num_runs]
@@ -122,9 +127,10 @@ class Simulation:
 
         # await completion of all processes, and store their results
         for process in processes:
-            batch_team_sets, batch_run_times = process.get()
+            batch_team_sets, batch_run_times, batch_traces = process.get()
             self.team_sets.extend(batch_team_sets)
             self.run_times.extend(batch_run_times)
+            self.traces.extend(batch_traces)
 
         if self.settings.cache_key:
             from benchmarking.caching.utils import combine
@@ -151,6 +157,7 @@ def run_trial_batch(
 
         batch_team_sets = []
         batch_run_times = []
+        batch_traces = []
 
         for run_index in run_indexes_for_batch:
             if seeds:
@@ -159,7 +166,7 @@ def run_trial_batch(
                 students = settings.student_provider.get()
 
             start_time = time.time()
-            team_set = runner.generate(students)
+            team_set, trace = runner.generate_with_trace(students)
             end_time = time.time()
 
             run_time = end_time - start_time
@@ -173,6 +180,7 @@ def run_trial_batch(
 
             batch_team_sets.append(team_set)
             batch_run_times.append(run_time)
+            batch_traces.append(trace)
 
             # Save result to cache. Do this inside the loop so that if the program crashes, we still have the results from the previous runs.
             if batch_cache is not None:
@@ -196,7 +204,7 @@ def run_trial_batch(
                         }
                     )
 
-        return batch_team_sets, batch_run_times
+        return batch_team_sets, batch_run_times, batch_traces
     except Exception as e:
         print(e)
-        return [], []
+        return [], [], []
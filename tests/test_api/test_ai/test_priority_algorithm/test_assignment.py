@@ -0,0 +1,74 @@
+import pickle
+import unittest
+
+from algorithms.ai.priority_algorithm.assignment import (
+    PriorityAssignment,
+    UNASSIGNED,
+)
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeamSet,
+    PriorityTeam,
+)
+from algorithms.dataclasses.team import TeamShell
+
+
+class TestPriorityAssignment(unittest.TestCase):
+    def setUp(self):
+        self.priority_team_set = PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(team_shell=TeamShell(_id=1), student_ids=[10, 11, 12]),
+                PriorityTeam(team_shell=TeamShell(_id=2), student_ids=[20, 21]),
+                PriorityTeam(team_shell=TeamShell(_id=3), student_ids=[30, 31, 32]),
+            ]
+        )
+        self.assignment = PriorityAssignment.from_priority_team_set(
+            self.priority_team_set
+        )
+
+    def test_from_priority_team_set__maps_students_to_teams(self):
+        self.assertEqual(8, self.assignment.num_students)
+        self.assertEqual(3, self.assignment.num_teams)
+        self.assertEqual(
+            [0, 0, 0, 1, 1, 2, 2, 2], self.assignment.team_indices.tolist()
+        )
+        self.assertEqual([3, 2, 3], self.assignment.team_sizes().tolist())
+
+    def test_from_priority_team_set__marks_students_without_teams(self):
+        assignment = PriorityAssignment.from_priority_team_set(
+            self.priority_team_set, student_ids=[40, 10, 11, 12, 20, 21, 30, 31, 32]
+        )
+        self.assertEqual(UNASSIGNED, assignment.team_indices[0])
+        self.assertEqual([3, 2, 3], assignment.team_sizes().tolist())
+
+    def test_to_priority_team_set__round_trips(self):
+        priority_team_set = self.assignment.to_priority_team_set()
+        for original, converted in zip(
+            self.priority_team_set.priority_teams, priority_team_set.priority_teams
+        ):
+            self.assertIs(original.team_shell, converted.team_shell)
+            self.assertEqual(original.student_ids, converted.student_ids)
+
+    def test_swap__swaps_teams_of_students(self):
+        self.assignment.swap(0, 7)
+        self.assertEqual([11, 12, 32], self.assignment.team_student_ids(0))
+        self.assertEqual([10, 30, 31], self.assignment.team_student_ids(2))
+
+    def test_move__changes_team_sizes(self):
+        self.assignment.move(0, 1)
+        self.assertEqual([2, 3, 3], self.assignment.team_sizes().tolist())
+        self.assertEqual([10, 20, 21], self.assignment.team_student_ids(1))
+
+    def test_clone__does_not_share_team_indices(self):
+        cloned_assignment = self.assignment.clone()
+        cloned_assignment.move(0, 2)
+        self.assertEqual([10, 11, 12], self.assignment.team_student_ids(0))
+        self.assertEqual([11, 12], cloned_assignment.team_student_ids(0))
+
+    def test_pickle__round_trips(self):
+        self.assignment.team_members(0)
+        unpickled_assignment = pickle.loads(pickle.dumps(self.assignment))
+        for team_index in range(self.assignment.num_teams):
+            self.assertEqual(
+                self.assignment.team_student_ids(team_index),
+                unpickled_assignment.team_student_ids(team_index),
+            )
@@ -0,0 +1,173 @@
+import unittest
+from dataclasses import dataclass
+from typing import List
+
+from schema import Schema
+
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeamSet,
+    PriorityTeam,
+)
+from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.ai.priority_algorithm.scoring import (
+    get_priority_satisfaction_array,
+    get_multipliers,
+)
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+
+
+@dataclass
+class CountingPriority(Priority):
+    """
+    A mock priority that is satisfied by teams with an even sum of student ids, and counts how often it is called
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.num_calls = 0
+
+    def satisfaction(self, students: List[Student], team_shell: TeamShell) -> float:
+        self.num_calls += 1
+        return int(sum([student.id for student in students]) % 2 == 0)
+
+    def validate(self):
+        return True
+
+    @staticmethod
+    def get_schema() -> Schema:
+        return Schema({})
+
+
+class TestPriorityTeamSet(unittest.TestCase):
+    def setUp(self):
+        self.students = [Student(_id=i) for i in range(1, 13)]
+        self.student_dict = {student.id: student for student in self.students}
+        self.priorities = [CountingPriority(), CountingPriority()]
+        self.priority_team_set = PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(
+                    team_shell=TeamShell(_id=team_id),
+                    student_ids=[
+                        _.id for _ in self.students[team_id * 3 : team_id * 3 + 3]
+                    ],
+                )
+                for team_id in range(4)
+            ]
+        )
+
+    def expected_score(self, priority_team_set: PriorityTeamSet) -> float:
+        satisfaction_array = get_priority_satisfaction_array(
+            priority_team_set.priority_teams, self.priorities, self.student_dict
+        )
+        return sum(
+            [
+                satisfaction * multiplier
+                for satisfaction, multiplier in zip(
+                    satisfaction_array, get_multipliers(self.priorities)
+                )
+            ]
+        )
+
+    def test_calculate_score__matches_scoring_every_team(self):
+        self.assertEqual(
+            self.expected_score(self.priority_team_set),
+            self.priority_team_set.calculate_score(self.priorities, self.student_dict),
+        )
+
+    def test_calculate_score__only_rescores_changed_teams(self):
+        self.priority_team_set.calculate_score(self.priorities, self.student_dict)
+        self.assertEqual([4, 4], [p.num_calls for p in self.priorities])
+
+        cloned_team_set = self.priority_team_set.clone()
+        team_1, team_2 = cloned_team_set.priority_teams[:2]
+        team_1.student_ids[0], team_2.student_ids[0] = (
+            team_2.student_ids[0],
+            team_1.student_ids[0],
+        )
+        score = cloned_team_set.calculate_score(self.priorities, self.student_dict)
+
+        self.assertEqual([6, 6], [p.num_calls for p in self.priorities])
+        self.assertEqual(self.expected_score(cloned_team_set), score)
+
+    def test_calculate_score__rescores_when_priorities_change(self):
+        self.priority_team_set.calculate_score(self.priorities, self.student_dict)
+        self.priorities.append(CountingPriority())
+        self.priority_team_set.score = None
+        self.priority_team_set.calculate_score(self.priorities, self.student_dict)
+
+        self.assertEqual([8, 8, 4], [p.num_calls for p in self.priorities])
+
+    def test_calculate_score__reuses_satisfactions_of_identical_teams(self):
+        roster = CompiledRoster(self.students)
+        self.priority_team_set.calculate_score(self.priorities, roster)
+        self.assertEqual([4, 4], [p.num_calls for p in self.priorities])
+
+        # a separate team set (not a clone) with the same teams, listing students in a different order
+        identical_team_set = PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(
+                    team_shell=priority_team.team_shell,
+                    student_ids=priority_team.student_ids[::-1],
+                )
+                for priority_team in self.priority_team_set.priority_teams
+            ]
+        )
+        self.assertEqual(
+            self.priority_team_set.calculate_score(self.priorities, roster),
+            identical_team_set.calculate_score(self.priorities, roster),
+        )
+        self.assertEqual([4, 4], [p.num_calls for p in self.priorities])
+
+    def test_clone__shares_team_shells(self):
+        cloned_team_set = self.priority_team_set.clone()
+        for priority_team, cloned_priority_team in zip(
+            self.priority_team_set.priority_teams, cloned_team_set.priority_teams
+        ):
+            self.assertIs(priority_team.team_shell, cloned_priority_team.team_shell)
+            self.assertIsNot(priority_team, cloned_priority_team)
+
+    def test_clone__modifying_clone_does_not_modify_original(self):
+        cloned_team_set = self.priority_team_set.clone()
+        cloned_team_set.priority_teams[0].student_ids.append(100)
+        cloned_team_set.priority_teams[1].student_ids.pop()
+
+        self.assertEqual(
+            [1, 2, 3], self.priority_team_set.priority_teams[0].student_ids
+        )
+        self.assertEqual(
+            [4, 5, 6], self.priority_team_set.priority_teams[1].student_ids
+        )
+        self.assertEqual([1, 2, 3, 100], cloned_team_set.priority_teams[0].student_ids)
+        self.assertEqual([4, 5], cloned_team_set.priority_teams[1].student_ids)
+
+    def test_clone__modifying_original_does_not_modify_clone(self):
+        cloned_team_set = self.priority_team_set.clone()
+        self.priority_team_set.priority_teams[0].student_ids.append(100)
+
+        self.assertEqual([1, 2, 3], cloned_team_set.priority_teams[0].student_ids)
+
+    def test_clone__reading_student_ids_view_does_not_copy(self):
+        cloned_team_set = self.priority_team_set.clone()
+        priority_team = self.priority_team_set.priority_teams[0]
+        cloned_priority_team = cloned_team_set.priority_teams[0]
+
+        self.assertEqual((1, 2, 3), cloned_priority_team.student_ids_view)
+        self.assertEqual(priority_team, cloned_priority_team)
+        self.assertIs(priority_team._student_ids, cloned_priority_team._student_ids)
+
+        cloned_priority_team.student_ids.append(100)
+        self.assertEqual((1, 2, 3, 100), cloned_priority_team.student_ids_view)
+        self.assertEqual((1, 2, 3), priority_team.student_ids_view)
+        self.assertNotEqual(priority_team, cloned_priority_team)
+
+    def test_repr__does_not_copy_or_forget_fingerprint(self):
+        cloned_team_set = self.priority_team_set.clone()
+        priority_team = self.priority_team_set.priority_teams[0]
+        cloned_priority_team = cloned_team_set.priority_teams[0]
+        fingerprint = cloned_priority_team.fingerprint
+
+        self.assertIn("student_ids=[1, 2, 3]", repr(cloned_priority_team))
+        self.assertIs(priority_team._student_ids, cloned_priority_team._student_ids)
+        self.assertEqual(fingerprint, cloned_priority_team._fingerprint)
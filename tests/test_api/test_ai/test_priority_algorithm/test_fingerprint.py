@@ -0,0 +1,60 @@
+import unittest
+
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeam,
+    PriorityTeamSet,
+)
+from algorithms.ai.priority_algorithm.fingerprint import (
+    team_fingerprint,
+    student_key,
+)
+from algorithms.dataclasses.team import TeamShell
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_team_fingerprint__students_can_be_added_and_removed(self):
+        fingerprint = team_fingerprint([1, 2, 3])
+        self.assertEqual(fingerprint, team_fingerprint([3, 1, 2]))
+        self.assertEqual(team_fingerprint([1, 2, 3, 4]), fingerprint ^ student_key(4))
+        self.assertEqual(team_fingerprint([1, 3]), fingerprint ^ student_key(2))
+
+    def test_student_key__different_for_ids_with_the_same_hash(self):
+        self.assertEqual(hash(-1), hash(-2))
+        self.assertNotEqual(student_key(-1), student_key(-2))
+        self.assertNotEqual(team_fingerprint([-1, 5]), team_fingerprint([-2, 5]))
+        self.assertEqual(hash(0), hash(2**61 - 1))
+        self.assertNotEqual(student_key(0), student_key(2**61 - 1))
+
+    def test_fingerprint__same_for_teams_swapped_between_identical_shells(self):
+        team_shells = [
+            TeamShell(_id=1, project_id=1),
+            TeamShell(_id=2, project_id=1),
+            TeamShell(_id=3, project_id=2),
+        ]
+
+        def fingerprint(*student_ids):
+            return PriorityTeamSet(
+                priority_teams=[
+                    PriorityTeam(team_shell=team_shell, student_ids=list(ids))
+                    for team_shell, ids in zip(team_shells, student_ids)
+                ]
+            ).fingerprint()
+
+        self.assertEqual(
+            fingerprint([1, 2], [3, 4], [5, 6]), fingerprint([4, 3], [1, 2], [5, 6])
+        )
+        self.assertNotEqual(
+            fingerprint([1, 2], [3, 4], [5, 6]), fingerprint([5, 6], [3, 4], [1, 2])
+        )
+        self.assertNotEqual(
+            fingerprint([1, 2], [3, 4], [5, 6]), fingerprint([1, 3], [2, 4], [5, 6])
+        )
+
+    def test_fingerprint__forgotten_when_students_change(self):
+        priority_team = PriorityTeam(team_shell=TeamShell(_id=1), student_ids=[1, 2])
+        cloned_priority_team = priority_team.clone()
+        self.assertEqual(team_fingerprint([1, 2]), cloned_priority_team.fingerprint)
+
+        cloned_priority_team.student_ids.append(3)
+        self.assertEqual(team_fingerprint([1, 2, 3]), cloned_priority_team.fingerprint)
+        self.assertEqual(team_fingerprint([1, 2]), priority_team.fingerprint)
@@ -0,0 +1,88 @@
+import unittest
+
+from algorithms.ai.priority_algorithm.greedy_start import generate_greedy_team_set
+from algorithms.ai.priority_algorithm.priority.priority import (
+    ProjectPreferencePriority,
+)
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.dataclasses.enums import PreferenceDirection
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+
+
+class TestGreedyStart(unittest.TestCase):
+    def setUp(self):
+        # students 0-5 want project 1, students 6-11 want project 2
+        self.students = [
+            Student(_id=i, project_preferences=[1 if i < 6 else 2]) for i in range(12)
+        ]
+        self.priorities = [
+            ProjectPreferencePriority(
+                direction=PreferenceDirection.INCLUDE, max_project_preferences=1
+            )
+        ]
+
+    def test_generate_greedy_team_set__fills_teams_evenly(self):
+        team_shells = [
+            TeamShell(_id=1),
+            TeamShell(_id=2, is_locked=True),
+            TeamShell(_id=3),
+            TeamShell(_id=4),
+            TeamShell(_id=5),
+            TeamShell(_id=6),
+        ]
+        team_set = generate_greedy_team_set(
+            team_shells, self.priorities, CompiledRoster(self.students), 5
+        )
+
+        self.assertEqual(0, len(team_set.priority_teams[1].student_ids))
+        self.assertEqual(
+            [3, 3, 2, 2, 2],
+            sorted(
+                [
+                    len(team.student_ids)
+                    for team in team_set.priority_teams
+                    if not team.team_shell.is_locked
+                ],
+                reverse=True,
+            ),
+        )
+        assigned = [
+            student_id
+            for team in team_set.priority_teams
+            for student_id in team.student_ids
+        ]
+        self.assertCountEqual([s.id for s in self.students], assigned)
+        for student_id in assigned:
+            self.assertIs(int, type(student_id))
+
+    def test_generate_greedy_team_set__does_not_go_above_max_team_size(self):
+        team_set = generate_greedy_team_set(
+            [TeamShell(_id=1), TeamShell(_id=2)],
+            self.priorities,
+            CompiledRoster(self.students),
+            4,
+        )
+        self.assertEqual(
+            [4, 4], [len(team.student_ids) for team in team_set.priority_teams]
+        )
+
+    def test_generate_greedy_team_set__puts_students_on_teams_they_prefer(self):
+        team_set = generate_greedy_team_set(
+            [
+                TeamShell(_id=1, project_id=1),
+                TeamShell(_id=2, project_id=2),
+                TeamShell(_id=3, project_id=1),
+                TeamShell(_id=4, project_id=2),
+            ],
+            self.priorities,
+            CompiledRoster(self.students),
+            3,
+        )
+        for team in team_set.priority_teams:
+            self.assertEqual(3, len(team.student_ids))
+            for student_id in team.student_ids:
+                self.assertEqual(
+                    [team.team_shell.project_id],
+                    self.students[student_id].project_preferences,
+                )
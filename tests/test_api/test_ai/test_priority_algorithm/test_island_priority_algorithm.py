@@ -0,0 +1,256 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from algorithms.ai.algorithm_runner import AlgorithmRunner
+from algorithms.ai.interfaces.algorithm_config import (
+    IslandPriorityAlgorithmConfig,
+    PriorityAlgorithmStartType,
+)
+from algorithms.ai.interfaces.algorithm_options import PriorityAlgorithmOptions
+from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm import island_priority_algorithm
+from algorithms.ai.priority_algorithm.island_priority_algorithm import (
+    IslandPriorityAlgorithm,
+)
+from algorithms.ai.priority_algorithm.mutations.local_max import LocalMaxMutation
+from algorithms.ai.priority_algorithm.mutations.random_swap import RandomSwapMutation
+from algorithms.ai.priority_algorithm.priority.priority import (
+    SocialPreferencePriority,
+)
+from algorithms.dataclasses.enums import AlgorithmType
+from benchmarking.data.simulated_data.mock_student_provider import (
+    MockStudentProvider,
+    MockStudentProviderSettings,
+)
+
+
+class TestIslandPriorityAlgorithm(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.algorithm_options = PriorityAlgorithmOptions(
+            priorities=[SocialPreferencePriority(max_num_friends=2, max_num_enemies=1)],
+            max_project_preferences=0,
+        )
+        cls.team_generation_options = TeamGenerationOptions(
+            max_team_size=4,
+            min_team_size=4,
+            total_teams=3,
+            initial_teams=[],
+        )
+
+    def setUp(self):
+        # generating puts the students on teams, so each test gets its own students
+        self.students = MockStudentProvider(
+            settings=MockStudentProviderSettings(
+                number_of_students=12,
+                number_of_friends=2,
+                number_of_enemies=1,
+            )
+        ).get()
+
+    def test_config__island_mutations_must_match_max_spread(self):
+        with self.assertRaises(ValueError):
+            IslandPriorityAlgorithmConfig(
+                MAX_SPREAD=3,
+                NUM_ISLANDS=2,
+                ISLAND_MUTATIONS=[[RandomSwapMutation(3)], [LocalMaxMutation(2)]],
+            )
+        with self.assertRaises(ValueError):
+            IslandPriorityAlgorithmConfig(
+                MAX_SPREAD=3,
+                NUM_ISLANDS=2,
+                ISLAND_MUTATIONS=[[RandomSwapMutation(3)]],
+            )
+
+    def test_migrate__best_team_sets_replace_worst_of_next_island(self):
+        algorithm = IslandPriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=IslandPriorityAlgorithmConfig(
+                MAX_KEEP=3, NUM_ISLANDS=3, NUM_MIGRANTS=1
+            ),
+        )
+        islands = [
+            [
+                (np.array([island, i]), float(island * 10 + i), island * 10 + i)
+                for i in range(3)
+            ]
+            for island in range(3)
+        ]
+        migrated_islands = algorithm.migrate(islands)
+
+        self.assertEqual(
+            [[22, 2, 1], [12, 11, 2], [22, 21, 12]],
+            [[score for _, score, _ in island] for island in migrated_islands],
+        )
+
+    def test_migrate__leaves_out_migrants_already_on_island(self):
+        algorithm = IslandPriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=IslandPriorityAlgorithmConfig(
+                MAX_KEEP=3, NUM_ISLANDS=2, NUM_MIGRANTS=2
+            ),
+        )
+        # both islands have the team set with fingerprint 1
+        islands = [
+            [(np.array([0]), 5.0, 1), (np.array([1]), 4.0, 2), (np.array([2]), 3.0, 3)],
+            [(np.array([0]), 5.0, 1), (np.array([3]), 2.0, 4), (np.array([4]), 1.0, 5)],
+        ]
+        migrated_islands = algorithm.migrate(islands)
+
+        self.assertEqual(
+            [[1, 2, 4], [1, 2, 4]],
+            [
+                [fingerprint for _, _, fingerprint in island]
+                for island in migrated_islands
+            ],
+        )
+
+    def test_generate__returns_every_student_on_a_team(self):
+        team_set = AlgorithmRunner(
+            algorithm_type=AlgorithmType.PRIORITY,
+            team_generation_options=self.team_generation_options,
+            algorithm_options=self.algorithm_options,
+            algorithm_config=IslandPriorityAlgorithmConfig(
+                MAX_KEEP=2,
+                MAX_SPREAD=3,
+                MAX_ITERATE=5,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=2,
+                ISLAND_MUTATIONS=[
+                    [RandomSwapMutation(3)],
+                    [RandomSwapMutation(2), LocalMaxMutation(1)],
+                ],
+            ),
+        ).generate(self.students)
+
+        self.assertEqual(3, len(team_set.teams))
+        self.assertEqual(
+            sorted([student.id for student in self.students]),
+            sorted(student.id for team in team_set.teams for student in team.students),
+        )
+
+    def test_generate__traces_every_island(self):
+        algorithm = IslandPriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=IslandPriorityAlgorithmConfig(
+                MAX_KEEP=2,
+                MAX_SPREAD=3,
+                MAX_ITERATE=4,
+                MAX_TIME=60,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=2,
+                ISLAND_MUTATIONS=[
+                    [RandomSwapMutation(3)],
+                    [RandomSwapMutation(2), LocalMaxMutation(1)],
+                ],
+                STOP_AT_MAX_SCORE=False,
+                TRACE=True,
+            ),
+        )
+        algorithm.generate(self.students)
+
+        trace = algorithm.trace
+        self.assertEqual(4, trace.num_iterations)
+        self.assertEqual(5, len(trace.best_scores))
+        self.assertEqual(sorted(trace.best_scores), trace.best_scores)
+        self.assertGreater(trace.mutations["RandomSwapMutation"].num_team_sets, 0)
+        self.assertGreater(trace.mutations["LocalMaxMutation"].num_team_sets, 0)
+        self.assertGreater(trace.num_team_scorings + trace.num_memo_hits, 0)
+
+    def run_islands_in_process(
+        self, algorithm_config: IslandPriorityAlgorithmConfig, num_iterations_run: int
+    ) -> mock.MagicMock:
+        """
+        Generates with islands that never improve and each run num_iterations_run iterations, returning the mock of
+            _run_island. The mutation scheduler each island returns is the number of the call that returned it.
+        """
+
+        def run_island(
+            island_index,
+            island_team_sets,
+            max_iterations,
+            end_time,
+            seed,
+            mutation_scheduler,
+        ):
+            return (
+                island_team_sets,
+                num_iterations_run,
+                run_island_mock.call_count,
+                None,
+            )
+
+        algorithm = IslandPriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=algorithm_config,
+        )
+        with mock.patch.object(
+            island_priority_algorithm,
+            "can_start_worker_processes",
+            return_value=False,
+        ), mock.patch.object(
+            island_priority_algorithm, "_run_island", side_effect=run_island
+        ) as run_island_mock:
+            algorithm.generate(self.students)
+        return run_island_mock
+
+    def test_generate__stops_once_islands_stagnate(self):
+        run_island_mock = self.run_islands_in_process(
+            IslandPriorityAlgorithmConfig(
+                MAX_ITERATE=1000,
+                MAX_TIME=60,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=1,
+                MAX_STAGNANT_ITERATIONS=3,
+                STOP_AT_MAX_SCORE=False,
+            ),
+            num_iterations_run=1,
+        )
+        # 3 migration intervals of 1 iteration each, on each of the 2 islands
+        self.assertEqual(6, run_island_mock.call_count)
+
+    def test_generate__counts_iterations_islands_ran(self):
+        run_island_mock = self.run_islands_in_process(
+            IslandPriorityAlgorithmConfig(
+                MAX_ITERATE=6,
+                MAX_TIME=60,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=4,
+                STOP_AT_MAX_SCORE=False,
+            ),
+            num_iterations_run=2,
+        )
+        # every island stops after 2 of the 4 iterations of each migration interval
+        self.assertEqual(6, run_island_mock.call_count)
+        self.assertEqual(
+            [4, 4, 4, 4, 2, 2],
+            [call.args[2] for call in run_island_mock.call_args_list],
+        )
+
+    def test_generate__keeps_each_islands_mutation_scheduler(self):
+        run_island_mock = self.run_islands_in_process(
+            IslandPriorityAlgorithmConfig(
+                MAX_ITERATE=2,
+                MAX_TIME=60,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=1,
+                STOP_AT_MAX_SCORE=False,
+            ),
+            num_iterations_run=1,
+        )
+        # each island is given the scheduler it returned in the migration interval before
+        self.assertEqual(
+            [None, None, 1, 2],
+            [call.args[5] for call in run_island_mock.call_args_list],
+        )
@@ -0,0 +1,42 @@
+import unittest
+
+from algorithms.ai.interfaces.algorithm_config import PriorityAlgorithmConfig
+from algorithms.ai.priority_algorithm.mutation_scheduler import MutationScheduler
+from algorithms.ai.priority_algorithm.mutations.local_max import LocalMaxMutation
+from algorithms.ai.priority_algorithm.mutations.random_swap import RandomSwapMutation
+from algorithms.ai.priority_algorithm.mutations.robinhood import RobinhoodMutation
+
+
+class TestMutationScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = MutationScheduler(
+            [RandomSwapMutation(4), LocalMaxMutation(3), RobinhoodMutation(3)],
+            max_spread=10,
+        )
+
+    def test_allocate__uses_num_mutations_before_anything_is_measured(self):
+        self.assertEqual([4, 3, 3], self.scheduler.allocate())
+
+    def test_allocate__favours_most_score_gain_per_cpu_time(self):
+        for _ in range(20):
+            self.scheduler.record(0, score_gain=1, cpu_time=0.001)
+            self.scheduler.record(1, score_gain=5, cpu_time=0.1)
+            self.scheduler.record(2, score_gain=0, cpu_time=0.5)
+            self.scheduler.end_iteration()
+
+        allocation = self.scheduler.allocate()
+        self.assertEqual(10, sum(allocation))
+        # every mutation keeps making at least one team set
+        self.assertEqual(1, min(allocation))
+        self.assertEqual(0, allocation.index(max(allocation)))
+
+    def test_allocate__tries_mutations_that_have_not_been_measured(self):
+        self.scheduler.record(0, score_gain=1, cpu_time=0.001)
+        allocation = self.scheduler.allocate()
+        self.assertEqual(10, sum(allocation))
+        self.assertGreater(allocation[1], 1)
+        self.assertGreater(allocation[2], 1)
+
+    def test_config__not_supported_with_multiple_workers(self):
+        with self.assertRaises(ValueError):
+            PriorityAlgorithmConfig(ADAPTIVE_MUTATIONS=True, NUM_WORKERS=2)
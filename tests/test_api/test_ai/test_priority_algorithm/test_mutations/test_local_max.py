@@ -5,6 +5,7 @@ from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
 )
+from algorithms.ai.priority_algorithm.deadline import Deadline
 from algorithms.ai.priority_algorithm.mutations.local_max import LocalMaxMutation
 from algorithms.ai.priority_algorithm.mutations.local_max_double_random import (
     LocalMaxDoubleRandomMutation,
@@ -83,6 +84,18 @@ class TestMutations(unittest.TestCase):
         )
         self.assertGreater(score_after, score_before)
 
+    def test_mutate__no_mutations_after_deadline(self):
+        mutated_team_sets = LocalMaxMutation(num_mutations=3).mutate(
+            self.priority_team_set,
+            self.priorities,
+            self.student_dict,
+            MockAlgorithm.get_team_generation_options(
+                num_students=10, num_teams=2, min_team_size=1, max_team_size=10
+            ),
+            Deadline(end_time=0),
+        )
+        self.assertEqual([], mutated_team_sets)
+
     def test_mutate_local_max_random__returns_priority_teams(self):
         priority_team_set = self.local_max_random_mutation.mutate_one(
             self.priority_team_set,
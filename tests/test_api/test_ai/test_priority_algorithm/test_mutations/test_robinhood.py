@@ -1,5 +1,7 @@
+import itertools
 import unittest
 from typing import List, Dict, Tuple
+from unittest import mock
 
 from schema import Schema
 
@@ -8,7 +10,10 @@ from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeam,
 )
 from algorithms.ai.priority_algorithm.mutations import utils
-from algorithms.ai.priority_algorithm.mutations.robinhood import RobinhoodMutation
+from algorithms.ai.priority_algorithm.mutations.robinhood import (
+    RobinhoodMutation,
+    perform_local_max_portion_of_robinhood,
+)
 from algorithms.ai.priority_algorithm.mutations.robinhood_holistic import (
     RobinhoodHolisticMutation,
 )
@@ -39,6 +44,27 @@ class StudentListPriority(Priority):
         return Schema({})
 
 
+class StudentFractionPriority(Priority):
+    """
+    A custom priority for this test.
+    It wants as much of a team as possible to be students in list, so its satisfactions are rarely exact floats
+    """
+
+    def __init__(self, students: List[int]):
+        self.students = students
+
+    def validate(self):
+        return True
+
+    def satisfaction(self, students: List[Student], team_shell: TeamShell) -> float:
+        ids = [student.id for student in students]
+        return len(set(self.students).intersection(ids)) / len(ids)
+
+    @staticmethod
+    def get_schema() -> Schema:
+        return Schema({})
+
+
 def equal_priority_team_sets(a: PriorityTeamSet, b: PriorityTeamSet) -> bool:
     """
     Checks if two priority team sets are equal
@@ -352,3 +378,82 @@ class TestMutateRobinhood(unittest.TestCase):
             get_priority_team(other_team, mutated_team_set).student_ids,
             "The other team should not change",
         )
+
+    def test_perform_local_max_portion_of_robinhood__does_not_modify_team_set(self):
+        priority_team_set, student_dict = create_new_priority_team_set(3, 9)
+        priorities = [StudentListPriority([1, 2])]
+        student_ids = [
+            list(priority_team.student_ids)
+            for priority_team in priority_team_set.priority_teams
+        ]
+        score = priority_team_set.calculate_score(priorities, student_dict)
+
+        best_team_set, best_score = perform_local_max_portion_of_robinhood(
+            priority_team_set,
+            priorities,
+            student_dict,
+            get_priority_team(1, priority_team_set),
+            get_priority_team(2, priority_team_set),
+        )
+
+        self.assertEqual(
+            student_ids,
+            [
+                priority_team.student_ids
+                for priority_team in priority_team_set.priority_teams
+            ],
+        )
+        self.assertGreater(best_score, score)
+        best_team_set.score = None
+        self.assertEqual(
+            best_score, best_team_set.calculate_score(priorities, student_dict)
+        )
+
+    def test_perform_local_max_portion_of_robinhood__scores_splits_as_calculate_score_does(
+        self,
+    ):
+        priority_team_set, student_dict = create_new_priority_team_set(10, 70)
+        # adding these teams' satisfactions in a different order than calculate_score() does changes the team set's
+        #   bucket
+        nums_listed_students = [0, 4, 7, 6, 4, 7, 5, 3, 2, 4]
+        priorities = [
+            StudentFractionPriority(
+                [
+                    team_id + 10 * i
+                    for team_id, num_listed_students in enumerate(nums_listed_students)
+                    for i in range(num_listed_students)
+                ]
+            )
+        ]
+        team_a = get_priority_team(2, priority_team_set)
+        team_b = get_priority_team(1, priority_team_set)
+        students = list(team_a.student_ids) + list(team_b.student_ids)
+
+        with mock.patch(
+            "algorithms.ai.priority_algorithm.mutations.robinhood.find_best_split",
+            return_value=None,
+        ) as find_best_split:
+            perform_local_max_portion_of_robinhood(
+                priority_team_set, priorities, student_dict, team_a, team_b
+            )
+        split_score = find_best_split.call_args.kwargs["split_score"]
+
+        for positions in itertools.combinations(
+            range(len(students)), len(team_b.student_ids)
+        ):
+            split_team_set = priority_team_set.clone()
+            split_team_set.score = None
+            split_team_a = get_priority_team(2, split_team_set)
+            split_team_b = get_priority_team(1, split_team_set)
+            (
+                split_team_b.student_ids,
+                split_team_a.student_ids,
+            ) = utils.get_split_student_ids(students, positions)
+
+            self.assertEqual(
+                split_team_set.calculate_score(priorities, student_dict),
+                split_score(
+                    split_team_b.get_satisfactions(priorities, student_dict),
+                    split_team_a.get_satisfactions(priorities, student_dict),
+                ),
+            )
@@ -2,16 +2,38 @@ import unittest
 from typing import List
 
 from algorithms.ai.priority_algorithm.priority.interfaces import Priority
-from algorithms.ai.priority_algorithm.mutations.utils import score
+from algorithms.ai.priority_algorithm.deadline import Deadline
+from algorithms.ai.priority_algorithm.mutations.utils import (
+    score,
+    find_best_split,
+    score_satisfactions,
+)
+from algorithms.ai.priority_algorithm.priority.priority import (
+    SocialPreferencePriority,
+    TokenizationPriority,
+    RequirementPriority,
+    ProjectPreferencePriority,
+)
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.dataclasses.enums import (
+    DiversifyType,
+    TokenizationConstraintDirection,
+    RequirementOperator,
+    PreferenceDirection,
+)
+from algorithms.dataclasses.project import ProjectRequirement
 from algorithms.ai.priority_algorithm.custom_dataclasses import (
     PriorityTeamSet,
     PriorityTeam,
 )
 from algorithms.dataclasses.student import Student
-from algorithms.dataclasses.team import Team
+from algorithms.dataclasses.team import Team, TeamShell
 from tests.test_api.test_ai.test_priority_algorithm.test_mutations.test_local_max import (
     EvenPriority,
 )
+from tests.test_api.test_ai.test_priority_algorithm.test_roster import (
+    create_random_students,
+)
 
 
 class TestUtil(unittest.TestCase):
@@ -49,3 +71,115 @@ class TestUtil(unittest.TestCase):
             student._id *= 2
         for team in self.priority_team_set.priority_teams:
             self.assertEqual(24, score(team, self.priorities, self.student_dict))
+
+    def test_find_best_split__same_as_trying_every_split(self):
+        students = create_random_students(20, seed=5)
+        roster = CompiledRoster(students)
+        student_dict = {student.id: student for student in students}
+        student_ids = [student.id for student in students[:12]]
+        team_1_shell = TeamShell(
+            _id=1,
+            project_id=2,
+            requirements=[
+                ProjectRequirement(
+                    attribute=1, operator=RequirementOperator.EXACTLY, value=2
+                )
+            ],
+        )
+        team_2_shell = TeamShell(_id=2, project_id=3)
+        priorities = [
+            TokenizationPriority(
+                attribute_id=1,
+                strategy=DiversifyType.DIVERSIFY,
+                direction=TokenizationConstraintDirection.MIN_OF,
+                threshold=2,
+                value=1,
+            ),
+            RequirementPriority(),
+            ProjectPreferencePriority(
+                max_project_preferences=3, direction=PreferenceDirection.EXCLUDE
+            ),
+            SocialPreferencePriority(max_num_friends=2, max_num_enemies=2),
+        ]
+
+        def split_score(team_1_satisfactions, team_2_satisfactions):
+            return max(
+                score_satisfactions(team_1_satisfactions, priorities),
+                score_satisfactions(team_2_satisfactions, priorities),
+            )
+
+        for team_1_size in [4, 6]:
+            # student_dict is searched exhaustively, and the roster with branch and bound
+            expected_split, split = [
+                find_best_split(
+                    student_ids,
+                    team_1_size,
+                    team_1_shell,
+                    team_2_shell,
+                    priorities,
+                    _,
+                    split_score,
+                    min_score=0,
+                )
+                for _ in [student_dict, roster]
+            ]
+            self.assertEqual(expected_split.positions, split.positions)
+            self.assertEqual(expected_split.score, split.score)
+
+            # nothing scores higher than the best split
+            self.assertIsNone(
+                find_best_split(
+                    student_ids,
+                    team_1_size,
+                    team_1_shell,
+                    team_2_shell,
+                    priorities,
+                    roster,
+                    split_score,
+                    min_score=split.score,
+                )
+            )
+
+    def test_find_best_split__stops_after_max_nodes(self):
+        students = create_random_students(12)
+        roster = CompiledRoster(students)
+        priorities = [SocialPreferencePriority(max_num_friends=2, max_num_enemies=2)]
+
+        # the first split is only reached after each of the 12 students has been put on a team
+        splits = [
+            find_best_split(
+                [student.id for student in students],
+                6,
+                TeamShell(_id=1),
+                TeamShell(_id=2),
+                priorities,
+                roster,
+                lambda *_: 1,
+                min_score=0,
+                max_nodes=max_nodes,
+            )
+            for max_nodes in [12, 13]
+        ]
+        self.assertIsNone(splits[0])
+        self.assertEqual(tuple(range(6)), splits[1].positions)
+
+    def test_find_best_split__stops_at_deadline(self):
+        students = create_random_students(12)
+        priorities = [SocialPreferencePriority(max_num_friends=2, max_num_enemies=2)]
+        for student_dict in [
+            CompiledRoster(students),
+            {student.id: student for student in students},
+        ]:
+            self.assertIsNone(
+                find_best_split(
+                    [student.id for student in students],
+                    6,
+                    TeamShell(_id=1),
+                    TeamShell(_id=2),
+                    priorities,
+                    student_dict,
+                    lambda *_: 1,
+                    min_score=0,
+                    deadline=Deadline(end_time=0),
+                )
+            )
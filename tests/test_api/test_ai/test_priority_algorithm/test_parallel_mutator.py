@@ -0,0 +1,115 @@
+import unittest
+
+from algorithms.ai.interfaces.algorithm_config import (
+    PriorityAlgorithmConfig,
+    PriorityAlgorithmStartType,
+)
+from algorithms.ai.interfaces.algorithm_options import PriorityAlgorithmOptions
+from algorithms.ai.interfaces.team_generation_options import TeamGenerationOptions
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeamSet,
+    PriorityTeam,
+)
+from algorithms.ai.priority_algorithm.mutations.local_max import LocalMaxMutation
+from algorithms.ai.priority_algorithm.mutations.random_swap import RandomSwapMutation
+from algorithms.ai.priority_algorithm.parallel_mutator import ParallelMutator
+from algorithms.ai.priority_algorithm.priority.priority import (
+    SocialPreferencePriority,
+)
+from algorithms.ai.priority_algorithm.priority_algorithm import PriorityAlgorithm
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
+from algorithms.dataclasses.team import TeamShell
+from benchmarking.data.simulated_data.mock_student_provider import (
+    MockStudentProvider,
+    MockStudentProviderSettings,
+)
+
+
+class TestParallelMutator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.students = MockStudentProvider(
+            settings=MockStudentProviderSettings(
+                number_of_students=12,
+                number_of_friends=2,
+                number_of_enemies=1,
+            )
+        ).get()
+        cls.roster = CompiledRoster(cls.students)
+        cls.priorities = [
+            SocialPreferencePriority(max_num_friends=2, max_num_enemies=1)
+        ]
+        cls.team_shells = [TeamShell(_id=team_id) for team_id in range(3)]
+        cls.team_set = PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(
+                    team_shell=team_shell,
+                    student_ids=[
+                        _.id for _ in cls.students[team_id * 4 : team_id * 4 + 4]
+                    ],
+                )
+                for team_id, team_shell in enumerate(cls.team_shells)
+            ]
+        )
+        cls.team_generation_options = TeamGenerationOptions(
+            max_team_size=4,
+            min_team_size=4,
+            total_teams=3,
+            initial_teams=[],
+        )
+
+    def test_mutate__returns_scored_team_sets_for_every_mutation(self):
+        with ParallelMutator(
+            num_workers=2,
+            roster=self.roster,
+            team_shells=self.team_shells,
+            priorities=self.priorities,
+            mutations=[RandomSwapMutation(3), LocalMaxMutation(2)],
+            team_generation_options=self.team_generation_options,
+        ) as parallel_mutator:
+            mutated_team_sets = parallel_mutator.mutate(
+                [self.team_set, self.team_set.clone()]
+            )
+
+        self.assertEqual(10, len(mutated_team_sets))
+        for mutated_team_set in mutated_team_sets:
+            self.assertEqual(
+                sorted([student.id for student in self.students]),
+                sorted(
+                    student_id
+                    for priority_team in mutated_team_set.priority_teams
+                    for student_id in priority_team.student_ids
+                ),
+            )
+            self.assertEqual(
+                self.team_shells,
+                [_.team_shell for _ in mutated_team_set.priority_teams],
+            )
+            score = mutated_team_set.score
+            mutated_team_set.score = None
+            self.assertAlmostEqual(
+                mutated_team_set.calculate_score(self.priorities, self.roster), score
+            )
+
+    def test_generate__with_multiple_workers(self):
+        algorithm = PriorityAlgorithm(
+            algorithm_options=PriorityAlgorithmOptions(
+                priorities=self.priorities,
+                max_project_preferences=0,
+            ),
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_KEEP=2,
+                MAX_SPREAD=3,
+                MAX_ITERATE=3,
+                START_TYPE=PriorityAlgorithmStartType.RANDOM,
+                NUM_WORKERS=2,
+            ),
+        )
+        team_set = algorithm.generate(self.students)
+
+        self.assertEqual(3, len(team_set.teams))
+        self.assertEqual(
+            sorted([student.id for student in self.students]),
+            sorted(student.id for team in team_set.teams for student in team.students),
+        )
@@ -1,4 +1,5 @@
 import unittest
+from math import inf
 from unittest.mock import MagicMock
 from typing import List
 from unittest.mock import MagicMock
@@ -12,7 +13,11 @@ from algorithms.ai.priority_algorithm.custom_dataclasses import (
 )
 from algorithms.ai.priority_algorithm.mutations.local_max import LocalMaxMutation
 from algorithms.ai.priority_algorithm.mutations.random_swap import RandomSwapMutation
+from algorithms.ai.priority_algorithm.priority.priority import (
+    SocialPreferencePriority,
+)
 from algorithms.ai.priority_algorithm.priority_algorithm import PriorityAlgorithm
+from algorithms.ai.priority_algorithm.roster import CompiledRoster
 from algorithms.dataclasses.team import TeamShell
 from benchmarking.data.simulated_data.mock_student_provider import (
     MockStudentProvider,
@@ -118,3 +123,150 @@ class TestPriorityAlgorithm(unittest.TestCase):
         mutated_team_sets = algorithm.mutate(self.team_set)
         self.assertIsInstance(mutated_team_sets, List)
         self.assertIsInstance(mutated_team_sets[0], PriorityTeamSet)
+
+    def test_search__stops_after_max_stagnant_iterations(self):
+        random_swap = RandomSwapMutation(2)
+        # returns the team set it is given, so the score never improves
+        random_swap.mutate_one = MagicMock(side_effect=lambda team_set, *_: team_set)
+        algorithm = PriorityAlgorithm(
+            algorithm_options=PriorityAlgorithmOptions(
+                priorities=[
+                    SocialPreferencePriority(max_num_friends=1, max_num_enemies=1)
+                ],
+                max_project_preferences=0,
+            ),
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_SPREAD=2,
+                MAX_KEEP=1,
+                MAX_ITERATE=100,
+                MUTATIONS=[random_swap],
+                MAX_STAGNANT_ITERATIONS=5,
+                STOP_AT_MAX_SCORE=False,
+            ),
+        )
+        algorithm.student_dict = CompiledRoster(self.students)
+        algorithm.search([self.team_set.clone()], max_iterations=100, end_time=inf)
+
+        self.assertEqual(5 * 2, random_swap.mutate_one.call_count)
+
+    def test_search__stops_at_max_score(self):
+        random_swap = RandomSwapMutation(2)
+        random_swap.mutate_one = MagicMock(side_effect=lambda team_set, *_: team_set)
+        algorithm = PriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_SPREAD=2,
+                MAX_KEEP=1,
+                MAX_ITERATE=100,
+                MUTATIONS=[random_swap],
+                STOP_AT_MAX_SCORE=True,
+            ),
+        )
+        algorithm.student_dict = CompiledRoster(self.students)
+        # with no priorities, every team set has the max score
+        algorithm.search([self.team_set.clone()], max_iterations=100, end_time=inf)
+
+        self.assertEqual(0, random_swap.mutate_one.call_count)
+
+    def test_search__does_not_stop_at_max_score_by_default(self):
+        random_swap = RandomSwapMutation(2)
+        random_swap.mutate_one = MagicMock(side_effect=lambda team_set, *_: team_set)
+        algorithm = PriorityAlgorithm(
+            algorithm_options=self.algorithm_options,
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_SPREAD=2,
+                MAX_KEEP=1,
+                MAX_ITERATE=5,
+                MUTATIONS=[random_swap],
+            ),
+        )
+        algorithm.student_dict = CompiledRoster(self.students)
+        algorithm.search([self.team_set.clone()], max_iterations=5, end_time=inf)
+
+        self.assertEqual(5 * 2, random_swap.mutate_one.call_count)
+
+    def test_search__adaptive_mutations_make_max_spread_team_sets(self):
+        mutations = [RandomSwapMutation(3), RandomSwapMutation(1)]
+        for mutation in mutations:
+            mutation.mutate_one = MagicMock(side_effect=lambda team_set, *_: team_set)
+        algorithm = PriorityAlgorithm(
+            algorithm_options=PriorityAlgorithmOptions(
+                priorities=[
+                    SocialPreferencePriority(max_num_friends=1, max_num_enemies=1)
+                ],
+                max_project_preferences=0,
+            ),
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_SPREAD=4,
+                MAX_KEEP=1,
+                MAX_ITERATE=3,
+                MUTATIONS=mutations,
+                STOP_AT_MAX_SCORE=False,
+                ADAPTIVE_MUTATIONS=True,
+            ),
+        )
+        algorithm.student_dict = CompiledRoster(self.students)
+        algorithm.search([self.team_set.clone()], max_iterations=3, end_time=inf)
+
+        self.assertEqual(
+            3 * 4, sum(mutation.mutate_one.call_count for mutation in mutations)
+        )
+        for mutation in mutations:
+            self.assertGreaterEqual(mutation.mutate_one.call_count, 3)
+
+    def test_remove_duplicates__keeps_first_of_each_assignment(self):
+        swapped_team_set = self.team_set.clone()
+        team_1, team_2 = swapped_team_set.priority_teams
+        team_1.student_ids[0], team_2.student_ids[0] = (
+            team_2.student_ids[0],
+            team_1.student_ids[0],
+        )
+        reordered_team_set = self.team_set.clone()
+        reordered_team_set.priority_teams[0].student_ids.reverse()
+
+        team_sets = [
+            self.team_set,
+            swapped_team_set,
+            reordered_team_set,
+            swapped_team_set.clone(),
+        ]
+        self.assertEqual(
+            [self.team_set, swapped_team_set],
+            PriorityAlgorithm.remove_duplicates(team_sets),
+        )
+
+    def test_search__records_trace(self):
+        algorithm = PriorityAlgorithm(
+            algorithm_options=PriorityAlgorithmOptions(
+                priorities=[
+                    SocialPreferencePriority(max_num_friends=1, max_num_enemies=1)
+                ],
+                max_project_preferences=0,
+            ),
+            team_generation_options=self.team_generation_options,
+            algorithm_config=PriorityAlgorithmConfig(
+                MAX_SPREAD=3,
+                MAX_KEEP=1,
+                MAX_ITERATE=3,
+                MUTATIONS=[RandomSwapMutation(2), LocalMaxMutation(1)],
+                STOP_AT_MAX_SCORE=False,
+                TRACE=True,
+            ),
+        )
+        algorithm.student_dict = CompiledRoster(self.students)
+        algorithm.search([self.team_set.clone()], max_iterations=3, end_time=inf)
+
+        trace = algorithm.trace
+        self.assertEqual(3, trace.num_iterations)
+        self.assertEqual(4, len(trace.best_scores))
+        self.assertEqual(sorted(trace.best_scores), trace.best_scores)
+        self.assertEqual(6, trace.mutations["RandomSwapMutation"].num_team_sets)
+        self.assertEqual(3, trace.mutations["LocalMaxMutation"].num_team_sets)
+        self.assertLessEqual(
+            sum(mutation.num_kept for mutation in trace.mutations.values()), 3
+        )
+        self.assertGreater(trace.num_team_scorings + trace.num_memo_hits, 0)
@@ -0,0 +1,527 @@
+import itertools
+import random
+import unittest
+from fractions import Fraction
+from typing import List
+
+import numpy as np
+
+from algorithms.ai.priority_algorithm.assignment import PriorityAssignment
+from algorithms.ai.priority_algorithm.custom_dataclasses import (
+    PriorityTeam,
+    PriorityTeamSet,
+)
+from algorithms.ai.priority_algorithm.priority.interfaces import Priority
+from algorithms.ai.priority_algorithm.priority.priority import (
+    TokenizationPriority,
+    DiversityPriority,
+    ProjectPreferencePriority,
+    SocialPreferencePriority,
+    RequirementPriority,
+)
+from algorithms.ai.priority_algorithm.roster import CompiledRoster, SatisfactionMemo
+from algorithms.ai.priority_algorithm.scoring import get_team_satisfactions
+from algorithms.dataclasses.enums import (
+    DiversifyType,
+    TokenizationConstraintDirection,
+    PreferenceDirection,
+    Relationship,
+    RequirementOperator,
+    RequirementsCriteria,
+)
+from algorithms.dataclasses.project import ProjectRequirement
+from algorithms.dataclasses.student import Student
+from algorithms.dataclasses.team import TeamShell
+from benchmarking.data.simulated_data.mock_student_provider import (
+    MockStudentProvider,
+    MockStudentProviderSettings,
+)
+
+
+def create_random_students(num_students: int, seed: int = 0) -> List[Student]:
+    rng = random.Random(seed)
+    students = []
+    for student_id in range(num_students):
+        attributes = {
+            1: [rng.randint(1, 3)],
+            2: rng.sample(range(1, 8), rng.randint(1, 4)),
+        }
+        if rng.random() < 0.8:
+            attributes[3] = [rng.randint(1, 2)]
+        # includes relationships with oneself and with students that do not exist
+        relationships = {
+            rng.randint(0, num_students + 5) * 7: rng.choice(list(Relationship))
+            for _ in range(rng.randint(0, 6))
+        }
+        students.append(
+            Student(
+                _id=student_id * 7,
+                attributes=attributes,
+                relationships=relationships,
+                project_preferences=rng.sample(range(1, 6), 3),
+            )
+        )
+    return students
+
+
+class TestCompiledRoster(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.students = create_random_students(40)
+        cls.roster = CompiledRoster(cls.students)
+        rng = random.Random(1)
+        cls.teams = [rng.sample(cls.students, rng.randint(1, 6)) for _ in range(50)]
+        cls.team_shells = [TeamShell(_id=1, project_id=p) for p in range(1, 6)]
+
+    def assert_satisfaction_from_indices_matches(self, priority: Priority):
+        for team in self.teams:
+            indices = self.roster.indices_of([student.id for student in team])
+            for team_shell in self.team_shells:
+                self.assertEqual(
+                    priority.satisfaction(team, team_shell),
+                    priority.satisfaction_from_indices(
+                        indices, team_shell, self.roster
+                    ),
+                )
+
+    def assert_satisfaction_by_team_matches(self, priority: Priority):
+        rng = random.Random(2)
+        for _ in range(20):
+            # some students are left unassigned
+            team_indices = [
+                rng.randint(-1, len(self.team_shells) - 1) for _ in self.students
+            ]
+            assignment = PriorityAssignment(
+                team_shells=self.team_shells,
+                student_ids=self.roster.student_ids,
+                team_indices=np.array(team_indices, dtype=np.int32),
+            )
+            satisfactions = priority.satisfaction_by_team(assignment, self.roster)
+            self.assertEqual(len(self.team_shells), len(satisfactions))
+            for team_index, team_shell in enumerate(self.team_shells):
+                self.assertEqual(
+                    priority.satisfaction_from_indices(
+                        assignment.team_members(team_index), team_shell, self.roster
+                    ),
+                    satisfactions[team_index],
+                )
+
+    def test_init__behaves_like_student_dict(self):
+        self.assertEqual(len(self.students), len(self.roster))
+        for student in self.students:
+            self.assertIs(student, self.roster[student.id])
+
+    def test_attribute_matrix__is_one_hot(self):
+        for index, student in enumerate(self.students):
+            for attribute_id, values in self.roster.attribute_values.items():
+                row = self.roster.attribute_submatrix(attribute_id)[index]
+                self.assertEqual(
+                    [
+                        int(v in student.attributes.get(attribute_id, []))
+                        for v in values
+                    ],
+                    row.tolist(),
+                )
+
+    def test_satisfaction_from_indices__tokenization(self):
+        for value in [1, 2, 3, 4]:
+            self.assert_satisfaction_from_indices_matches(
+                TokenizationPriority(
+                    attribute_id=1,
+                    strategy=DiversifyType.DIVERSIFY,
+                    direction=TokenizationConstraintDirection.MIN_OF,
+                    threshold=2,
+                    value=value,
+                )
+            )
+            self.assert_satisfaction_from_indices_matches(
+                TokenizationPriority(
+                    attribute_id=2,
+                    strategy=DiversifyType.CONCENTRATE,
+                    direction=TokenizationConstraintDirection.MAX_OF,
+                    threshold=3,
+                    value=value,
+                )
+            )
+
+    def test_satisfaction_from_indices__diversity(self):
+        for attribute_id in [1, 2, 3]:
+            self.assert_satisfaction_from_indices_matches(
+                DiversityPriority(
+                    attribute_id=attribute_id, strategy=DiversifyType.DIVERSIFY
+                )
+            )
+
+    def test_satisfaction_from_indices__diversity_is_exact(self):
+        rng = random.Random(3)
+        for attribute_id in [1, 2, 3]:
+            priority = DiversityPriority(
+                attribute_id=attribute_id, strategy=DiversifyType.DIVERSIFY
+            )
+            for _ in range(500):
+                team = rng.sample(self.students, 5)
+                answer_frequencies = {}
+                for student in team:
+                    answer_set = student.attributes.get(attribute_id, [])
+                    for answer in answer_set:
+                        answer_frequencies[answer] = answer_frequencies.get(
+                            answer, 0
+                        ) + Fraction(1, len(answer_set))
+                expected = float(
+                    1
+                    - sum(
+                        (frequency / len(team)) ** 2
+                        for frequency in answer_frequencies.values()
+                    )
+                )
+                indices = self.roster.indices_of(
+                    [student.id for student in reversed(team)]
+                )
+                self.assertEqual(
+                    expected, priority.satisfaction(team, self.team_shells[0])
+                )
+                self.assertEqual(
+                    expected,
+                    priority.satisfaction_from_indices(
+                        indices, self.team_shells[0], self.roster
+                    ),
+                )
+
+    def test_satisfaction_from_indices__concentration(self):
+        for attribute_id in [1, 2]:
+            self.assert_satisfaction_from_indices_matches(
+                DiversityPriority(
+                    attribute_id=attribute_id,
+                    strategy=DiversifyType.CONCENTRATE,
+                    max_num_choices=4,
+                )
+            )
+
+    def test_satisfaction_from_indices__concentration_missing_attribute(self):
+        priority = DiversityPriority(
+            attribute_id=3, strategy=DiversifyType.CONCENTRATE, max_num_choices=1
+        )
+        students = [s for s in self.students if 3 not in s.attributes][:1]
+        indices = self.roster.indices_of([student.id for student in students])
+        with self.assertRaises(ValueError):
+            priority.satisfaction(students, self.team_shells[0])
+        with self.assertRaises(ValueError):
+            priority.satisfaction_from_indices(
+                indices, self.team_shells[0], self.roster
+            )
+
+    def test_satisfaction_from_indices__project_preference(self):
+        for direction in PreferenceDirection:
+            self.assert_satisfaction_from_indices_matches(
+                ProjectPreferencePriority(
+                    direction=direction, max_project_preferences=3
+                )
+            )
+
+    def test_satisfaction_by_team__tokenization(self):
+        for threshold in [1, 2, 3, 5]:
+            for value in [1, 2, 3]:
+                self.assert_satisfaction_by_team_matches(
+                    TokenizationPriority(
+                        attribute_id=2,
+                        strategy=DiversifyType.DIVERSIFY,
+                        direction=TokenizationConstraintDirection.MIN_OF,
+                        threshold=threshold,
+                        value=value,
+                    )
+                )
+                self.assert_satisfaction_by_team_matches(
+                    TokenizationPriority(
+                        attribute_id=2,
+                        strategy=DiversifyType.CONCENTRATE,
+                        direction=TokenizationConstraintDirection.MAX_OF,
+                        threshold=threshold,
+                        value=value,
+                    )
+                )
+
+    def test_satisfaction_by_team__defaults_to_scoring_each_team(self):
+        self.assert_satisfaction_by_team_matches(
+            DiversityPriority(attribute_id=2, strategy=DiversifyType.DIVERSIFY)
+        )
+
+    def test_satisfaction_from_indices__requirement(self):
+        team_shells = [
+            TeamShell(
+                _id=1,
+                requirements=[
+                    ProjectRequirement(
+                        attribute=1, operator=RequirementOperator.EXACTLY, value=2
+                    ),
+                    ProjectRequirement(
+                        attribute=2,
+                        operator=RequirementOperator.MORE_THAN,
+                        value=4,
+                        criteria=RequirementsCriteria.EVERYONE,
+                    ),
+                    ProjectRequirement(
+                        attribute=3,
+                        operator=RequirementOperator.LESS_THAN,
+                        value=2,
+                        criteria=RequirementsCriteria.N_MEMBERS,
+                        num_members_required=2,
+                    ),
+                ],
+            ),
+            TeamShell(_id=2),
+        ]
+        priority = RequirementPriority()
+        for team in self.teams:
+            indices = self.roster.indices_of([student.id for student in team])
+            for team_shell in team_shells:
+                self.assertEqual(
+                    priority.satisfaction(team, team_shell),
+                    priority.satisfaction_from_indices(
+                        indices, team_shell, self.roster
+                    ),
+                )
+
+    def test_satisfaction_from_indices__social_preference(self):
+        self.assert_satisfaction_from_indices_matches(
+            SocialPreferencePriority(max_num_friends=2, max_num_enemies=2)
+        )
+
+    def test_satisfaction_by_team__social_preference(self):
+        self.assert_satisfaction_by_team_matches(
+            SocialPreferencePriority(max_num_friends=2, max_num_enemies=2)
+        )
+
+    def test_relationship_counts_between__adding_a_student(self):
+        for team in self.teams:
+            indices = self.roster.indices_of([student.id for student in team])
+            for new_index in range(len(self.students)):
+                if new_index in indices:
+                    continue
+                self.assertEqual(
+                    self.roster.relationship_counts(
+                        np.append(indices, new_index)
+                    ).tolist(),
+                    (
+                        self.roster.relationship_counts(indices)
+                        + self.roster.relationship_counts_between([new_index], indices)
+                        + self.roster.relationship_counts_between(indices, [new_index])
+                    ).tolist(),
+                )
+
+    def test_team_state__matches_satisfaction_from_indices(self):
+        team_shell = TeamShell(
+            _id=1,
+            project_id=2,
+            requirements=[
+                ProjectRequirement(
+                    attribute=1, operator=RequirementOperator.EXACTLY, value=2
+                ),
+                ProjectRequirement(
+                    attribute=2,
+                    operator=RequirementOperator.MORE_THAN,
+                    value=4,
+                    criteria=RequirementsCriteria.N_MEMBERS,
+                    num_members_required=2,
+                ),
+            ],
+        )
+        priorities = [
+            TokenizationPriority(
+                attribute_id=1,
+                strategy=DiversifyType.DIVERSIFY,
+                direction=TokenizationConstraintDirection.MIN_OF,
+                threshold=2,
+                value=1,
+            ),
+            DiversityPriority(attribute_id=2, strategy=DiversifyType.DIVERSIFY),
+            DiversityPriority(
+                attribute_id=1, strategy=DiversifyType.CONCENTRATE, max_num_choices=1
+            ),
+            RequirementPriority(),
+            ProjectPreferencePriority(
+                max_project_preferences=3, direction=PreferenceDirection.INCLUDE
+            ),
+            SocialPreferencePriority(max_num_friends=2, max_num_enemies=2),
+        ]
+        rng = random.Random(3)
+        for priority in priorities:
+            members = rng.sample(range(len(self.students)), 5)
+            team_state = priority.team_state(np.array(members), team_shell, self.roster)
+            for _ in range(30):
+                # swap a random member of the team with a random student who is not on it
+                leaving = rng.choice(members)
+                entering = rng.choice(
+                    [i for i in range(len(self.students)) if i not in members]
+                )
+                members.remove(leaving)
+                members.append(entering)
+                team_state.remove(leaving)
+                team_state.add(entering)
+                self.assertEqual(
+                    priority.satisfaction_from_indices(
+                        np.array(members), team_shell, self.roster
+                    ),
+                    team_state.satisfaction(),
+                )
+
+    def test_team_state__is_exact_for_many_relationships(self):
+        # with many relationships on each team, summing relationship values in different orders gives different totals
+        students = MockStudentProvider(
+            MockStudentProviderSettings(
+                number_of_students=40, number_of_friends=6, number_of_enemies=6
+            )
+        ).get()
+        roster = CompiledRoster(students)
+        team_shell = self.team_shells[0]
+        priority = SocialPreferencePriority(max_num_friends=6, max_num_enemies=6)
+        rng = random.Random(5)
+        members = rng.sample(range(len(students)), 6)
+        team_state = priority.team_state(np.array(members), team_shell, roster)
+        for _ in range(500):
+            leaving = rng.choice(members)
+            entering = rng.choice([i for i in range(len(students)) if i not in members])
+            members.remove(leaving)
+            members.append(entering)
+            team_state.remove(leaving)
+            team_state.add(entering)
+            expected = priority.satisfaction([students[i] for i in members], team_shell)
+            self.assertEqual(
+                expected,
+                priority.satisfaction_from_indices(
+                    np.array(members), team_shell, roster
+                ),
+            )
+            self.assertEqual(expected, team_state.satisfaction())
+
+    def test_team_state__satisfaction_upper_bound(self):
+        team_shell = TeamShell(
+            _id=1,
+            project_id=2,
+            requirements=[
+                ProjectRequirement(
+                    attribute=1, operator=RequirementOperator.EXACTLY, value=2
+                ),
+                ProjectRequirement(
+                    attribute=3,
+                    operator=RequirementOperator.EXACTLY,
+                    value=1,
+                    criteria=RequirementsCriteria.EVERYONE,
+                ),
+            ],
+        )
+        priorities = [
+            TokenizationPriority(
+                attribute_id=1,
+                strategy=DiversifyType.CONCENTRATE,
+                direction=TokenizationConstraintDirection.MAX_OF,
+                threshold=2,
+                value=1,
+            ),
+            RequirementPriority(),
+            ProjectPreferencePriority(
+                max_project_preferences=3, direction=PreferenceDirection.INCLUDE
+            ),
+            ProjectPreferencePriority(
+                max_project_preferences=3, direction=PreferenceDirection.EXCLUDE
+            ),
+        ]
+        rng = random.Random(4)
+        for priority in priorities:
+            for _ in range(20):
+                students = rng.sample(range(len(self.students)), 10)
+                members, candidates = students[:3], np.array(students[3:])
+                team_state = priority.team_state(
+                    np.array(members), team_shell, self.roster
+                )
+                upper_bound = team_state.satisfaction_upper_bound(candidates, 3)
+                best_satisfaction = max(
+                    priority.satisfaction_from_indices(
+                        np.array(members + list(added)), team_shell, self.roster
+                    )
+                    for added in itertools.combinations(candidates, 3)
+                )
+                self.assertGreaterEqual(upper_bound + 1e-9, best_satisfaction)
+
+    def test_calculate_score__scores_stale_teams_together(self):
+        priorities = [
+            TokenizationPriority(
+                attribute_id=1,
+                strategy=DiversifyType.DIVERSIFY,
+                direction=TokenizationConstraintDirection.MIN_OF,
+                threshold=2,
+                value=1,
+            ),
+            DiversityPriority(attribute_id=2, strategy=DiversifyType.DIVERSIFY),
+        ]
+        priority_team_set = PriorityTeamSet(
+            priority_teams=[
+                PriorityTeam(
+                    team_shell=self.team_shells[team_index % len(self.team_shells)],
+                    student_ids=[student.id for student in self.students[i : i + 4]],
+                )
+                for team_index, i in enumerate(range(0, len(self.students), 4))
+            ]
+        )
+        priority_team_set.calculate_score(priorities, self.roster)
+
+        for priority_team in priority_team_set.priority_teams:
+            self.assertTrue(
+                priority_team.has_current_satisfactions(priorities, self.roster)
+            )
+            expected_satisfactions = get_team_satisfactions(
+                priority_team.student_ids,
+                priority_team.team_shell,
+                priorities,
+                self.roster,
+            )
+            for expected, actual in zip(
+                expected_satisfactions,
+                priority_team.get_satisfactions(priorities, self.roster),
+            ):
+                self.assertEqual(expected, actual)
+
+
+class TestSatisfactionMemo(unittest.TestCase):
+    def test_get__ignores_order_of_students(self):
+        memo = SatisfactionMemo(priorities=(), max_size=10)
+        team_shell = TeamShell(_id=1)
+        memo.put(team_shell, [1, 2, 3], [0.5])
+        self.assertEqual([0.5], memo.get(team_shell, [3, 1, 2]))
+        self.assertIsNone(memo.get(team_shell, [1, 2]))
+        self.assertIsNone(memo.get(TeamShell(_id=1), [1, 2, 3]))
+
+    def test_get__checks_students_of_teams_with_the_same_fingerprint(self):
+        memo = SatisfactionMemo(priorities=(), max_size=10)
+        team_shell = TeamShell(_id=1)
+        memo.put(team_shell, [1, 2, 3], [0.5], fingerprint=7)
+        self.assertEqual([0.5], memo.get(team_shell, [3, 2, 1], fingerprint=7))
+        self.assertIsNone(memo.get(team_shell, [1, 2, 4], fingerprint=7))
+        self.assertIsNone(memo.get(team_shell, [1, 2], fingerprint=7))
+        self.assertEqual(1, memo.num_hits)
+
+    def test_put__evicts_least_recently_used(self):
+        memo = SatisfactionMemo(priorities=(), max_size=2)
+        team_shell = TeamShell(_id=1)
+        memo.put(team_shell, [1], [0.1])
+        memo.put(team_shell, [2], [0.2])
+        memo.get(team_shell, [1])
+        memo.put(team_shell, [3], [0.3])
+
+        self.assertEqual(2, len(memo))
+        self.assertEqual([0.1], memo.get(team_shell, [1]))
+        self.assertIsNone(memo.get(team_shell, [2]))
+        self.assertEqual([0.3], memo.get(team_shell, [3]))
+
+    def test_satisfaction_memo__one_per_list_of_priorities(self):
+        roster = CompiledRoster(create_random_students(5))
+        priorities = [
+            DiversityPriority(attribute_id=1, strategy=DiversifyType.DIVERSIFY)
+        ]
+        self.assertIs(
+            roster.satisfaction_memo(priorities),
+            roster.satisfaction_memo(list(priorities)),
+        )
+        self.assertIsNot(
+            roster.satisfaction_memo(priorities),
+            roster.satisfaction_memo(priorities + priorities),
+        )
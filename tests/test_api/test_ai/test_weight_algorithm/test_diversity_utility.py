@@ -0,0 +1,37 @@
+import unittest
+
+from algorithms.ai.weight_algorithm.utility.diversity_utility import (
+    AnswerFrequencies,
+    _blau_index,
+)
+from algorithms.dataclasses.student import Student
+
+
+class TestAnswerFrequencies(unittest.TestCase):
+    def setUp(self):
+        self.students = [
+            Student(_id=1, attributes={1: [1]}),
+            Student(_id=2, attributes={1: [2]}),
+            Student(_id=3, attributes={1: [1, 3]}),
+            Student(_id=4, attributes={2: [1]}),
+            Student(_id=5, attributes={1: [1]}),
+        ]
+
+    def test_get_blau_index__matches_blau_index_as_students_are_added(self):
+        answer_frequencies = AnswerFrequencies(1)
+        for i, student in enumerate(self.students):
+            self.assertEqual(
+                _blau_index(self.students[: i + 1], 1),
+                answer_frequencies.get_blau_index_if_added(student),
+            )
+            answer_frequencies.add(student)
+            self.assertEqual(
+                _blau_index(self.students[: i + 1], 1),
+                answer_frequencies.get_blau_index(),
+            )
+
+    def test_get_blau_index_if_added__does_not_add_student(self):
+        answer_frequencies = AnswerFrequencies(1, self.students[:2])
+        answer_frequencies.get_blau_index_if_added(self.students[2])
+        self.assertEqual(2, answer_frequencies.num_students)
+        self.assertEqual({1: 1, 2: 1}, answer_frequencies.answer_frequencies)
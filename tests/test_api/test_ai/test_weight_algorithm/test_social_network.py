@@ -0,0 +1,66 @@
+import unittest
+
+from algorithms.ai.weight_algorithm.utility.social_network import (
+    SocialNetwork,
+    SocialWeights,
+    TeamShortestPaths,
+)
+from algorithms.dataclasses.enums import Relationship
+from algorithms.dataclasses.student import Student
+from benchmarking.data.simulated_data.mock_student_provider import (
+    MockStudentProvider,
+    MockStudentProviderSettings,
+)
+
+
+class TestSocialNetwork(unittest.TestCase):
+    def setUp(self):
+        self.students = MockStudentProvider(
+            MockStudentProviderSettings(
+                number_of_students=10,
+                number_of_friends=3,
+                number_of_enemies=2,
+            )
+        ).get()
+
+    def test_get_diameter__uses_shortest_paths(self):
+        # 1 and 3 are enemies, but both are friends with 2
+        students = [
+            Student(
+                _id=1, relationships={2: Relationship.FRIEND, 3: Relationship.ENEMY}
+            ),
+            Student(
+                _id=2, relationships={1: Relationship.FRIEND, 3: Relationship.FRIEND}
+            ),
+            Student(
+                _id=3, relationships={1: Relationship.ENEMY, 2: Relationship.FRIEND}
+            ),
+        ]
+        for social_weights in [None, SocialWeights(students)]:
+            social_network = SocialNetwork(students, social_weights=social_weights)
+            self.assertGreater(social_network.get_weight(1, 3), 2)
+            self.assertAlmostEqual(
+                social_network.get_weight(1, 2) + social_network.get_weight(2, 3),
+                social_network.get_diameter(),
+            )
+
+    def test_init__network_from_social_weights_same_as_from_relationships(self):
+        team = self.students[2:7]
+        self.assertEqual(
+            SocialNetwork(team).get_network(),
+            SocialNetwork(
+                team, social_weights=SocialWeights(self.students)
+            ).get_network(),
+        )
+
+    def test_team_shortest_paths__same_diameter_as_social_network(self):
+        students = self.students
+        for social_weights in [None, SocialWeights(students)]:
+            shortest_paths = TeamShortestPaths(social_weights=social_weights)
+            for i, student in enumerate(students):
+                diameter = SocialNetwork(students[: i + 1]).get_diameter()
+                self.assertAlmostEqual(
+                    diameter, shortest_paths.get_diameter_if_added(student)
+                )
+                shortest_paths.add(student)
+                self.assertAlmostEqual(diameter, shortest_paths.get_diameter())
@@ -0,0 +1,59 @@
+import unittest
+
+from algorithms.ai.interfaces.algorithm_options import WeightAlgorithmOptions
+from algorithms.ai.weight_algorithm.utility_cache import UtilityCache
+from algorithms.ai.weight_algorithm.weight_algorithm import WeightAlgorithm
+from algorithms.dataclasses.enums import RequirementOperator, RequirementsCriteria
+from algorithms.dataclasses.project import ProjectRequirement
+from algorithms.dataclasses.team import Team
+from benchmarking.data.simulated_data.mock_student_provider import (
+    MockStudentProvider,
+    MockStudentProviderSettings,
+)
+
+
+class TestUtilityCache(unittest.TestCase):
+    def test_get_utility__same_as_weight_algorithm_as_team_grows(self):
+        students = MockStudentProvider(
+            MockStudentProviderSettings(
+                number_of_students=12,
+                attribute_ranges={1: [1, 2, 3], 2: [1, 2]},
+                project_preference_options=[1, 2],
+                num_project_preferences_per_student=2,
+                number_of_friends=2,
+                number_of_enemies=1,
+            )
+        ).get()
+        algorithm_options = WeightAlgorithmOptions(
+            max_project_preferences=2,
+            requirement_weight=1,
+            social_weight=2,
+            diversity_weight=3,
+            preference_weight=4,
+            attributes_to_diversify=[1],
+            attributes_to_concentrate=[2],
+        )
+        team = Team(
+            _id=1,
+            project_id=1,
+            requirements=[
+                ProjectRequirement(
+                    attribute=1, operator=RequirementOperator.EXACTLY, value=2
+                ),
+                ProjectRequirement(
+                    attribute=1,
+                    operator=RequirementOperator.MORE_THAN,
+                    value=1,
+                    criteria=RequirementsCriteria.EVERYONE,
+                ),
+            ],
+        )
+        utility_cache = UtilityCache(algorithm_options)
+
+        for student in students[:5]:
+            for other in students:
+                self.assertAlmostEqual(
+                    WeightAlgorithm.get_utility(algorithm_options, team, other),
+                    utility_cache.get_utility(team, other),
+                )
+            team.add_student(student)
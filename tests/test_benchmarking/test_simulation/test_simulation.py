@@ -4,7 +4,10 @@ import unittest
 from datetime import datetime
 from os import path
 
-from algorithms.ai.interfaces.algorithm_config import PriorityAlgorithmConfig
+from algorithms.ai.interfaces.algorithm_config import (
+    PriorityAlgorithmConfig,
+    IslandPriorityAlgorithmConfig,
+)
 from algorithms.dataclasses.enums import AlgorithmType
 from algorithms.dataclasses.project import Project
 from algorithms.dataclasses.team_set import TeamSet
@@ -114,6 +117,42 @@ class TestSimulation(unittest.TestCase):
             settings=self.settings,
         ).run(num_runs=1)
 
+    def test_run__works_with_priority_algorithm_workers(self):
+        # trials run on a pool of daemonic processes, which can't start workers of their own
+        team_sets, run_times = Simulation(
+            algorithm_type=AlgorithmType.PRIORITY,
+            config=PriorityAlgorithmConfig(
+                MAX_KEEP=2,
+                MAX_SPREAD=2,
+                MAX_TIME=1,
+                MAX_ITERATE=5,
+                NUM_WORKERS=2,
+                STOP_AT_MAX_SCORE=False,
+            ),
+            settings=self.settings,
+        ).run(num_runs=2)
+
+        self.assertEqual(2, len(team_sets))
+        self.assertEqual(2, len(run_times))
+
+    def test_run__works_with_island_priority_algorithm(self):
+        team_sets, run_times = Simulation(
+            algorithm_type=AlgorithmType.PRIORITY,
+            config=IslandPriorityAlgorithmConfig(
+                MAX_KEEP=2,
+                MAX_SPREAD=2,
+                MAX_TIME=1,
+                MAX_ITERATE=4,
+                NUM_ISLANDS=2,
+                MIGRATION_INTERVAL=2,
+                STOP_AT_MAX_SCORE=False,
+            ),
+            settings=self.settings,
+        ).run(num_runs=2)
+
+        self.assertEqual(2, len(team_sets))
+        self.assertEqual(2, len(run_times))
+
     def test_run__caches_all_runs(self):
         settings = SimulationSettings(
             num_teams=2,
@@ -220,6 +259,51 @@ class TestSimulation(unittest.TestCase):
             ),
         )
 
+    def test_run__keeps_traces_aligned_with_cached_runs(self):
+        settings = SimulationSettings(
+            num_teams=2,
+            scenario=self.scenario,
+            student_provider=self.student_provider,
+            cache_key=self.test_cache_key,
+        )
+        config = PriorityAlgorithmConfig(
+            MAX_KEEP=2,
+            MAX_SPREAD=2,
+            MAX_TIME=1,
+            MAX_ITERATE=2,
+            TRACE=True,
+        )
+
+        simulation = Simulation(
+            algorithm_type=AlgorithmType.PRIORITY,
+            config=config,
+            settings=settings,
+        )
+        simulation.run(num_runs=1)
+        self.assertEqual(1, len(simulation.traces))
+        self.assertIsNotNone(simulation.traces[0])
+
+        # Add run
+        simulation = Simulation(
+            algorithm_type=AlgorithmType.PRIORITY,
+            config=config,
+            settings=settings,
+        )
+        simulation.run(num_runs=2)
+        self.assertEqual(2, len(simulation.team_sets))
+        self.assertEqual(2, len(simulation.traces))
+        self.assertIsNone(simulation.traces[0])
+        self.assertIsNotNone(simulation.traces[1])
+
+        # Run simulation again, entirely from the cache
+        simulation = Simulation(
+            algorithm_type=AlgorithmType.PRIORITY,
+            config=config,
+            settings=settings,
+        )
+        simulation.run(num_runs=2)
+        self.assertEqual([None, None], simulation.traces)
+
     def test_run__return_only_num_runs_number_of_run_outputs(self):
         settings = SimulationSettings(
             num_teams=2,